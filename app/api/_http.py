@@ -7,28 +7,124 @@ Usage:
     resp = api_post("/user/login", json={...})
     resp.raise_for_status()
     data = resp.json()
+
+All requests go through a pooled, keep-alive session so the UI thread and the
+screenshot thread reuse the same TCP/TLS connections instead of paying a new
+handshake per call. Each thread gets its own `requests.Session` (sessions are
+not guaranteed thread-safe) but they all mount one shared `HTTPAdapter`, so the
+underlying urllib3 connection pools are shared process-wide.
+
+Resilience: every call goes through a per-endpoint RetryPolicy (longest path
+prefix wins, see set_retry_policy()). Transient failures (connection errors,
+timeouts, 429/502/503/504) are retried with full-jitter exponential backoff,
+honouring Retry-After. Each endpoint also has a retry budget, so retries can't
+multiply the load on a struggling backend. POSTs are only retried when they
+carry an `idempotency_key` (sent as Idempotency-Key) or when the request
+provably never reached the server. A circuit breaker per backend opens after
+BREAKER_THRESHOLD consecutive failed calls (retries exhausted, or a 5xx/network
+error that wasn't retried): calls then fail fast with
+CircuitOpenError (a requests.ConnectionError) until a probe succeeds after
+BREAKER_RESET_SECONDS.
 """
 import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
 import requests
-from typing import Dict, Optional, Any
+from typing import Dict, FrozenSet, NamedTuple, Optional, Any, Tuple
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 from app.utils.state import AppState
+from app.api.token_manager import get_token_manager
 
 # Base URL for backend API (adjust if needed)
 API_URL = os.getenv("API_URL", "http://127.0.0.1:8000")
 DEFAULT_TIMEOUT = 20  # seconds
 
+# Connection pool sizing: number of per-host pools kept, and max keep-alive
+# connections per host. Override via env or configure_pool().
+POOL_CONNECTIONS = int(os.getenv("API_POOL_CONNECTIONS", "4"))
+POOL_MAXSIZE = int(os.getenv("API_POOL_MAXSIZE", "8"))
+
+# Retry / circuit-breaker defaults. Override via env or set_retry_policy().
+RETRY_ATTEMPTS = int(os.getenv("API_RETRY_ATTEMPTS", "3"))          # tries per call, first one included
+BREAKER_THRESHOLD = int(os.getenv("API_BREAKER_THRESHOLD", "5"))    # consecutive failures before opening
+BREAKER_RESET_SECONDS = float(os.getenv("API_BREAKER_RESET_SECONDS", "30"))
+
+_pool_lock = threading.Lock()
+_adapter: Optional[HTTPAdapter] = None
+_adapter_gen = 0  # bumped whenever the adapter is rebuilt/closed
+_local = threading.local()
+
+
+def configure_pool(pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE) -> None:
+    """
+    (Re)build the shared connection pool with the given sizes.
+    Existing keep-alive connections are closed; threads pick up the new pool
+    on their next request.
+    """
+    global _adapter, _adapter_gen
+    with _pool_lock:
+        if _adapter is not None:
+            _adapter.close()
+        _adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=False)
+        _adapter_gen += 1
+
+
+def close_pool() -> None:
+    """Close all pooled connections (call on app shutdown / logout)."""
+    global _adapter, _adapter_gen
+    with _pool_lock:
+        if _adapter is not None:
+            _adapter.close()
+        _adapter = None
+        _adapter_gen += 1
+
+
+def get_session() -> requests.Session:
+    """
+    Return the calling thread's session, bound to the shared pooled adapter.
+    Safe to call from any thread.
+    """
+    global _adapter
+    sess = getattr(_local, "session", None)
+    if sess is not None and getattr(_local, "gen", -1) == _adapter_gen:
+        return sess
+
+    with _pool_lock:
+        if _adapter is None:
+            # build lazily on first use
+            _adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, pool_block=False)
+        adapter = _adapter
+        gen = _adapter_gen
+
+    sess = requests.Session()
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    sess.headers["Connection"] = "keep-alive"
+    _local.session = sess
+    _local.gen = gen
+    return sess
+
 
 def get_auth_headers(token: Optional[str] = None) -> Dict[str, str]:
-    """Return Authorization header if token exists (prefers explicit token)."""
-    tok = token or AppState.get_access_token()
-    return {"Authorization": f"Bearer {tok}"} if tok else {}
+    """
+    Return Authorization header if token exists (prefers explicit token).
+    Without an explicit token this is AppState's prebuilt, shared dict: copy it
+    before modifying.
+    """
+    if token:
+        return {"Authorization": f"Bearer {token}"}
+    return AppState.auth_headers()
 
 
 def _handle_401_and_return(resp: Response) -> Response:
     """
-    If backend returns 401, clear stored auth so the UI can show login.
+    If backend returns 401 and the token could not be refreshed, clear stored
+    auth so the UI can show login.
     Returns the same Response for further processing by caller.
     """
     if resp.status_code == 401:
@@ -38,33 +134,284 @@ def _handle_401_and_return(resp: Response) -> Response:
     return resp
 
 
-def api_get(path: str, *, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, timeout: int = DEFAULT_TIMEOUT) -> Response:
+def _rewind_body(data: Any, files: Optional[Dict[str, Any]]) -> bool:
+    """Reset a request body so it can be sent again; False if it can't be replayed."""
+    bodies = [data] + [f[1] if isinstance(f, tuple) else f for f in (files or {}).values()]
+    for body in bodies:
+        if body is None or isinstance(body, (bytes, bytearray, memoryview, str, dict, list)):
+            continue
+        if hasattr(body, "rewind"):
+            body.rewind()
+        elif hasattr(body, "seek"):
+            body.seek(0)
+        else:
+            return False
+    return True
+
+
+def _send_authed(method: str, url: str, headers: Dict[str, str], refresh_on_401: bool, **kwargs) -> Response:
     """
-    Perform GET to API_URL + path.
-    `path` should start with '/' (e.g. '/user/me').
-    Returns requests.Response.
+    One attempt with the current auth header. The token is refreshed ahead of
+    expiry; on a 401 it is refreshed (single-flight across threads) and the
+    request replayed once with the new token.
     """
-    url = f"{API_URL}{path}"
-    h = {}
-    if headers:
-        h.update(headers)
+    if refresh_on_401:
+        get_token_manager().ensure_fresh()
+    h = dict(headers)
+    sent_token = AppState.get_access_token()
     h.update(get_auth_headers())
-    resp = requests.get(url, headers=h, params=params, timeout=timeout)
+    resp = get_session().request(method, url, headers=h, **kwargs)
+    if resp.status_code != 401 or not refresh_on_401 or not sent_token:
+        return _handle_401_and_return(resp)
+
+    new_token = get_token_manager().refresh(sent_token)
+    if not new_token:
+        # refresh rejected => auth already cleared; network trouble => keep the session
+        return resp
+    if not _rewind_body(kwargs.get("data"), kwargs.get("files")):
+        return resp
+    resp.close()
+    h.update(get_auth_headers(new_token))
+    resp = get_session().request(method, url, headers=h, **kwargs)
     return _handle_401_and_return(resp)
 
 
-def api_post(path: str, *, json: Optional[Dict[str, Any]] = None, data: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, timeout: int = DEFAULT_TIMEOUT) -> Response:
+# -------------------------
+# Retry policy, budgets, circuit breaker
+# -------------------------
+class RetryPolicy(NamedTuple):
+    attempts: int = RETRY_ATTEMPTS            # total tries, first one included
+    base_delay: float = 0.25                  # seconds; doubled per retry, full jitter
+    max_delay: float = 4.0                    # cap per wait; a longer Retry-After isn't waited out
+    retry_on: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    budget_ratio: float = 0.2                 # retry tokens earned per call
+    budget_max: float = 10.0                  # burst of retries allowed (bucket size)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending while the backend's circuit breaker is open."""
+
+
+class RetryBudget:
+    """Token bucket: each call earns `ratio` retries, each retry spends one."""
+
+    def __init__(self, ratio: float, capacity: float):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class CircuitBreaker:
     """
-    Perform POST to API_URL + path.
-    Prefer sending `json=` for JSON bodies or `files=` for multipart uploads.
-    Returns requests.Response.
+    closed -> (threshold consecutive failures) -> open -> (reset_seconds) ->
+    half-open: one probe call; success closes, failure re-opens.
     """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, reset_seconds: float = BREAKER_RESET_SECONDS,
+                 clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half-open" if self._clock() - self._opened_at >= self.reset_seconds else "open"
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_seconds - self._clock())
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = self._clock()
+            if now - self._opened_at < self.reset_seconds:
+                return False
+            # half-open: one probe at a time (a probe that never reports back expires)
+            if self._probe_at is not None and now - self._probe_at < self.reset_seconds:
+                return False
+            self._probe_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                print("[✅] Backend reachable again, circuit closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probe_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.threshold:
+                if self._opened_at is None:
+                    print(f"[⚠] Backend failing ({self._failures} in a row), circuit open for {self.reset_seconds:g}s")
+                self._opened_at = self._clock()
+                self._probe_at = None
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+_DEFAULT_POLICY = RetryPolicy()
+_policies: Dict[str, RetryPolicy] = {
+    "": _DEFAULT_POLICY,
+    "/user/login": RetryPolicy(attempts=1),      # interactive; a wrong password isn't transient
+    "/screenshots/": RetryPolicy(max_delay=8.0),
+}
+_budgets: Dict[str, RetryBudget] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_resilience_lock = threading.Lock()
+
+
+def set_retry_policy(prefix: str, policy: RetryPolicy) -> None:
+    """Use `policy` for every path starting with `prefix` (longest prefix wins)."""
+    with _resilience_lock:
+        _policies[prefix] = policy
+        _budgets.pop(prefix, None)
+
+
+def _policy_for(path: str) -> Tuple[RetryPolicy, RetryBudget]:
+    with _resilience_lock:
+        prefix = max((p for p in _policies if path.startswith(p)), key=len)
+        policy = _policies[prefix]
+        budget = _budgets.get(prefix)
+        if budget is None:
+            budget = _budgets[prefix] = RetryBudget(policy.budget_ratio, policy.budget_max)
+        return policy, budget
+
+
+def get_breaker(base_url: Optional[str] = None) -> CircuitBreaker:
+    """Circuit breaker of a backend (default: API_URL)."""
+    base_url = base_url or API_URL
+    with _resilience_lock:
+        breaker = _breakers.get(base_url)
+        if breaker is None:
+            breaker = _breakers[base_url] = CircuitBreaker()
+        return breaker
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff for retry number `attempt` (1-based)."""
+    return random.uniform(0.0, min(cap, base * (2 ** (attempt - 1))))
+
+
+def _retry_after(resp: Response) -> Optional[float]:
+    """Retry-After (delta-seconds or HTTP-date) in seconds, if present."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _never_sent(exc: Exception) -> bool:
+    """True when the request provably never reached the server (safe to retry any method)."""
+    if isinstance(exc, (requests.exceptions.ConnectTimeout, CircuitOpenError)):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _send(method: str, path: str, headers: Optional[Dict[str, str]], refresh_on_401: bool,
+          idempotency_key: Optional[str] = None, **kwargs) -> Response:
+    """Send under the endpoint's retry policy and the backend's circuit breaker."""
     url = f"{API_URL}{path}"
-    h = {}
-    if headers:
-        h.update(headers)
-    h.update(get_auth_headers())
+    policy, budget = _policy_for(path)
+    breaker = get_breaker()
+    h = dict(headers or {})
+    if idempotency_key:
+        h["Idempotency-Key"] = idempotency_key
+    replay_safe = method == "GET" or bool(idempotency_key)
+    budget.earn()
+
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            raise CircuitOpenError(f"Backend unavailable, retrying in {breaker.retry_in():.0f}s ({method} {path})")
+        attempt += 1
+        resp, error = None, None
+        delay = backoff_delay(attempt, policy.base_delay, policy.max_delay)
+        try:
+            resp = _send_authed(method, url, h, refresh_on_401, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = e
+            retryable = replay_safe or _never_sent(e)
+        else:
+            if resp.status_code < 500:
+                breaker.record_success()
+            # 429/503 mean "not processed", so even a plain POST may be re-sent
+            retryable = resp.status_code in policy.retry_on and (replay_safe or resp.status_code in (429, 503))
+            wait = _retry_after(resp)
+            if wait is not None:
+                retryable = retryable and wait <= policy.max_delay
+                delay = max(delay, wait)
+
+        if (not retryable or attempt >= policy.attempts or not budget.spend()
+                or not _rewind_body(kwargs.get("data"), kwargs.get("files"))):
+            # the breaker counts calls that failed for good, not individual attempts
+            if error is not None:
+                breaker.record_failure()
+                raise error
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            return resp
+        if resp is not None:
+            resp.close()
+        time.sleep(delay)
+
+
+def api_get(path: str, *, headers: Optional[Dict[str, str]] = None, params: Optional[Dict[str, Any]] = None, timeout: int = DEFAULT_TIMEOUT,
+            refresh_on_401: bool = True) -> Response:
+    """
+    Perform GET to API_URL + path (retried on transient failures).
+    `path` should start with '/' (e.g. '/user/me').
+    Returns requests.Response; raises CircuitOpenError while the backend is down.
+    """
+    return _send("GET", path, headers, refresh_on_401, params=params, timeout=timeout)
 
+
+def api_post(path: str, *, json: Optional[Dict[str, Any]] = None, data: Optional[Any] = None, files: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None, timeout: int = DEFAULT_TIMEOUT,
+             refresh_on_401: bool = True, idempotency_key: Optional[str] = None) -> Response:
+    """
+    Perform POST to API_URL + path.
+    Prefer sending `json=` for JSON bodies or `files=` for multipart uploads.
+    `data=` may also be a sized, read()-able stream (see app.api._multipart).
+    Pass refresh_on_401=False for endpoints where a 401 isn't about the token (login).
+    With an `idempotency_key` the POST is retried like a GET (the backend dedups
+    on the Idempotency-Key header).
+    Returns requests.Response; raises CircuitOpenError while the backend is down.
+    """
     # requests will choose appropriate content-type when files is set
-    resp = requests.post(url, json=json, data=data, files=files, headers=h, timeout=timeout)
-    return _handle_401_and_return(resp)
+    return _send("POST", path, headers, refresh_on_401, idempotency_key,
+                 json=json, data=data, files=files, timeout=timeout)
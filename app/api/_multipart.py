@@ -0,0 +1,116 @@
+# app/api/_multipart.py
+"""
+Zero-copy streaming multipart/form-data bodies.
+
+`requests` builds multipart bodies by concatenating every part into one new
+bytes object, so an upload briefly holds the image twice (or more). A
+MultipartStream instead exposes the parts as a read()-able, sized object: the
+image payload is sliced through a memoryview (or read from a file) chunk by
+chunk as the socket drains, and Content-Length is known up front so no chunked
+transfer encoding is needed.
+
+Usage:
+    body = MultipartStream(
+        fields={"captured_at": "..."},
+        files={"image": ("screenshot.jpg", jpeg_bytes_or_stream, "image/jpeg")},
+    )
+    api_post("/screenshots/upload", data=body, headers={"Content-Type": body.content_type})
+"""
+import io
+import os
+import uuid
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Union
+
+# bytes, bytearray, memoryview, or a seekable binary file object
+Payload = Union[bytes, bytearray, memoryview, BinaryIO]
+CHUNK_SIZE = 64 * 1024
+
+
+def _payload_len(payload: Payload) -> int:
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return memoryview(payload).nbytes
+    pos = payload.tell()
+    end = payload.seek(0, os.SEEK_END)
+    payload.seek(pos)
+    return end - pos
+
+
+class MultipartStream:
+    """Sized, read()-able multipart body that never joins its parts."""
+
+    def __init__(self, fields: Dict[str, Any] = None, files: Dict[str, Tuple[str, Payload, str]] = None,
+                 boundary: str = None):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        # each segment is either small header bytes or a payload (buffer / stream)
+        self._segments: List[Payload] = []
+        b = self.boundary.encode("ascii")
+
+        for name, value in (fields or {}).items():
+            self._segments.append(
+                b"--" + b + b"\r\n"
+                + f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode("utf-8")
+                + str(value).encode("utf-8") + b"\r\n"
+            )
+        for name, (filename, payload, mime) in (files or {}).items():
+            self._segments.append(
+                b"--" + b + b"\r\n"
+                + f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'.encode("utf-8")
+                + f"Content-Type: {mime}\r\n\r\n".encode("utf-8")
+            )
+            if isinstance(payload, (bytes, bytearray, memoryview)):
+                payload = memoryview(payload).cast("B")
+            self._segments.append(payload)
+            self._segments.append(b"\r\n")
+        self._segments.append(b"--" + b + b"--\r\n")
+
+        self._length = sum(_payload_len(s) for s in self._segments)
+        self._starts = [s.tell() if hasattr(s, "read") else 0 for s in self._segments]
+        self._index = 0
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to `size` bytes (one segment at most, so no joins of payload data)."""
+        if size is None or size < 0:
+            size = CHUNK_SIZE
+        while self._index < len(self._segments):
+            seg = self._segments[self._index]
+            if hasattr(seg, "read"):
+                chunk = seg.read(size)
+                if chunk:
+                    return chunk
+            else:
+                if self._offset < len(seg):
+                    chunk = seg[self._offset:self._offset + size]
+                    self._offset += len(chunk)
+                    return bytes(chunk)
+            self._index += 1
+            self._offset = 0
+        return b""
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def rewind(self) -> None:
+        """Reset to the start so the body can be sent again (e.g. on retry)."""
+        for seg, start in zip(self._segments, self._starts):
+            if hasattr(seg, "read"):
+                seg.seek(start)
+        self._index = 0
+        self._offset = 0
+
+    def getvalue(self) -> bytes:
+        """Materialize the whole body (debugging/tests only; defeats streaming)."""
+        self.rewind()
+        out = io.BytesIO()
+        for chunk in self:
+            out.write(chunk)
+        self.rewind()
+        return out.getvalue()
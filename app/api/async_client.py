@@ -0,0 +1,185 @@
+# app/api/async_client.py
+"""
+Asyncio API layer that lets several backend calls overlap.
+
+Coroutines run on one dedicated event-loop thread. Each HTTP call executes the
+existing blocking helper (auth_client / task_client / screenshot_client) on a
+bounded worker pool, so everything shares the pooled keep-alive session from
+app.api._http and the blocking functions remain the single implementation;
+concurrency is capped by a semaphore sized to the connection pool.
+
+Tasks go through sync_my_tasks(), i.e. the shared TaskSync index with its
+ETag/cursor, so a result can be handed straight to the TaskStore.
+
+Qt integration: submit() schedules a coroutine from any thread (typically the
+GUI thread) and delivers the result back on the GUI thread through a Qt signal,
+so callbacks can touch widgets directly.
+
+Usage:
+    api = get_async_api()
+    api.submit(api.load_session(), lambda res, err: ...)   # from the UI
+
+    async def work():
+        me, tasks = await asyncio.gather(api.me(), api.my_tasks())
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, Signal, QCoreApplication
+
+from app.api import _http
+from app.api.auth_client import login_user, fetch_user_profile
+from app.api.task_client import sync_my_tasks
+from app.api.screenshot_client import upload_frame
+from app.api._multipart import Payload
+
+# callback(result, error) -- exactly one of them is not None
+Callback = Callable[[Any, Optional[BaseException]], None]
+
+
+class _GuiBridge(QObject):
+    """Lives on the GUI thread; queued signal hops results back onto it."""
+
+    deliver = Signal(object, object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.deliver.connect(self._on_deliver)
+
+    @staticmethod
+    def _on_deliver(callback, result, error):
+        try:
+            callback(result, error)
+        except Exception as e:
+            print(f"[❌] Async API callback failed: {e}")
+
+
+class AsyncApi:
+    """Event-loop thread + bounded executor running the blocking API helpers."""
+
+    def __init__(self, max_concurrency: int = _http.POOL_MAXSIZE):
+        self.max_concurrency = max(1, max_concurrency)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._bridge: Optional[_GuiBridge] = None
+        self._lock = threading.Lock()
+
+    # -------------------------
+    # Loop lifecycle
+    # -------------------------
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="api-io")
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                self._sem = asyncio.Semaphore(self.max_concurrency)
+                ready.set()
+                loop.run_forever()
+                loop.close()
+
+            self._thread = threading.Thread(target=run, name="api-loop", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            return loop
+
+    def shutdown(self) -> None:
+        """Stop the loop thread and the worker pool (pending calls are abandoned)."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            if loop is None:
+                return
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join(5)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------
+    # Scheduling
+    # -------------------------
+    async def _call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        async with self._sem:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, lambda: fn(*args, **kwargs))
+
+    def submit(self, coro: Awaitable[Any], callback: Optional[Callback] = None) -> Future:
+        """
+        Schedule `coro` on the API loop from any thread. If `callback` is given it
+        is invoked on the Qt GUI thread as callback(result, error).
+        """
+        bridge = self._gui_bridge() if callback is not None else None
+        fut = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        if bridge is not None:
+
+            def done(f: Future):
+                if f.cancelled():
+                    return
+                err = f.exception()
+                bridge.deliver.emit(callback, None if err else f.result(), err)
+
+            fut.add_done_callback(done)
+        return fut
+
+    def run_sync(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Block the calling (non-loop) thread until `coro` completes."""
+        return self.submit(coro).result(timeout)
+
+    def _gui_bridge(self) -> _GuiBridge:
+        with self._lock:
+            if self._bridge is None:
+                bridge = _GuiBridge()
+                app = QCoreApplication.instance()
+                if app is not None:
+                    bridge.moveToThread(app.thread())
+                self._bridge = bridge
+            return self._bridge
+
+    # -------------------------
+    # Endpoints
+    # -------------------------
+    async def login(self, email: str, password: str) -> Dict[str, Any]:
+        return await self._call(login_user, email, password)
+
+    async def me(self) -> Dict[str, Any]:
+        return await self._call(fetch_user_profile)
+
+    async def my_tasks(self) -> Dict[str, Any]:
+        """Conditional/incremental task sync (see task_client.TaskSync)."""
+        return await self._call(sync_my_tasks)
+
+    async def upload_screenshot(self, payload: Payload, captured_at_iso: str, mime: str = "image/jpeg",
+                                monitor: Optional[int] = None) -> Dict[str, Any]:
+        return await self._call(upload_frame, payload, captured_at_iso, mime, monitor)
+
+    async def load_session(self) -> Dict[str, Any]:
+        """Fetch /user/me and sync /task/my-tasks concurrently."""
+        profile, tasks = await asyncio.gather(self.me(), self.my_tasks())
+        return {"profile": profile, "tasks": tasks}
+
+
+_api: Optional[AsyncApi] = None
+_api_lock = threading.Lock()
+
+
+def get_async_api() -> AsyncApi:
+    """Process-wide AsyncApi instance (loop thread starts on first use)."""
+    global _api
+    with _api_lock:
+        if _api is None:
+            _api = AsyncApi()
+        return _api
+
+
+def shutdown_async_api() -> None:
+    """Stop the shared AsyncApi loop if it was ever started (call on app exit)."""
+    with _api_lock:
+        api = _api
+    if api is not None:
+        api.shutdown()
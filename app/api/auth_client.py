@@ -16,7 +16,7 @@ def login_user(email: str, password: str, timeout: int = 10) -> Dict[str, Any]:
       - user_email, user_id when success
     """
     try:
-        resp = api_post("/user/login", json={"email": email, "password": password}, timeout=timeout)
+        resp = api_post("/user/login", json={"email": email, "password": password}, timeout=timeout, refresh_on_401=False)
         # api_post returns requests.Response
         if resp.status_code != 200:
             # try to extract server message
@@ -1,24 +1,64 @@
 # app/api/screenshot_client.py
-from typing import Optional, Dict, Any
-from app.api._http import api_post
+import json
+import time
+import uuid
+from typing import Optional, Dict, Any, List
+from app.api._http import api_post, backoff_delay
+from app.api._multipart import MultipartStream, Payload
 from datetime import datetime, timezone
 
-def upload_screenshot(image_bytes: bytes, captured_at_iso: Optional[str] = None, timeout: int = 30) -> Dict[str, Any]:
+# Spool/pipeline mime type for "frame unchanged since <ts>" markers
+UNCHANGED_MARKER_MIME = "application/x-pytrack-unchanged"
+# Tile delta / keyframe container produced by app.capture.delta
+DELTA_MIME = "application/x-pytrack-delta"
+
+_FILENAMES = {
+    "image/jpeg": "screenshot.jpg",
+    "image/webp": "screenshot.webp",
+    "image/png": "screenshot.png",
+}
+
+
+def frame_idempotency_key(captured_at_iso: str, mime: str, monitor: Optional[int] = None) -> str:
+    """
+    Idempotency-Key for one frame upload. Derived from what identifies the frame
+    (not random), so re-sends after a timeout, a drainer retry or an app restart
+    all carry the same key and the backend stores the frame once.
     """
-    Upload an image (bytes) to the backend.
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"pytrack-frame:{captured_at_iso}|{monitor}|{mime}"))
+
+
+def _post_multipart(path: str, fields: Dict[str, str], files: Dict[str, Any], timeout: int,
+                    idempotency_key: Optional[str] = None):
+    """POST a streamed multipart body (payloads are never copied into one buffer)."""
+    body = MultipartStream(fields=fields, files=files)
+    return api_post(path, data=body, headers={"Content-Type": body.content_type}, timeout=timeout,
+                    idempotency_key=idempotency_key)
+
+
+def upload_screenshot(image_bytes: Payload, captured_at_iso: Optional[str] = None, timeout: int = 30, monitor: Optional[int] = None, mime: str = "image/jpeg") -> Dict[str, Any]:
+    """
+    Upload an image to the backend. `image_bytes` may be bytes, a memoryview or a
+    seekable binary stream; it is streamed into the multipart body without copies.
+    `mime` must match the encoded payload (image/jpeg, image/webp or image/png).
+    `monitor` identifies the screen for multi-monitor capture (0 = stitched desktop).
     Returns {"status": "success", "image_url": "...", "record": {...}} on success,
-    or {"status": "error", "message": "..."} on failure.
+    or {"status": "error", "message": "...", "http_status": n} on failure
+    (http_status is missing when the request never got an answer).
     """
     try:
-        files = {"image": ("screenshot.png", image_bytes, "image/png")}
+        files = {"image": (_FILENAMES.get(mime, "screenshot.bin"), image_bytes, mime)}
         data = {}
         if captured_at_iso:
             data["captured_at"] = captured_at_iso
         else:
             # include a sensible default if caller didn't provide one
             data["captured_at"] = datetime.now(timezone.utc).isoformat()
+        if monitor is not None:
+            data["monitor"] = str(monitor)
 
-        resp = api_post("/screenshots/upload", data=data, files=files, timeout=timeout)
+        key = frame_idempotency_key(data["captured_at"], mime, monitor)
+        resp = _post_multipart("/screenshots/upload", data, files, timeout, idempotency_key=key)
         if resp.status_code in (200, 201):
             try:
                 return {"status": "success", **resp.json()}
@@ -29,6 +69,174 @@ def upload_screenshot(image_bytes: bytes, captured_at_iso: Optional[str] = None,
                 body = resp.json()
             except Exception:
                 body = resp.text
-            return {"status": "error", "message": body}
+            return {"status": "error", "message": body, "http_status": resp.status_code}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+def report_unchanged(since_iso: str, captured_at_iso: Optional[str] = None, timeout: int = 10, monitor: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Tell the backend the screen is unchanged since `since_iso` (the capture time
+    of the last uploaded screenshot) instead of uploading a duplicate image.
+    Same return shape as upload_screenshot.
+    """
+    try:
+        payload = {
+            "unchanged_since": since_iso,
+            "captured_at": captured_at_iso or datetime.now(timezone.utc).isoformat(),
+        }
+        if monitor is not None:
+            payload["monitor"] = monitor
+        key = frame_idempotency_key(payload["captured_at"], UNCHANGED_MARKER_MIME, monitor)
+        resp = api_post("/screenshots/unchanged", json=payload, timeout=timeout, idempotency_key=key)
+        if resp.status_code in (200, 201, 204):
+            try:
+                return {"status": "success", **(resp.json() if resp.content else {})}
+            except Exception:
+                return {"status": "success", "raw": resp.text}
+        try:
+            body = resp.json()
+        except Exception:
+            body = resp.text
+        return {"status": "error", "message": body, "http_status": resp.status_code}
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+def upload_screenshot_delta(payload: Payload, captured_at_iso: Optional[str] = None, timeout: int = 30, monitor: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Upload a tile-delta (or keyframe) container from app.capture.delta.
+    The backend reassembles frames from the manifest; same return shape as upload_screenshot.
+    """
+    try:
+        files = {"delta": ("frame.ptd", payload, DELTA_MIME)}
+        data = {"captured_at": captured_at_iso or datetime.now(timezone.utc).isoformat()}
+        if monitor is not None:
+            data["monitor"] = str(monitor)
+        key = frame_idempotency_key(data["captured_at"], DELTA_MIME, monitor)
+        resp = _post_multipart("/screenshots/upload-delta", data, files, timeout, idempotency_key=key)
+        if resp.status_code in (200, 201):
+            try:
+                return {"status": "success", **resp.json()}
+            except Exception:
+                return {"status": "success", "message": "Upload succeeded but response parse failed", "raw": resp.text}
+        try:
+            body = resp.json()
+        except Exception:
+            body = resp.text
+        return {"status": "error", "message": body, "http_status": resp.status_code}
     except Exception as e:
         return {"status": "error", "message": str(e)}
+
+
+def upload_frame(payload: Payload, captured_at_iso: str, mime: str = "image/jpeg", monitor: Optional[int] = None, timeout: int = 30) -> Dict[str, Any]:
+    """Upload one spooled frame, dispatching on its mime (image, tile delta or unchanged marker)."""
+    if mime == UNCHANGED_MARKER_MIME:
+        since = bytes(payload).decode("utf-8")
+        return report_unchanged(since, captured_at_iso=captured_at_iso, monitor=monitor)
+    if mime == DELTA_MIME:
+        return upload_screenshot_delta(payload, captured_at_iso=captured_at_iso, timeout=timeout, monitor=monitor)
+    return upload_screenshot(payload, captured_at_iso=captured_at_iso, timeout=timeout, monitor=monitor, mime=mime)
+
+
+def _rewind(items: List[Dict[str, Any]], starts: List[Optional[int]]) -> None:
+    for item, start in zip(items, starts):
+        if start is not None:
+            item["image"].seek(start)
+
+
+def upload_screenshots_batch(items: List[Dict[str, Any]], timeout: int = 60, retries: int = 2, backoff: float = 0.5) -> Dict[str, Any]:
+    """
+    Upload several frames in one multipart request to /screenshots/upload-batch.
+
+    `items` is a list of dicts:
+      {"image": <bytes|memoryview|stream>, "captured_at": iso, "mime": "image/jpeg", "monitor": 1}
+    Parts are named image_<n>; an "items" JSON field carries per-part metadata.
+
+    The backend answers {"results": [{"index": n, "status": "success"|"error", ...}, ...]}.
+    Only failed items are re-sent, up to `retries` more times (items the backend
+    marks "retryable": false are not retried). If the backend has no batch
+    endpoint (404/405) the items are uploaded one by one instead.
+
+    Returns {"status": "success"|"partial"|"error", "results": [...]} with one
+    result dict per input item, in input order.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    starts = [item["image"].tell() if hasattr(item["image"], "read") else None for item in items]
+    pending = list(range(len(items)))
+
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            time.sleep(backoff_delay(attempt, backoff, backoff * 2 ** retries))
+            _rewind([items[i] for i in pending], [starts[i] for i in pending])
+
+        manifest, files = [], {}
+        for i in pending:
+            item = items[i]
+            mime = item.get("mime") or "image/jpeg"
+            field = f"image_{i}"
+            files[field] = (_FILENAMES.get(mime, "frame.bin"), item["image"], mime)
+            captured_at = item.get("captured_at") or datetime.now(timezone.utc).isoformat()
+            item["captured_at"] = captured_at  # stable across retries (it feeds the idempotency key)
+            manifest.append({
+                "index": i,
+                "field": field,
+                "mime": mime,
+                "captured_at": captured_at,
+                "monitor": item.get("monitor"),
+                "idempotency_key": frame_idempotency_key(captured_at, mime, item.get("monitor")),
+            })
+        batch_key = str(uuid.uuid5(uuid.NAMESPACE_URL, "pytrack-batch:" + ",".join(m["idempotency_key"] for m in manifest)))
+
+        try:
+            resp = _post_multipart("/screenshots/upload-batch", {"items": json.dumps(manifest)}, files, timeout,
+                                   idempotency_key=batch_key)
+        except Exception as e:
+            for i in pending:
+                results[i] = {"status": "error", "message": str(e)}
+            continue
+
+        if resp.status_code in (404, 405):
+            # older backend without the batch endpoint; the failed request already read the streams
+            _rewind([items[i] for i in pending], [starts[i] for i in pending])
+            for i in pending:
+                item = items[i]
+                results[i] = upload_frame(item["image"], item.get("captured_at") or datetime.now(timezone.utc).isoformat(),
+                                          item.get("mime") or "image/jpeg", item.get("monitor"))
+            pending = []
+            break
+
+        if resp.status_code not in (200, 201, 207):
+            try:
+                body = resp.json()
+            except Exception:
+                body = resp.text
+            for i in pending:
+                results[i] = {"status": "error", "message": body, "http_status": resp.status_code}
+            if 400 <= resp.status_code < 500 and resp.status_code != 429:
+                break  # request itself is bad (or auth cleared); retrying won't help
+            continue
+
+        try:
+            returned = {r.get("index"): r for r in (resp.json().get("results") or [])}
+        except Exception:
+            returned = {}
+        retry_next = []
+        for i in pending:
+            r = returned.get(i)
+            if r is None:
+                results[i] = {"status": "error", "message": "missing from batch response"}
+                retry_next.append(i)
+            elif r.get("status") == "success":
+                results[i] = dict(r)
+            else:
+                results[i] = {"status": "error", **r}
+                if r.get("retryable", True):
+                    retry_next.append(i)
+        pending = retry_next
+
+    ok = sum(1 for r in results if r and r.get("status") == "success")
+    status = "success" if ok == len(items) else ("error" if ok == 0 else "partial")
+    return {"status": status, "results": results}
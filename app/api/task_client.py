@@ -1,9 +1,17 @@
 # app/api/task_client.py
-from typing import Dict, Any
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from app.api._http import api_get
 from app.utils.state import AppState
 
 DEFAULT_TIMEOUT = 10
+DEFAULT_PAGE_SIZE = int(os.getenv("TASKS_PAGE_SIZE", "200"))
+PAGE_CACHE_SIZE = int(os.getenv("TASKS_PAGE_CACHE", "32"))
+
+# sort keys understood by /task/my-tasks?sort=<key>
+SORT_KEYS = ("task", "assigned_to", "estimated_minutes", "task_highlight", "completed_at", "created_at", "status")
 
 
 def get_my_tasks(timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
@@ -25,3 +33,370 @@ def get_my_tasks(timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
         return {"success": False, "error": body}
     except Exception as e:
         return {"success": False, "error": str(e)}
+
+
+def task_key(task: Dict[str, Any]) -> str:
+    """Stable identity for a task across backend shapes (id or task_id)."""
+    return str(task.get("id") or task.get("task_id") or "")
+
+
+class TaskSync:
+    """
+    Conditional + incremental sync of /task/my-tasks into a local index keyed by task id.
+
+    Each sync sends If-None-Match / If-Modified-Since from the previous response,
+    so an unchanged list costs a bodyless 304. When the backend returned a
+    cursor, `updated_since=<cursor>` is sent too; a response flagged
+    {"delta": true} carries only changed tasks plus {"deleted": [ids]} and is
+    merged into the index. Backends that ignore these simply return the full
+    list, which replaces the index.
+
+    reset()/restore() bump a generation counter. A sync whose request was
+    built under an older generation (e.g. still in flight at logout) discards
+    its response instead of merging the previous user's tasks and validators
+    back in, and reports {"stale": True}.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._cursor: Optional[str] = None
+        self._synced = False
+        self._generation = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._index = {}
+            self._etag = self._last_modified = self._cursor = None
+            self._synced = False
+            self._generation += 1
+
+    def tasks(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._index.values())
+
+    def export_state(self) -> Dict[str, Any]:
+        """Validators/cursor for persisting alongside a task snapshot."""
+        with self._lock:
+            return {"etag": self._etag, "last_modified": self._last_modified, "cursor": self._cursor}
+
+    def restore(self, tasks: List[Dict[str, Any]], state: Dict[str, Any]) -> None:
+        """Seed the index from a persisted snapshot so the next sync can be a 304/delta."""
+        with self._lock:
+            self._index = {task_key(t): t for t in tasks}
+            self._etag = state.get("etag")
+            self._last_modified = state.get("last_modified")
+            self._cursor = state.get("cursor")
+            self._synced = True
+            self._generation += 1
+
+    def sync(self, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+        """
+        Returns get_my_tasks' normalized shape plus:
+          "changed": bool       -- whether the index changed in this sync
+          "not_modified": bool  -- server answered 304
+        or {"success": False, "stale": True, ...} if the sync state was reset meanwhile.
+        """
+        with self._lock:
+            generation = self._generation
+            headers, params = {}, {}
+            if self._synced:
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
+                if self._cursor:
+                    params["updated_since"] = self._cursor
+        try:
+            resp = api_get("/task/my-tasks", headers=headers, params=params or None, timeout=timeout)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        if resp.status_code == 304:
+            with self._lock:
+                if self._generation != generation:
+                    return self._stale()
+                data = list(self._index.values())
+            return {"success": True, "data": data, "count": len(data), "changed": False, "not_modified": True}
+
+        if resp.status_code != 200:
+            try:
+                body = resp.json()
+            except Exception:
+                body = resp.text
+            return {"success": False, "error": body}
+
+        try:
+            body = resp.json()
+        except Exception as e:
+            return {"success": False, "error": f"Invalid task response: {e}"}
+
+        with self._lock:
+            if self._generation != generation:
+                return self._stale()
+            changed = self._merge_locked(body, is_delta=bool(body.get("delta")) and self._synced)
+            self._etag = resp.headers.get("ETag") or None
+            self._last_modified = resp.headers.get("Last-Modified") or None
+            self._cursor = body.get("cursor") or body.get("server_time") or None
+            self._synced = True
+            data = list(self._index.values())
+        return {"success": True, "data": data, "count": len(data), "changed": changed, "not_modified": False}
+
+    @staticmethod
+    def _stale() -> Dict[str, Any]:
+        return {"success": False, "stale": True, "error": "Task sync was reset while the request was in flight"}
+
+    def _merge_locked(self, body: Dict[str, Any], is_delta: bool) -> bool:
+        tasks = body.get("tasks", []) or []
+        if not is_delta:
+            new_index = {task_key(t): t for t in tasks}
+            changed = not self._synced or new_index != self._index
+            self._index = new_index
+            return changed
+
+        changed = False
+        for t in tasks:
+            key = task_key(t)
+            if self._index.get(key) != t:
+                self._index[key] = t
+                changed = True
+        for key in body.get("deleted", []) or []:
+            if self._index.pop(str(key), None) is not None:
+                changed = True
+        return changed
+
+
+_task_sync = TaskSync()
+
+
+def sync_my_tasks(timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """Incremental/conditional variant of get_my_tasks (see TaskSync)."""
+    return _task_sync.sync(timeout)
+
+
+def reset_task_sync() -> None:
+    """Drop the local task index and validators (call on logout)."""
+    _task_sync.reset()
+
+
+def task_sync() -> TaskSync:
+    """The process-wide TaskSync used by sync_my_tasks()."""
+    return _task_sync
+
+
+# -------------------------
+# Paginated / sorted / filtered queries
+# -------------------------
+class TaskQuery(NamedTuple):
+    """
+    One server-side view of the task list. Hashable, so it doubles as a cache key.
+
+    sort:          one of SORT_KEYS (None = backend default order)
+    descending:    sort direction
+    status:        only tasks with this status
+    created_from:  ISO date/datetime, inclusive lower bound on created_at
+    created_to:    ISO date/datetime, inclusive upper bound on created_at
+    page_size:     tasks per page
+    """
+    sort: Optional[str] = None
+    descending: bool = False
+    status: Optional[str] = None
+    created_from: Optional[str] = None
+    created_to: Optional[str] = None
+    page_size: int = DEFAULT_PAGE_SIZE
+
+    def params(self, cursor: Optional[str] = None) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"limit": self.page_size}
+        if cursor:
+            params["cursor"] = cursor
+        if self.sort:
+            params["sort"] = self.sort
+            params["order"] = "desc" if self.descending else "asc"
+        if self.status:
+            params["status"] = self.status
+        if self.created_from:
+            params["created_from"] = self.created_from
+        if self.created_to:
+            params["created_to"] = self.created_to
+        return params
+
+
+def query_my_tasks(query: TaskQuery = TaskQuery(), cursor: Optional[str] = None,
+                   timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """
+    Fetch one page of the current user's tasks, sorted/filtered by the backend.
+
+    GET /task/my-tasks?limit=..&cursor=..&sort=..&order=..&status=..&created_from=..&created_to=..
+    expects {"tasks": [...], "next_cursor": "..." | null, "total": n}.
+
+    Returns a normalized dict:
+      { "success": bool, "data": [...], "next_cursor": str|None, "total": int|None, "error": "message" }
+
+    Backends without pagination answer with the full list (no "next_cursor" key);
+    that list is then filtered, sorted and sliced here, with the cursor being an offset.
+    """
+    if query.sort and query.sort not in SORT_KEYS:
+        return {"success": False, "error": f"Unknown sort key: {query.sort}"}
+    try:
+        resp = api_get("/task/my-tasks", params=query.params(cursor), timeout=timeout)
+        if resp.status_code != 200:
+            try:
+                body = resp.json()
+            except Exception:
+                body = resp.text
+            return {"success": False, "error": body}
+        body = resp.json()
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+    tasks = body.get("tasks", []) or []
+    if "next_cursor" in body:
+        return {"success": True, "data": tasks, "next_cursor": body.get("next_cursor") or None,
+                "total": body.get("total")}
+    return _local_page(tasks, query, cursor)
+
+
+def _sort_value(value: Any) -> Tuple[int, Any]:
+    # numbers compare as numbers and before text; text compares case-insensitively
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value).lower())
+
+
+def _local_page(tasks: List[Dict[str, Any]], query: TaskQuery, cursor: Optional[str]) -> Dict[str, Any]:
+    """Apply a TaskQuery to a full task list (fallback for non-paginating backends)."""
+    if query.status:
+        tasks = [t for t in tasks if str(t.get("status") or "") == query.status]
+    if query.created_from:
+        tasks = [t for t in tasks if str(t.get("created_at") or "") >= query.created_from]
+    if query.created_to:
+        # a bare date bound includes the whole day
+        upper = query.created_to + ("\uffff" if len(query.created_to) == 10 else "")
+        tasks = [t for t in tasks if t.get("created_at") and str(t["created_at"]) <= upper]
+    if query.sort:
+        # tasks without the sort field always go last, whatever the direction
+        present = [t for t in tasks if t.get(query.sort) not in (None, "")]
+        missing = [t for t in tasks if t.get(query.sort) in (None, "")]
+        present.sort(key=lambda t: _sort_value(t[query.sort]), reverse=query.descending)
+        tasks = present + missing
+    try:
+        start = max(0, int(cursor or 0))
+    except ValueError:
+        start = 0
+    end = start + query.page_size
+    return {"success": True, "data": tasks[start:end],
+            "next_cursor": str(end) if end < len(tasks) else None, "total": len(tasks)}
+
+
+class TaskPager:
+    """
+    Page-at-a-time access to a TaskQuery with an LRU cache of fetched pages.
+
+    Pages are addressed by (query, index); the cursor for page N comes from
+    page N-1, so asking for a page whose predecessor was never fetched walks
+    forward from the last known cursor. Thread-safe: pages are fetched on
+    worker threads (including speculative prefetch of the next page).
+
+    invalidate() bumps a generation: a fetch that started before it is not
+    cached and reports {"success": False, "stale": True}, so an in-flight
+    request can't put the previous user's (or an outdated) page back.
+    """
+
+    def __init__(self, fetch=query_my_tasks, max_pages: int = PAGE_CACHE_SIZE):
+        self._fetch = fetch
+        self.max_pages = max_pages
+        self._lock = threading.Lock()
+        self._pages: "OrderedDict[Tuple[TaskQuery, int], Dict[str, Any]]" = OrderedDict()
+        # cursors outlive evicted pages, so a re-fetch never has to walk from page 0
+        self._cursors: Dict[Tuple[TaskQuery, int], Optional[str]] = {}
+        self._generation = 0
+
+    def cached(self, query: TaskQuery, index: int) -> Optional[Dict[str, Any]]:
+        """The page if it is in the cache (marks it recently used), else None."""
+        with self._lock:
+            page = self._pages.get((query, index))
+            if page is not None:
+                self._pages.move_to_end((query, index))
+            return page
+
+    def page(self, query: TaskQuery, index: int, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+        """
+        Return page `index` of `query` (0-based), fetching it if needed.
+        Result: {"success", "data", "index", "has_more", "total"} or {"success": False, "error"}.
+        """
+        page = self.cached(query, index)
+        if page is not None:
+            return page
+        with self._lock:
+            generation = self._generation
+            known = index
+            while known > 0 and (query, known) not in self._cursors:
+                known -= 1
+        for i in range(known, index + 1):
+            page = self.cached(query, i) if i < index else None
+            if page is None:
+                page = self._fetch_page(query, i, timeout, generation)
+            if not page.get("success"):
+                return page
+            if i < index and not page["has_more"]:
+                return {"success": True, "data": [], "index": index, "has_more": False, "total": page.get("total")}
+        return page
+
+    def pages(self, query: TaskQuery, count: int, timeout: int = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+        """Pages 0..count-1 concatenated: {"success", "data", "pages", "has_more", "total"}."""
+        data: List[Dict[str, Any]] = []
+        page: Dict[str, Any] = {"has_more": False, "total": 0}
+        loaded = 0
+        for i in range(max(1, count)):
+            page = self.page(query, i, timeout)
+            if not page.get("success"):
+                return page
+            data.extend(page["data"])
+            loaded = i + 1
+            if not page["has_more"]:
+                break
+        return {"success": True, "data": data, "pages": loaded, "has_more": page["has_more"],
+                "total": page.get("total")}
+
+    def invalidate(self) -> None:
+        """Drop every cached page and cursor (task list changed, logout)."""
+        with self._lock:
+            self._pages.clear()
+            self._cursors.clear()
+            self._generation += 1
+
+    @staticmethod
+    def _stale() -> Dict[str, Any]:
+        return {"success": False, "stale": True, "error": "Task pages were invalidated during the fetch"}
+
+    def _fetch_page(self, query: TaskQuery, index: int, timeout: int, generation: int) -> Dict[str, Any]:
+        with self._lock:
+            if self._generation != generation:
+                return self._stale()  # the walk's earlier cursors are gone
+            cursor = self._cursors.get((query, index))
+        res = self._fetch(query, cursor, timeout)
+        if not res.get("success"):
+            return res
+        next_cursor = res.get("next_cursor")
+        page = {"success": True, "data": res.get("data", []) or [], "index": index,
+                "has_more": next_cursor is not None, "total": res.get("total")}
+        with self._lock:
+            if self._generation != generation:
+                return self._stale()
+            self._pages[(query, index)] = page
+            self._pages.move_to_end((query, index))
+            if next_cursor is not None:
+                self._cursors[(query, index + 1)] = next_cursor
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return page
+
+
+_task_pager = TaskPager()
+
+
+def task_pager() -> TaskPager:
+    """The process-wide TaskPager used by the task table."""
+    return _task_pager
@@ -0,0 +1,174 @@
+# app/api/token_manager.py
+"""
+Access-token refresh with single-flight coordination.
+
+The backend issues short-lived JWT access tokens plus a refresh token. The
+TokenManager keeps the access token usable without sending the user back to
+the login screen:
+
+- ahead of expiry: before each request, `ensure_fresh()` decodes the token's
+  `exp` claim (cached per token) and refreshes once it is within
+  REFRESH_AHEAD_SECONDS of expiring;
+- on a 401: `refresh(stale_token)` swaps the token the request was sent with
+  for a new one. Concurrent callers share one refresh: the first caller does
+  the round-trip, the others wait on it and get the same result, and callers
+  that arrive after a refresh already replaced their token get the new one
+  straight away.
+
+A refresh token the backend rejects (400/401/403), a backend without the
+refresh endpoint (404/405) or no stored refresh token at all means the
+session is over, so auth is cleared and the UI falls back to login. Network
+errors and 5xx keep the tokens (the access token may well still be valid)
+and pause refresh attempts for RETRY_SECONDS.
+
+Usage:
+    tm = get_token_manager()
+    tm.ensure_fresh()                  # before sending a request (cheap when fresh)
+    new_token = tm.refresh(sent_token) # after a 401; None = could not refresh
+"""
+import base64
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.utils.state import AppState
+
+REFRESH_PATH = os.getenv("AUTH_REFRESH_PATH", "/user/refresh")
+REFRESH_AHEAD_SECONDS = float(os.getenv("TOKEN_REFRESH_AHEAD_SECONDS", "120"))
+RETRY_SECONDS = 30.0  # pause after a refresh failed for a non-auth reason
+
+# refresher(refresh_token) -> {"status": "success", "access_token", "refresh_token"}
+#                           | {"status": "error", "message", "rejected": bool}
+Refresher = Callable[[str], Dict[str, Any]]
+
+
+def jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """`exp` claim (epoch seconds) of a JWT, or None if it has none / isn't a JWT."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp is not None else None
+    except Exception:
+        return None
+
+
+def _default_refresher(refresh_token: str) -> Dict[str, Any]:
+    from app.api import _http
+    # straight to the session: no stale Authorization header, and a 401 here
+    # must not recurse into another refresh
+    try:
+        resp = _http.get_session().post(
+            f"{_http.API_URL}{REFRESH_PATH}", json={"refresh_token": refresh_token}, timeout=_http.DEFAULT_TIMEOUT
+        )
+    except Exception as e:
+        return {"status": "error", "message": str(e), "rejected": False}
+    if resp.status_code != 200:
+        # 404/405: no refresh endpoint, so the token can never be renewed
+        return {"status": "error", "message": f"HTTP {resp.status_code}",
+                "rejected": resp.status_code in (400, 401, 403, 404, 405)}
+    try:
+        data = resp.json()
+    except ValueError:
+        return {"status": "error", "message": "invalid refresh response", "rejected": False}
+    if not data.get("access_token"):
+        return {"status": "error", "message": "refresh response has no access token", "rejected": False}
+    return {"status": "success", "access_token": data["access_token"], "refresh_token": data.get("refresh_token")}
+
+
+class _Flight:
+    """One refresh round-trip that concurrent callers wait on."""
+
+    __slots__ = ("done", "token")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.token: Optional[str] = None
+
+
+class TokenManager:
+    """Refreshes the stored access token ahead of expiry and on 401, one request at a time."""
+
+    def __init__(self, refresher: Optional[Refresher] = None, ahead: float = REFRESH_AHEAD_SECONDS,
+                 clock: Callable[[], float] = time.time):
+        self.refresher = refresher or _default_refresher
+        self.ahead = ahead
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flight: Optional[_Flight] = None
+        self._exp_token: Optional[str] = None   # token whose expiry is cached in _exp
+        self._exp: Optional[float] = None
+        self._retry_at = 0.0
+
+    def ensure_fresh(self) -> None:
+        """Refresh now if the stored token expires within `ahead` seconds."""
+        token = AppState.get_access_token()
+        if not token or not AppState.get_refresh_token():
+            return
+        if token is not self._exp_token:
+            self._exp_token, self._exp = token, jwt_expiry(token)
+        if self._exp is None or self._exp - self._clock() > self.ahead:
+            return
+        self.refresh(token)
+
+    def refresh(self, stale_token: Optional[str]) -> Optional[str]:
+        """
+        Replace `stale_token` (the token a request was sent with) and return the
+        current token, or None when no usable token could be obtained.
+        """
+        with self._lock:
+            current = AppState.get_access_token()
+            if current != stale_token:
+                return current  # someone else refreshed (or cleared auth) meanwhile
+            if self._clock() < self._retry_at:
+                return None     # the backend just failed to refresh; don't hammer it
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = _Flight()
+        if not leader:
+            flight.done.wait()
+            return flight.token
+        try:
+            flight.token = self._do_refresh()
+        finally:
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+        return flight.token
+
+    def _do_refresh(self) -> Optional[str]:
+        refresh_token = AppState.get_refresh_token()
+        res = self.refresher(refresh_token) if refresh_token else {
+            "status": "error", "message": "no refresh token stored", "rejected": True}
+        if res.get("status") == "success":
+            AppState.set_tokens(res["access_token"], res.get("refresh_token") or refresh_token,
+                                AppState.get_user_email())
+            self._retry_at = 0.0
+            print("[✅] Access token refreshed")
+            return res["access_token"]
+        if res.get("rejected"):
+            print(f"[❌] Session expired, refresh rejected: {res.get('message')}")
+            AppState.clear_auth()
+            AppState.clear()
+        else:
+            self._retry_at = self._clock() + RETRY_SECONDS
+            print(f"[⚠] Token refresh failed: {res.get('message')}")
+        return None
+
+
+_manager: Optional[TokenManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_token_manager() -> TokenManager:
+    """Process-wide token manager."""
+    global _manager
+    if _manager is not None:
+        return _manager  # per-request hot path: no lock once created
+    with _manager_lock:
+        if _manager is None:
+            _manager = TokenManager()
+        return _manager
@@ -0,0 +1,86 @@
+# app/capture/dedup.py
+"""
+Cheap change detection for screenshots.
+
+Each raw frame is reduced to a small grid of block-mean luma values (on a
+strided sub-sample, so a 4K frame costs a few ms). A frame is considered
+"unchanged" when the fraction of grid cells whose luma moved by more than
+`pixel_delta` is at or below `threshold`. Unchanged frames are replaced by a
+tiny marker upload instead of a full JPEG.
+
+Tuning (env overrides):
+    SCREENSHOT_DEDUP_THRESHOLD   fraction of changed cells tolerated (default 0.01)
+    SCREENSHOT_DEDUP_MAX_SKIP    force a full upload after N seconds (default 1800)
+"""
+import os
+import time
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+DEFAULT_THRESHOLD = float(os.getenv("SCREENSHOT_DEDUP_THRESHOLD", "0.01"))
+DEFAULT_MAX_SKIP_SECONDS = float(os.getenv("SCREENSHOT_DEDUP_MAX_SKIP", "1800"))
+
+
+def frame_fingerprint(size: Tuple[int, int], rgb: bytes, grid: Tuple[int, int] = (32, 18), step: int = 4) -> np.ndarray:
+    """
+    Return a (grid_h, grid_w) float32 array of block-mean luma for an RGB frame.
+    `step` sub-samples pixels before averaging to keep 4K frames cheap. Frames
+    smaller than the grid (after sub-sampling) get one cell per sample instead.
+    """
+    w, h = size
+    img = np.frombuffer(rgb, dtype=np.uint8).reshape(h, w, 3)[::step, ::step]
+    # integer luma approximation (0.299R + 0.587G + 0.114B)
+    luma = (img[..., 0].astype(np.uint16) * 77 + img[..., 1].astype(np.uint16) * 150
+            + img[..., 2].astype(np.uint16) * 29) >> 8
+
+    sh, sw = luma.shape
+    gw, gh = min(grid[0], sw), min(grid[1], sh)
+    bh, bw = sh // gh, sw // gw
+    luma = luma[: bh * gh, : bw * gw]
+    return luma.reshape(gh, bh, gw, bw).mean(axis=(1, 3), dtype=np.float32)
+
+
+def changed_fraction(a: np.ndarray, b: np.ndarray, pixel_delta: float = 8.0) -> float:
+    """Fraction of grid cells whose mean luma differs by more than pixel_delta."""
+    if a.shape != b.shape:
+        return 1.0
+    return float(np.count_nonzero(np.abs(a - b) > pixel_delta)) / a.size
+
+
+class FrameDeduper:
+    """Tracks the last uploaded frame and decides whether a new one is worth sending."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, pixel_delta: float = 8.0,
+                 grid: Tuple[int, int] = (32, 18), max_skip_seconds: float = DEFAULT_MAX_SKIP_SECONDS):
+        self.threshold = threshold
+        self.pixel_delta = pixel_delta
+        self.grid = grid
+        self.max_skip_seconds = max_skip_seconds
+        self._lock = threading.Lock()
+        self._ref: Optional[np.ndarray] = None
+        self._ref_iso: Optional[str] = None
+        self._ref_mono = 0.0
+
+    def check(self, captured_at_iso: str, size: Tuple[int, int], rgb: bytes) -> Optional[str]:
+        """
+        Return the capture timestamp of the last uploaded frame if this frame is
+        unchanged relative to it, else None (and make this frame the new reference).
+        """
+        fp = frame_fingerprint(size, rgb, self.grid)
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._ref is not None
+                and now - self._ref_mono < self.max_skip_seconds
+                and changed_fraction(fp, self._ref, self.pixel_delta) <= self.threshold
+            ):
+                return self._ref_iso
+            self._ref, self._ref_iso, self._ref_mono = fp, captured_at_iso, now
+            return None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._ref = None
+            self._ref_iso = None
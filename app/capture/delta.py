@@ -0,0 +1,186 @@
+# app/capture/delta.py
+"""
+Tile-based delta encoding for screenshots.
+
+The frame is split into fixed TILE x TILE blocks. Changed tiles are found with
+a vectorized NumPy comparison against the previously sent frame, and only
+those tiles are shipped (as one lossless PNG strip) together with a small JSON
+manifest. A full keyframe is sent periodically, on resolution change, or when
+most of the screen changed, so a lost delta can only corrupt a bounded span.
+Whoever drops an encoded frame (pipeline queue eviction, spool eviction or
+rejection) calls force_keyframe(), so the span ends with the next capture.
+
+Payload layout (mime DELTA_MIME):
+    b"PTD1" | uint32 big-endian manifest length | manifest JSON | PNG image
+
+Manifest:
+    {"v": 1, "kind": "key"|"delta", "seq": n, "base_seq": n-1 | null,
+     "w": width, "h": height, "tile": TILE, "tiles": [tile_index, ...] | null}
+
+Tile indices are row-major over the padded tile grid. DeltaDecoder / reassemble()
+rebuild the exact original frame from a keyframe plus its following deltas.
+
+Enable in the capture path with SCREENSHOT_DELTA=1.
+"""
+import io
+import json
+import os
+import struct
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.api.screenshot_client import DELTA_MIME
+
+MAGIC = b"PTD1"
+DEFAULT_TILE = 128
+DEFAULT_KEYFRAME_INTERVAL = int(os.getenv("SCREENSHOT_DELTA_KEYFRAME_INTERVAL", "30"))
+# above this fraction of changed tiles a keyframe is cheaper than a delta
+KEYFRAME_CHANGE_RATIO = 0.5
+
+
+def _pad_to_tiles(frame: np.ndarray, tile: int) -> np.ndarray:
+    h, w, _ = frame.shape
+    ph, pw = -h % tile, -w % tile
+    if not ph and not pw:
+        return frame
+    return np.pad(frame, ((0, ph), (0, pw), (0, 0)))
+
+
+def _as_tiles(padded: np.ndarray, tile: int) -> np.ndarray:
+    """View a padded (H, W, 3) frame as (rows, cols, tile, tile, 3) without copying."""
+    h, w, c = padded.shape
+    return padded.reshape(h // tile, tile, w // tile, tile, c).swapaxes(1, 2)
+
+
+def changed_tiles(prev: np.ndarray, cur: np.ndarray, tile: int) -> np.ndarray:
+    """Row-major indices of tiles that differ between two padded frames."""
+    diff = _as_tiles(prev, tile) != _as_tiles(cur, tile)
+    return np.flatnonzero(diff.any(axis=(2, 3, 4)))
+
+
+def _png_bytes(arr: np.ndarray) -> bytes:
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.fromarray(arr, "RGB").save(buf, format="PNG", compress_level=6)
+    return buf.getvalue()
+
+
+def _png_array(data: bytes) -> np.ndarray:
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        return np.asarray(img.convert("RGB"))
+
+
+def pack(manifest: dict, image: bytes) -> bytes:
+    head = json.dumps(manifest, separators=(",", ":")).encode("utf-8")
+    return MAGIC + struct.pack(">I", len(head)) + head + image
+
+
+def unpack(payload: bytes) -> Tuple[dict, bytes]:
+    if payload[:4] != MAGIC:
+        raise ValueError("not a delta payload")
+    (n,) = struct.unpack(">I", payload[4:8])
+    manifest = json.loads(payload[8:8 + n].decode("utf-8"))
+    return manifest, payload[8 + n:]
+
+
+class DeltaEncoder:
+    """
+    Stateful encoder: call with a raw (captured_at_iso, (w, h), rgb) frame and get
+    back (captured_at_iso, payload, DELTA_MIME). Usable directly as the pipeline's
+    encode_fn.
+    """
+
+    def __init__(self, tile: int = DEFAULT_TILE, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        self.tile = tile
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._prev: Optional[np.ndarray] = None  # padded reference frame
+        self._size: Optional[Tuple[int, int]] = None
+        self._seq = -1
+        self._since_key = 0
+        # set from other threads (pipeline store stage, spool drainer)
+        self._force_lock = threading.Lock()
+        self._force_key = False
+
+    def force_keyframe(self) -> None:
+        """Make the next encoded frame a keyframe (e.g. after a dropped upload). Thread-safe."""
+        with self._force_lock:
+            self._force_key = True
+
+    def __call__(self, frame: Tuple[str, Tuple[int, int], bytes]) -> Tuple[str, bytes, str]:
+        ts_iso, size, rgb = frame
+        return ts_iso, self.encode(size, rgb), DELTA_MIME
+
+    def encode(self, size: Tuple[int, int], rgb: bytes) -> bytes:
+        w, h = size
+        cur = _pad_to_tiles(np.frombuffer(rgb, dtype=np.uint8).reshape(h, w, 3), self.tile)
+        self._seq += 1
+        with self._force_lock:
+            forced, self._force_key = self._force_key, False
+
+        idx = None
+        if not forced and self._prev is not None and self._size == size and self._since_key < self.keyframe_interval:
+            idx = changed_tiles(self._prev, cur, self.tile)
+            total = (cur.shape[0] // self.tile) * (cur.shape[1] // self.tile)
+            if idx.size > total * KEYFRAME_CHANGE_RATIO:
+                idx = None
+
+        manifest = {"v": 1, "seq": self._seq, "w": w, "h": h, "tile": self.tile}
+        if idx is None:
+            manifest.update(kind="key", base_seq=None, tiles=None)
+            image = _png_bytes(cur[:h, :w])
+            self._since_key = 1
+        else:
+            manifest.update(kind="delta", base_seq=self._seq - 1, tiles=idx.tolist())
+            self._since_key += 1
+            if idx.size:
+                cols = cur.shape[1] // self.tile
+                tiles = _as_tiles(cur, self.tile)[idx // cols, idx % cols]
+                image = _png_bytes(tiles.reshape(-1, self.tile, 3))  # vertical strip
+            else:
+                image = b""
+
+        # keep our own copy: `rgb` may be a reused capture buffer
+        self._prev = cur.copy() if cur.base is not None else cur
+        self._size = size
+        return pack(manifest, image)
+
+
+class DeltaDecoder:
+    """Rebuilds full frames from a keyframe followed by consecutive deltas."""
+
+    def __init__(self):
+        self._frame: Optional[np.ndarray] = None  # padded
+        self._seq: Optional[int] = None
+        self._size: Optional[Tuple[int, int]] = None
+
+    def apply(self, payload: bytes) -> np.ndarray:
+        """Apply one payload and return the current (h, w, 3) uint8 frame."""
+        manifest, image = unpack(payload)
+        tile = manifest["tile"]
+        w, h = manifest["w"], manifest["h"]
+
+        if manifest["kind"] == "key":
+            self._frame = _pad_to_tiles(_png_array(image).copy(), tile)
+        else:
+            if self._frame is None or manifest["base_seq"] != self._seq or self._size != (w, h):
+                raise ValueError(f"delta seq {manifest['seq']} does not follow seq {self._seq}")
+            idx = np.asarray(manifest["tiles"], dtype=np.int64)
+            if idx.size:
+                strip = _png_array(image).reshape(idx.size, tile, tile, 3)
+                cols = self._frame.shape[1] // tile
+                _as_tiles(self._frame, tile)[idx // cols, idx % cols] = strip
+
+        self._seq = manifest["seq"]
+        self._size = (w, h)
+        return self._frame[:h, :w]
+
+
+def reassemble(payloads: Iterable[bytes]) -> List[np.ndarray]:
+    """Decode a keyframe-led sequence of payloads into full frames."""
+    decoder = DeltaDecoder()
+    return [decoder.apply(p).copy() for p in payloads]
@@ -0,0 +1,160 @@
+# app/capture/encoders.py
+"""
+Pluggable screenshot encoders.
+
+An encoder is a callable taking a raw (captured_at_iso, (w, h), rgb) frame and
+returning (captured_at_iso, payload, mime). Pick one by name:
+
+    encoder = make_encoder("jpeg")                  # quality 70, no optimize pass
+    encoder = make_encoder("jpeg-optimize")         # previous default, slower
+    encoder = make_encoder("webp", quality=60)
+    encoder = make_encoder("jpeg-half")             # downscaled to 50%
+    encoder = make_encoder("adaptive", target_bytes=150_000)
+
+SCREENSHOT_ENCODER / SCREENSHOT_TARGET_BYTES select the default used by the
+capture pipeline.
+"""
+import io
+import os
+from typing import Callable, Dict, Tuple, Union
+
+RawFrame = Tuple[str, Tuple[int, int], bytes]
+EncodedFrame = Tuple[str, Union[bytes, memoryview], str]
+Encoder = Callable[[RawFrame], EncodedFrame]
+
+DEFAULT_ENCODER = os.getenv("SCREENSHOT_ENCODER", "jpeg")
+DEFAULT_TARGET_BYTES = int(os.getenv("SCREENSHOT_TARGET_BYTES", "200000"))
+
+_FORMATS = {
+    "jpeg": ("JPEG", "image/jpeg"),
+    "webp": ("WEBP", "image/webp"),
+    "png": ("PNG", "image/png"),
+}
+
+
+def _to_image(size: Tuple[int, int], rgb: bytes, scale: float = 1.0):
+    from PIL import Image
+
+    img = Image.frombuffer("RGB", size, rgb, "raw", "RGB", 0, 1)
+    if scale < 1.0:
+        factor = 1.0 / scale
+        if factor.is_integer():
+            # box-filter integer reduction is far cheaper than a resample
+            return img.reduce(int(factor))
+        w, h = size
+        img = img.resize((max(1, int(w * scale)), max(1, int(h * scale))), Image.BILINEAR, reducing_gap=2.0)
+    return img
+
+
+def _save(img, fmt: str, quality: int, optimize: bool = False) -> memoryview:
+    buf = io.BytesIO()
+    if fmt == "WEBP":
+        img.save(buf, format=fmt, quality=quality, method=2)
+    elif fmt == "JPEG":
+        img.save(buf, format=fmt, quality=quality, optimize=optimize)
+    else:
+        img.save(buf, format=fmt, compress_level=6)
+    # view of the BytesIO buffer: avoids getvalue()'s extra copy of the frame
+    return buf.getbuffer()
+
+
+class ImageEncoder:
+    """Fixed-settings encoder (format, quality, optimize flag, scale)."""
+
+    def __init__(self, fmt: str = "jpeg", quality: int = 70, optimize: bool = False, scale: float = 1.0):
+        if fmt not in _FORMATS:
+            raise ValueError(f"unsupported image format: {fmt!r}")
+        self.pil_format, self.mime = _FORMATS[fmt]
+        self.quality = quality
+        self.optimize = optimize
+        self.scale = scale
+
+    def __call__(self, frame: RawFrame) -> EncodedFrame:
+        ts_iso, size, rgb = frame
+        img = _to_image(size, rgb, self.scale)
+        return ts_iso, _save(img, self.pil_format, self.quality, self.optimize), self.mime
+
+
+class AdaptiveEncoder:
+    """
+    Chooses quality and resolution to land each frame under `target_bytes`.
+
+    Starts from the settings that worked for the previous frame. If a frame
+    comes out too large, quality steps down, then resolution; if it comes out
+    well under budget, quality (then resolution) is raised for the next frame.
+    At most `max_attempts` encodes are spent per frame.
+    """
+
+    QUALITIES = (85, 75, 65, 55, 45, 35)
+    SCALES = (1.0, 0.75, 0.5)
+
+    def __init__(self, target_bytes: int = DEFAULT_TARGET_BYTES, fmt: str = "jpeg", max_attempts: int = 3):
+        if fmt not in _FORMATS or fmt == "png":
+            raise ValueError(f"adaptive encoding needs a lossy format, got {fmt!r}")
+        self.pil_format, self.mime = _FORMATS[fmt]
+        self.target_bytes = target_bytes
+        self.max_attempts = max(1, max_attempts)
+        self._qi = 1  # index into QUALITIES
+        self._si = 0  # index into SCALES
+
+    def _step_down(self) -> bool:
+        if self._qi < len(self.QUALITIES) - 1:
+            self._qi += 1
+        elif self._si < len(self.SCALES) - 1:
+            self._si += 1
+            self._qi = 1
+        else:
+            return False
+        return True
+
+    def _step_up(self) -> None:
+        if self._qi > 0:
+            self._qi -= 1
+        elif self._si > 0:
+            self._si -= 1
+            self._qi = len(self.QUALITIES) - 1
+
+    def __call__(self, frame: RawFrame) -> EncodedFrame:
+        ts_iso, size, rgb = frame
+        img_scale, img = None, None
+        for _ in range(self.max_attempts):
+            scale = self.SCALES[self._si]
+            if scale != img_scale:
+                img, img_scale = _to_image(size, rgb, scale), scale
+            payload = _save(img, self.pil_format, self.QUALITIES[self._qi])
+            if len(payload) <= self.target_bytes:
+                if len(payload) < self.target_bytes * 0.6:
+                    self._step_up()
+                return ts_iso, payload, self.mime
+            if not self._step_down():
+                break
+        # best effort: smallest we produced this round
+        return ts_iso, payload, self.mime
+
+    def settings(self) -> Dict[str, float]:
+        return {"quality": self.QUALITIES[self._qi], "scale": self.SCALES[self._si]}
+
+
+_BACKENDS: Dict[str, Callable[..., Encoder]] = {
+    "jpeg": lambda **kw: ImageEncoder("jpeg", **kw),
+    "jpeg-optimize": lambda **kw: ImageEncoder("jpeg", optimize=True, **kw),
+    "jpeg-half": lambda **kw: ImageEncoder("jpeg", scale=0.5, **kw),
+    "webp": lambda **kw: ImageEncoder("webp", **kw),
+    "webp-half": lambda **kw: ImageEncoder("webp", scale=0.5, **kw),
+    "png": lambda **kw: ImageEncoder("png", **kw),
+    "adaptive": lambda **kw: AdaptiveEncoder(**kw),
+    "adaptive-webp": lambda **kw: AdaptiveEncoder(fmt="webp", **kw),
+}
+
+
+def available_encoders():
+    return sorted(_BACKENDS)
+
+
+def make_encoder(name: str = DEFAULT_ENCODER, **options) -> Encoder:
+    """Build an encoder backend by name (see available_encoders())."""
+    try:
+        factory = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown encoder {name!r}; choose from {', '.join(available_encoders())}")
+    return factory(**options)
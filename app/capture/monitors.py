@@ -0,0 +1,131 @@
+# app/capture/monitors.py
+"""
+Multi-monitor screen capture backed by one long-lived `mss` instance.
+
+Modes (SCREENSHOT_MONITORS env or constructor arg):
+    primary     only the primary monitor (previous behaviour)
+    stitched    one image covering the whole virtual desktop (all monitors)
+    individual  one frame per monitor
+
+In individual mode the primary monitor is captured every tick, while
+secondary monitors that keep coming back unchanged are sampled less often:
+each consecutive static sample doubles the skip interval up to
+`max_skip_ticks`; any change resets it.
+
+The `mss` handle is created lazily and must be used from a single thread,
+which is the pipeline's capture worker. `mss` reads the monitor layout once
+per handle, so the handle is re-opened when a grab fails (a screen was
+unplugged) and every `layout_check_seconds` (SCREENSHOT_LAYOUT_CHECK_SECONDS,
+default 120) to pick up screens that were added or re-arranged. A changed
+layout resets the per-monitor schedules.
+"""
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from app.capture.dedup import frame_fingerprint, changed_fraction
+
+MODE_PRIMARY = "primary"
+MODE_STITCHED = "stitched"
+MODE_INDIVIDUAL = "individual"
+DEFAULT_MODE = os.getenv("SCREENSHOT_MONITORS", MODE_PRIMARY)
+DEFAULT_LAYOUT_CHECK_SECONDS = float(os.getenv("SCREENSHOT_LAYOUT_CHECK_SECONDS", "120"))
+
+# (monitor_index, (captured_at_iso, (w, h), rgb))
+MonitorFrame = Tuple[int, Tuple[str, Tuple[int, int], bytes]]
+
+
+class _MonitorSchedule:
+    __slots__ = ("fingerprint", "skip", "countdown")
+
+    def __init__(self):
+        self.fingerprint = None
+        self.skip = 0       # ticks to skip after each sample
+        self.countdown = 0  # ticks left before next sample
+
+
+class MonitorCapture:
+    """Callable capture source for CapturePipeline; returns a list of MonitorFrames."""
+
+    def __init__(self, mode: str = DEFAULT_MODE, max_skip_ticks: int = 8, static_threshold: float = 0.01,
+                 layout_check_seconds: float = DEFAULT_LAYOUT_CHECK_SECONDS):
+        if mode not in (MODE_PRIMARY, MODE_STITCHED, MODE_INDIVIDUAL):
+            raise ValueError(f"unknown capture mode: {mode!r}")
+        self.mode = mode
+        self.max_skip_ticks = max_skip_ticks
+        self.static_threshold = static_threshold
+        self.layout_check_seconds = layout_check_seconds
+        self._sct = None
+        self._opened_at = 0.0
+        self._layout: List[Dict[str, int]] = []
+        self._schedule: Dict[int, _MonitorSchedule] = {}
+
+    def _mss(self):
+        if self._sct is None:
+            from mss import mss
+            self._sct = mss()
+            self._opened_at = time.monotonic()
+            layout = [dict(m) for m in self._sct.monitors]
+            if self._layout and layout != self._layout:
+                print(f"[⚠] Monitor layout changed, now {len(layout) - 1} screen(s)")
+                self._schedule.clear()
+            self._layout = layout
+        return self._sct
+
+    def _grab_once(self, index: int) -> Tuple[str, Tuple[int, int], bytes]:
+        sct = self._mss()
+        ts_iso = datetime.now(timezone.utc).isoformat()
+        sct_img = sct.grab(sct.monitors[index])
+        return ts_iso, sct_img.size, sct_img.rgb
+
+    def _grab(self, index: int) -> Tuple[str, Tuple[int, int], bytes]:
+        try:
+            return self._grab_once(index)
+        except Exception as e:
+            # screen unplugged / re-docked: re-read the layout and try once more
+            print(f"[⚠] Screen grab failed ({e}), re-reading the monitor layout")
+            self.close()
+            return self._grab_once(index)
+
+    def __call__(self, _tick: Any = None) -> List[MonitorFrame]:
+        if self._sct is not None and time.monotonic() - self._opened_at >= self.layout_check_seconds:
+            self.close()  # re-read the layout before this tick's grabs
+        if self.mode == MODE_PRIMARY:
+            return [(1, self._grab(1))]
+        if self.mode == MODE_STITCHED:
+            # monitors[0] is the bounding box of every attached screen
+            return [(0, self._grab(0))]
+
+        frames: List[MonitorFrame] = []
+        for index in range(1, len(self._mss().monitors)):
+            sched = self._schedule.setdefault(index, _MonitorSchedule())
+            if index != 1 and sched.countdown > 0:
+                sched.countdown -= 1
+                continue
+            try:
+                frame = self._grab(index)
+            except IndexError:
+                break  # the re-read layout has fewer screens
+            if index != 1:
+                self._reschedule(sched, frame)
+            frames.append((index, frame))
+        return frames
+
+    def _reschedule(self, sched: _MonitorSchedule, frame: Tuple[str, Tuple[int, int], bytes]) -> None:
+        fp = frame_fingerprint(frame[1], frame[2])
+        static = sched.fingerprint is not None and changed_fraction(fp, sched.fingerprint) <= self.static_threshold
+        sched.fingerprint = fp
+        sched.skip = min(self.max_skip_ticks, max(1, sched.skip * 2)) if static else 0
+        sched.countdown = sched.skip
+
+    def close(self) -> None:
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            finally:
+                self._sct = None
+
+    def stats(self) -> Dict[int, int]:
+        """Current skip interval (ticks) per secondary monitor."""
+        return {index: s.skip for index, s in self._schedule.items() if index != 1}
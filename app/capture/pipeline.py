@@ -0,0 +1,261 @@
+# app/capture/pipeline.py
+"""
+Staged screenshot pipeline: capture -> encode -> store.
+
+Each stage runs on one dedicated worker thread and stages are connected by
+bounded queues, so a slow backend can never cause threads or frames to pile up:
+
+  - trigger() coalesces: if a capture is already pending, the tick is dropped.
+  - when a downstream queue is full, the *oldest* queued item is dropped in
+    favour of the newest one (latest evidence wins).
+
+A capture tick may yield several frames (one per monitor, see
+app.capture.monitors); the encode stage encodes them in parallel, keeping
+per-monitor dedup/encoder state. The final stage hands encoded frames to the
+on-disk spool; the SpoolDrainer owns the actual network upload.
+
+Usage:
+    pipeline = CapturePipeline(sink=get_spool().put)
+    pipeline.start()
+    pipeline.trigger()          # from the QTimer, never blocks
+    pipeline.stats()            # queue depths, latencies, drop counters
+    pipeline.stop()             # on logout / window close
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.api.screenshot_client import DELTA_MIME, UNCHANGED_MARKER_MIME
+from app.capture.encoders import Encoder, EncodedFrame, make_encoder
+from app.capture.monitors import MonitorCapture, MonitorFrame
+
+_STOP = object()
+
+# sink(payload, captured_at_iso, mime, monitor)
+Sink = Callable[[bytes, str, str, int], None]
+
+
+class _Stage:
+    """One worker thread reading from a bounded input queue."""
+
+    def __init__(self, name: str, fn: Callable[[Any], Any], maxsize: int,
+                 downstream: Optional["_Stage"] = None, on_exit: Optional[Callable[[], None]] = None,
+                 on_drop: Optional[Callable[[Any], None]] = None):
+        self.name = name
+        self.fn = fn
+        self.on_exit = on_exit
+        self.on_drop = on_drop  # called with every item that is discarded unprocessed
+        self.downstream = downstream
+        self.q: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        # counters are bumped by producers (offer) and the worker, read by stats()
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self._thread = threading.Thread(target=self._run, name=f"capture-{name}", daemon=True)
+
+    def offer(self, item: Any, coalesce: bool = False) -> None:
+        """
+        Enqueue without blocking. With coalesce=True a full queue drops the new
+        item; otherwise the oldest queued item is evicted to make room.
+        """
+        while True:
+            try:
+                self.q.put_nowait(item)
+                return
+            except queue.Full:
+                if coalesce:
+                    self._dropped(item)
+                    return
+                try:
+                    self._dropped(self.q.get_nowait())
+                except queue.Empty:
+                    pass
+
+    def _dropped(self, item: Any) -> None:
+        with self._lock:
+            self.dropped += 1
+        self._notify_drop(item)
+
+    def _notify_drop(self, item: Any) -> None:
+        if self.on_drop is None or item is _STOP:
+            return
+        try:
+            self.on_drop(item)
+        except Exception as e:
+            print(f"[⚠] Screenshot {self.name} drop handler failed: {e}")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float) -> None:
+        # let queued work drain first; evict only if the stage is wedged
+        try:
+            self.q.put(_STOP, timeout=timeout)
+            self._thread.join(timeout)
+            return
+        except queue.Full:
+            pass
+        while True:
+            try:
+                self.q.put_nowait(_STOP)
+                break
+            except queue.Full:
+                try:
+                    self._dropped(self.q.get_nowait())
+                except queue.Empty:
+                    pass
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            self._loop()
+        finally:
+            if self.on_exit is not None:
+                self.on_exit()
+
+    def _loop(self) -> None:
+        while True:
+            item = self.q.get()
+            if item is _STOP:
+                return
+            t0 = time.perf_counter()
+            try:
+                out = self.fn(item)
+            except Exception as e:
+                with self._lock:
+                    self.errors += 1
+                print(f"[❌] Screenshot {self.name} stage failed: {e}")
+                self._notify_drop(item)
+                continue
+            finally:
+                # release the (possibly large) frame before blocking on the next get()
+                item = None
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            with self._lock:
+                self.last_ms = elapsed_ms
+                self.avg_ms = elapsed_ms if not self.processed else (0.8 * self.avg_ms + 0.2 * elapsed_ms)
+                self.processed += 1
+            if out is not None and self.downstream is not None:
+                self.downstream.offer(out)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self.q.qsize(),
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "last_ms": round(self.last_ms, 2),
+                "avg_ms": round(self.avg_ms, 2),
+            }
+
+
+class CapturePipeline:
+    """
+    Bounded capture/encode/store pipeline with one worker per stage.
+
+    `encoder_factory` / `deduper_factory` are called once per monitor, so
+    stateful encoders (DeltaEncoder) and dedupers track each screen separately.
+    Frames a deduper reports as unchanged skip encoding and are stored as a
+    small "unchanged since <ts>" marker instead.
+
+    A tile delta that never reaches the spool breaks its monitor's chain, so a
+    dropped delta makes that monitor's next frame a keyframe. The spool
+    reports its own drops through frame_dropped() (see add_drop_listener).
+    """
+
+    def __init__(self, sink: Sink, capture_fn: Optional[Callable[[Any], List[MonitorFrame]]] = None,
+                 encoder_factory: Callable[[], Encoder] = make_encoder,
+                 deduper_factory: Optional[Callable[[], Any]] = None,
+                 queue_size: int = 1, encode_workers: int = 4):
+        self._capture_fn = capture_fn or MonitorCapture()
+        self._encoder_factory = encoder_factory
+        self._deduper_factory = deduper_factory
+        self._encoders: Dict[int, Encoder] = {}
+        self._dedupers: Dict[int, Any] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max(1, encode_workers), thread_name_prefix="capture-encode")
+        self.frames_unchanged = 0
+        self._counter_lock = threading.Lock()  # frames_unchanged is bumped from pool threads
+
+        close = getattr(self._capture_fn, "close", None)
+        self._store = _Stage("store", lambda batch: self._store_batch(sink, batch), maxsize=queue_size + 1,
+                             on_drop=self._store_dropped)
+        self._encode = _Stage("encode", self._encode_batch, maxsize=queue_size, downstream=self._store)
+        self._capture = _Stage("capture", self._capture_fn, maxsize=1, downstream=self._encode, on_exit=close)
+        self._stages = (self._capture, self._encode, self._store)
+        self._running = False
+
+    def _encode_one(self, item: MonitorFrame) -> Tuple[int, EncodedFrame]:
+        monitor, frame = item
+        if self._deduper_factory is not None:
+            since = self._dedupers[monitor].check(*frame)
+            if since:
+                with self._counter_lock:
+                    self.frames_unchanged += 1
+                return monitor, (frame[0], since.encode("utf-8"), UNCHANGED_MARKER_MIME)
+        return monitor, self._encoders[monitor](frame)
+
+    def _encode_batch(self, batch: List[MonitorFrame]) -> List[Tuple[int, EncodedFrame]]:
+        # per-monitor state is created here, on the single encode-stage thread
+        for monitor, _ in batch:
+            if monitor not in self._encoders:
+                self._encoders[monitor] = self._encoder_factory()
+                if self._deduper_factory is not None:
+                    self._dedupers[monitor] = self._deduper_factory()
+        if len(batch) == 1:
+            return [self._encode_one(batch[0])]
+        # each monitor has its own encoder/deduper, so frames encode independently
+        return list(self._pool.map(self._encode_one, batch))
+
+    def _store_dropped(self, batch: List[Tuple[int, EncodedFrame]]) -> None:
+        for monitor, (_ts, _payload, mime) in batch:
+            self.frame_dropped(monitor, mime)
+
+    def frame_dropped(self, monitor: int, mime: str) -> None:
+        """An encoded frame was discarded before upload: restart its delta chain."""
+        if mime != DELTA_MIME:
+            return
+        force = getattr(self._encoders.get(monitor), "force_keyframe", None)
+        if force is not None:
+            force()
+
+    @staticmethod
+    def _store_batch(sink: Sink, batch: List[Tuple[int, EncodedFrame]]) -> None:
+        for monitor, (ts_iso, payload, mime) in batch:
+            sink(payload, ts_iso, mime, monitor)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        for stage in self._stages:
+            stage.start()
+        self._running = True
+
+    def trigger(self) -> None:
+        """Request a capture; coalesced if one is already pending. Never blocks."""
+        if self._running:
+            self._capture.offer(time.monotonic(), coalesce=True)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop stages in order, letting in-flight frames drain where possible."""
+        if not self._running:
+            return
+        self._running = False
+        per_stage = timeout / len(self._stages)
+        for stage in self._stages:
+            stage.stop(per_stage)
+        self._pool.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-stage queue depth, processed/dropped/error counters and latency (ms)."""
+        out: Dict[str, Any] = {stage.name: stage.stats() for stage in self._stages}
+        with self._counter_lock:
+            out["frames_unchanged"] = self.frames_unchanged
+        if hasattr(self._capture_fn, "stats"):
+            out["monitor_skip_ticks"] = self._capture_fn.stats()
+        return out
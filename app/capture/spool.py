@@ -0,0 +1,429 @@
+# app/capture/spool.py
+"""
+Durable on-disk spool for screenshots awaiting upload.
+
+Captures are written into a SQLite journal (WAL mode) under the app data dir,
+and a background `SpoolDrainer` uploads them oldest-first in batches. Nothing
+is lost on network outages or restarts; disk usage is bounded by evicting the
+oldest frames once `max_bytes` is exceeded.
+
+Every frame records the user it was captured for, and the drainer only
+uploads the logged-in user's frames: after a logout, another account never
+sends the previous user's screenshots with its own token. They stay queued
+until that user logs in again.
+
+Usage:
+    spool = get_spool()
+    spool.put(jpeg_bytes, captured_at_iso, owner=email)   # fast, never touches network
+
+    drainer = SpoolDrainer(spool)
+    drainer.start()
+    ...
+    drainer.stop()
+"""
+import sqlite3
+import threading
+import random
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+from app.utils.paths import app_data_dir
+from app.utils.state import AppState
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200 MB of pending screenshots
+DEFAULT_MAX_ATTEMPTS = 10              # drop a frame after the backend rejected it this many times
+# 4xx answers that say "try again later" rather than "this frame is bad"
+_TRANSIENT_4XX = (401, 408, 429)
+# what the batch endpoint accepts; markers and deltas go through upload_frame()
+_IMAGE_MIMES = ("image/jpeg", "image/webp", "image/png")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frames (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    captured_at TEXT    NOT NULL,
+    mime        TEXT    NOT NULL,
+    size        INTEGER NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    payload     BLOB    NOT NULL,
+    monitor     INTEGER NOT NULL DEFAULT 1,
+    owner       TEXT
+)
+"""
+
+# (id, captured_at, mime, monitor, size) -- payloads are loaded separately via load()
+SpoolItem = Tuple[int, str, str, int, int]
+# listener(monitor, mime) for a frame deleted without being uploaded
+DropListener = Callable[[int, str], None]
+
+
+class ScreenshotSpool:
+    """Thread-safe, size-bounded SQLite spool of pending screenshot uploads."""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path) if path else app_data_dir() / "screenshot_spool.sqlite3"
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._has_items = threading.Event()
+        self._drop_listeners: List[DropListener] = []
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+        cols = {row[1] for row in self._db.execute("PRAGMA table_info(frames)")}
+        if "monitor" not in cols:
+            # spool files written before multi-monitor support
+            self._db.execute("ALTER TABLE frames ADD COLUMN monitor INTEGER NOT NULL DEFAULT 1")
+        if "owner" not in cols:
+            # spool files written before frames were tied to a user: they can only
+            # belong to whoever is still stored as logged in
+            self._db.execute("ALTER TABLE frames ADD COLUMN owner TEXT")
+            self._db.execute("UPDATE frames SET owner = ?", (AppState.get_user_email(),))
+        self._db.execute("CREATE INDEX IF NOT EXISTS frames_owner ON frames (owner, id)")
+        if self.count():
+            self._has_items.set()
+
+    # -------------------------
+    # Producer side
+    # -------------------------
+    def put(self, payload: bytes, captured_at_iso: str, mime: str = "image/jpeg", monitor: int = 1,
+            owner: Optional[str] = None) -> None:
+        """
+        Append a frame for `owner` (default: the logged-in user); evicts oldest
+        frames if the spool is over budget.
+        """
+        if owner is None:
+            owner = AppState.get_user_email()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO frames (captured_at, mime, size, payload, monitor, owner) VALUES (?, ?, ?, ?, ?, ?)",
+                (captured_at_iso, mime, len(payload), sqlite3.Binary(payload), monitor, owner),
+            )
+            dropped = self._evict_locked()
+        self._has_items.set()
+        self._notify_dropped(dropped)
+
+    def _evict_locked(self) -> List[Tuple[int, str]]:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM frames").fetchone()[0]
+        if total <= self.max_bytes:
+            return []
+        # walk oldest-first until we're back under budget
+        drop_ids, dropped = [], []
+        for frame_id, size, monitor, mime in self._db.execute("SELECT id, size, monitor, mime FROM frames ORDER BY id"):
+            drop_ids.append(frame_id)
+            dropped.append((monitor, mime))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._db.executemany("DELETE FROM frames WHERE id = ?", [(i,) for i in drop_ids])
+        print(f"[⚠] Spool over budget, evicted {len(drop_ids)} oldest screenshot(s)")
+        return dropped
+
+    # -------------------------
+    # Drop notifications
+    # -------------------------
+    def add_drop_listener(self, listener: DropListener) -> None:
+        """
+        Call `listener(monitor, mime)` for every frame deleted without being
+        uploaded (budget eviction, too many rejections), e.g. so a delta
+        encoder can restart its chain with a keyframe. Runs on the thread that
+        dropped the frame.
+        """
+        with self._lock:
+            if listener not in self._drop_listeners:
+                self._drop_listeners.append(listener)
+
+    def remove_drop_listener(self, listener: DropListener) -> None:
+        with self._lock:
+            if listener in self._drop_listeners:
+                self._drop_listeners.remove(listener)
+
+    def _notify_dropped(self, dropped: List[Tuple[int, str]]) -> None:
+        if not dropped:
+            return
+        with self._lock:
+            listeners = list(self._drop_listeners)
+        for listener in listeners:
+            for monitor, mime in dropped:
+                try:
+                    listener(monitor, mime)
+                except Exception as e:
+                    print(f"[⚠] Spool drop listener failed: {e}")
+
+    # -------------------------
+    # Consumer side
+    # -------------------------
+    def peek_batch(self, limit: int, owner: Optional[str] = None) -> List[SpoolItem]:
+        """
+        Return metadata for up to `limit` oldest frames of `owner` (default: the
+        logged-in user) without removing them.
+        """
+        if owner is None:
+            owner = AppState.get_user_email()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id, captured_at, mime, monitor, size FROM frames WHERE owner IS ? ORDER BY id LIMIT ?",
+                (owner, limit),
+            ).fetchall()
+        if not rows:
+            self._has_items.clear()
+        return [tuple(r) for r in rows]
+
+    def load(self, frame_id: int) -> Optional[bytes]:
+        """Payload for one frame, or None if it was evicted meanwhile."""
+        with self._lock:
+            row = self._db.execute("SELECT payload FROM frames WHERE id = ?", (frame_id,)).fetchone()
+        return row[0] if row else None
+
+    def ack(self, frame_id: int) -> None:
+        """Remove a frame after successful upload."""
+        with self._lock:
+            self._db.execute("DELETE FROM frames WHERE id = ?", (frame_id,))
+
+    def nack(self, frame_id: int, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> None:
+        """
+        Record a rejected upload; drop the frame once it reaches max_attempts.
+        Only for definitive backend rejections (see is_rejection()): outages
+        must never count, or a long one would delete the frames it spooled.
+        """
+        with self._lock:
+            self._db.execute("UPDATE frames SET attempts = attempts + 1 WHERE id = ?", (frame_id,))
+            row = self._db.execute(
+                "SELECT monitor, mime FROM frames WHERE id = ? AND attempts >= ?", (frame_id, max_attempts)
+            ).fetchone()
+            if row is not None:
+                self._db.execute("DELETE FROM frames WHERE id = ?", (frame_id,))
+        if row is not None:
+            print(f"[❌] Dropped screenshot {frame_id} after {max_attempts} rejected uploads")
+            self._notify_dropped([tuple(row)])
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM frames").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM frames").fetchone()[0]
+
+    def wait_for_items(self, timeout: float) -> bool:
+        return self._has_items.wait(timeout)
+
+    def wake(self) -> None:
+        """Wake any thread blocked in wait_for_items()."""
+        self._has_items.set()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_spool: Optional[ScreenshotSpool] = None
+_spool_lock = threading.Lock()
+
+
+def get_spool() -> ScreenshotSpool:
+    """Process-wide spool instance (lazily opened)."""
+    global _spool
+    with _spool_lock:
+        if _spool is None:
+            _spool = ScreenshotSpool()
+        return _spool
+
+
+# upload(payload, captured_at_iso, mime, monitor) -> {"status": "success"|"error", ...}
+Uploader = Callable[[bytes, str, str, int], Dict[str, Any]]
+# batch_upload([{"image", "captured_at", "mime", "monitor"}, ...]) -> {"results": [...]}
+BatchUploader = Callable[[List[Dict[str, Any]]], Dict[str, Any]]
+
+
+def is_rejection(res: Dict[str, Any]) -> bool:
+    """
+    True if an upload result is a definitive backend rejection of the frame
+    (a 4xx other than 401/408/429, or an item the backend marks non-retryable).
+    Network errors, timeouts, 5xx and an open circuit breaker are not.
+    """
+    status = res.get("http_status")
+    if status is not None:
+        return 400 <= status < 500 and status not in _TRANSIENT_4XX
+    return res.get("retryable") is False
+
+
+def _default_uploader(payload: bytes, captured_at_iso: str, mime: str, monitor: int) -> Dict[str, Any]:
+    from app.api.screenshot_client import upload_frame
+    return upload_frame(payload, captured_at_iso, mime, monitor)
+
+
+def _default_batch_uploader(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    from app.api.screenshot_client import upload_screenshots_batch
+    # the drainer owns retry/backoff, so a single attempt here
+    return upload_screenshots_batch(items, retries=0)
+
+
+class SpoolDrainer:
+    """
+    Background thread that uploads spooled frames oldest-first.
+
+    When several images are pending (e.g. after an outage) they are sent through
+    the batch endpoint, up to `batch_size` frames / `max_batch_bytes` per request;
+    a lone frame, unchanged markers and tile deltas use the single-upload path. On failure it backs off
+    exponentially (with jitter) up to `max_backoff` seconds; a success resets
+    the backoff. Only frames the backend rejects count towards the spool's
+    attempt limit: during an outage frames simply wait. Pauses while logged
+    out and resumes as soon as a token is stored; only the logged-in user's
+    frames are uploaded.
+    """
+
+    def __init__(self, spool: ScreenshotSpool, uploader: Optional[Uploader] = None,
+                 batch_uploader: Optional[BatchUploader] = None,
+                 batch_size: int = 10, max_batch_bytes: int = 8 * 1024 * 1024,
+                 base_backoff: float = 2.0, max_backoff: float = 300.0,
+                 idle_poll: float = 30.0):
+        self.spool = spool
+        self.uploader = uploader or _default_uploader
+        self.batch_uploader = batch_uploader or _default_batch_uploader
+        self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.idle_poll = idle_poll
+        self._backoff = 0.0
+        self._stop = threading.Event()
+        self._authed = threading.Event()   # set when a login stores a token
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        AppState.add_auth_listener(self._on_auth_changed)
+        self._thread = threading.Thread(target=self._run, name="spool-drainer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        AppState.remove_auth_listener(self._on_auth_changed)
+        self._stop.set()
+        self._authed.set()
+        self.spool.wake()
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _sleep(self, seconds: float) -> None:
+        self._stop.wait(seconds)
+
+    def _on_auth_changed(self, auth) -> None:
+        if auth.get("access_token"):
+            self._authed.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if not AppState.get_access_token():
+                # logged out: resume as soon as a login stores a token
+                self._authed.wait(self.idle_poll)
+                self._authed.clear()
+                continue
+
+            # frames of whoever is logged in now; another user's stay queued
+            batch = self.spool.peek_batch(self.batch_size, AppState.get_user_email())
+            if not batch:
+                self.spool.wait_for_items(self.idle_poll)
+                continue
+
+            failed = self._drain_batch(batch)
+            if failed:
+                self._backoff = min(self.max_backoff, max(self.base_backoff, self._backoff * 2))
+                self._sleep(self._backoff * random.uniform(0.5, 1.0))
+            else:
+                self._backoff = 0.0
+
+    def _drain_batch(self, batch: List[SpoolItem]) -> bool:
+        """
+        Upload a batch oldest-first; returns True if anything failed.
+
+        Runs of plain images go through the batch endpoint. Unchanged markers
+        and tile deltas have their own endpoints, so they are sent one by one
+        via the uploader (in order: a delta must follow its base frame). The
+        first failure stops the round, and the rest waits for the next one.
+        """
+        if len(batch) == 1:
+            return self._drain_one(batch[0])
+
+        run: List[SpoolItem] = []
+        run_bytes = 0
+        for item in batch:
+            if self._stop.is_set():
+                return False
+            if item[2] in _IMAGE_MIMES:
+                if run and run_bytes + item[4] > self.max_batch_bytes:
+                    break  # request is full; the rest goes in the next round
+                run.append(item)
+                run_bytes += item[4]
+                continue
+            if run:
+                if self._drain_images(run):
+                    return True
+                run, run_bytes = [], 0
+            if self._drain_one(item):
+                return True
+        return self._drain_images(run) if run else False
+
+    def _drain_images(self, run: List[SpoolItem]) -> bool:
+        """Upload consecutive image frames in one batch request; True if any failed."""
+        if len(run) == 1:
+            return self._drain_one(run[0])
+
+        items, meta = [], []
+        for frame_id, captured_at, mime, monitor, _size in run:
+            payload = self.spool.load(frame_id)
+            if payload is None:
+                continue  # evicted meanwhile
+            items.append({"image": payload, "captured_at": captured_at, "mime": mime, "monitor": monitor})
+            meta.append(frame_id)
+        if not items:
+            return False
+
+        try:
+            res = self.batch_uploader(items)
+        except Exception as e:
+            res = {"status": "error", "message": str(e)}
+        items = None
+        results = res.get("results") or [{"status": "error", "message": res.get("message")}] * len(meta)
+
+        failed = False
+        for frame_id, r in zip(meta, results):
+            if r and r.get("status") == "success":
+                self.spool.ack(frame_id)
+                continue
+            if r and is_rejection(r):
+                self.spool.nack(frame_id)
+            failed = True
+        ok = sum(1 for r in results if r and r.get("status") == "success")
+        if failed:
+            print(f"[⚠] Uploaded {ok}/{len(meta)} spooled screenshot(s) in one batch (rest will retry)")
+        else:
+            print(f"[✅] Uploaded {ok}/{len(meta)} spooled screenshot(s) in one batch")
+        return failed
+
+    def _drain_one(self, item: SpoolItem) -> bool:
+        frame_id, captured_at, mime, monitor, _size = item
+        if self._stop.is_set():
+            return False
+        # only one encoded frame is held in memory at a time
+        payload = self.spool.load(frame_id)
+        if payload is None:
+            return False
+        try:
+            res = self.uploader(payload, captured_at, mime, monitor)
+        except Exception as e:
+            res = {"status": "error", "message": str(e)}
+        payload = None
+        if res.get("status") == "success":
+            self.spool.ack(frame_id)
+            print(f"[✅] Uploaded screenshot: {res.get('image_url')}")
+            return False
+        if is_rejection(res):
+            self.spool.nack(frame_id)
+            print(f"[⚠] Upload rejected (HTTP {res.get('http_status')}): {res.get('message')}")
+        else:
+            print(f"[⚠] Upload failed (will retry): {res.get('message')}")
+        return True
@@ -8,24 +8,67 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# Startup profiling (PYTRACK_PROFILE=<report.json> or --profile-startup [report.json]);
+# switched on before the imports below so their cost shows up in the report
+from app.utils import startup_profile
+startup_profile.configure(sys.argv)
+
 # Load .env early so other modules can read environment variables
 from dotenv import load_dotenv
 load_dotenv(dotenv_path=ROOT / ".env")
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
-from app.ui.login_window import LoginWindow
-from app.ui.dashboard_window import DashboardWindow
 from app.utils.state import AppState
-from app.api.auth_client import fetch_user_profile
+
+# Everything else (API clients + requests, both windows, QtCharts, numpy via the
+# capture pipeline) is imported on demand so the splash paints first.
+
+
+async def _load_session(api):
+    """API loop: /user/me with the stored token, overlapped with the first task sync."""
+    with startup_profile.phase("profile_fetch"):
+        return await api.load_session()
 
 
 class AppController:
     def __init__(self):
-        self.app = QApplication(sys.argv)
+        with startup_profile.phase("qapplication"):
+            self.app = QApplication(sys.argv)
+        startup_profile.watch_paints(self.app)
+        # drop pooled keep-alive connections cleanly on exit
+        self.app.aboutToQuit.connect(self._shutdown)
+        self.splash = None
         self.login_window = None
         self.dashboard_window = None
+        self._prebuilt_dashboard = None   # built while the profile check runs; not started yet
+
+    @staticmethod
+    def _shutdown():
+        # only tear down what this run actually loaded
+        if "app.api.async_client" in sys.modules:
+            from app.api.async_client import shutdown_async_api
+            shutdown_async_api()
+        if "app.api._http" in sys.modules:
+            from app.api._http import close_pool
+            close_pool()
+
+    @staticmethod
+    def _reset_task_store():
+        # the prebuilt dashboard seeded the shared store from the stored user's cache
+        if "app.ui.task_store" in sys.modules:
+            from app.ui.task_store import get_task_store
+            get_task_store().invalidate()
+
+    def _close_splash(self):
+        if self.splash:
+            self.splash.close()
+            self.splash = None
 
     def show_login(self):
+        with startup_profile.phase("import:login_window"):
+            from app.ui.login_window import LoginWindow
+
         # Close dashboard if open
         try:
             if self.dashboard_window:
@@ -33,10 +76,13 @@ class AppController:
         except Exception:
             pass
         self.dashboard_window = None
+        self._discard_prebuilt_dashboard()
 
         # Create and show login window
-        self.login_window = LoginWindow(self.show_dashboard)
+        with startup_profile.phase("login_build"):
+            self.login_window = LoginWindow(self.show_dashboard)
         self.login_window.show()
+        self._close_splash()
 
     def show_dashboard(self):
         # Close login window if open
@@ -47,58 +93,119 @@ class AppController:
             pass
         self.login_window = None
 
-        # Create and show dashboard window
-        self.dashboard_window = DashboardWindow(self.show_login)
-        self.dashboard_window.show()
+        # Create (or take the one prebuilt during startup) and show dashboard window
+        window, self._prebuilt_dashboard = self._prebuilt_dashboard, None
+        if window is None:
+            from app.ui.dashboard_window import DashboardWindow
+            with startup_profile.phase("dashboard_build"):
+                window = DashboardWindow(self.show_login)
+        self.dashboard_window = window
+        window.show()
+        with startup_profile.phase("dashboard_start"):
+            window.start()
+        self._close_splash()
+
+    def _discard_prebuilt_dashboard(self):
+        if self._prebuilt_dashboard is not None:
+            self._prebuilt_dashboard.close()
+            self._prebuilt_dashboard.deleteLater()
+            self._prebuilt_dashboard = None
+            self._reset_task_store()
 
     def run(self):
         """
-        App startup logic:
-          - If there's an access token persisted, try to fetch profile.
-            - If profile fetch succeeds, go straight to dashboard.
-            - Otherwise, show login.
+        App startup logic (staged, so something is on screen right away):
+          1. splash window (nothing heavy imported yet)
+          2. if there's an access token persisted, fetch the profile and sync the
+             tasks concurrently on the async API loop, while the GUI thread imports
+             and builds the dashboard (hidden; no capture/polling until it is shown)
+          3. if profile fetch succeeds, hand the tasks to the store and show the
+             dashboard; otherwise show login.
         """
-        started = False
+        with startup_profile.phase("splash"):
+            from app.ui.splash import SplashWindow
+
+            self.splash = SplashWindow()
+            self.splash.show()
+        # stage 2 runs from the event loop, after the splash has painted
+        QTimer.singleShot(0, self._start)
+        sys.exit(self.app.exec())
+
+    def _start(self):
+        startup_profile.mark("event_loop")
         try:
             token = AppState.get_access_token()
-            if token:
-                try:
-                    prof = fetch_user_profile()
-                    # fetch_user_profile returns a dict {"status":"success","profile":...} or error form
-                    if prof.get("status") == "success":
-                        # Normalize the profile shape to get email/id/role where possible
-                        profile_data = prof.get("profile") or {}
-                        user_obj = profile_data.get("user") if isinstance(profile_data, dict) else None
-                        if user_obj:
-                            user_id = user_obj.get("id") or user_obj.get("user_id")
-                            email = user_obj.get("email") or AppState.get_user_email()
-                            role = user_obj.get("role") or profile_data.get("role")
-                        else:
-                            user_id = profile_data.get("id") or None
-                            email = profile_data.get("email") or AppState.get_user_email()
-                            role = profile_data.get("role") if isinstance(profile_data, dict) else None
-
-                        AppState.set_user(email, role, token, user_id)
-                        self.show_dashboard()
-                        started = True
-                    else:
-                        # token invalid or fetch failed -> clear persisted auth and show login
-                        AppState.clear_auth()
-                        AppState.clear()
-                except Exception:
-                    # if profile fetch throws, treat as invalid token and show login
-                    AppState.clear_auth()
-                    AppState.clear()
-                    # fallthrough to show_login
-                    traceback.print_exc()
+            if not token:
+                self.show_login()
+                return
+
+            with startup_profile.phase("import:async_client"):
+                from app.api.async_client import get_async_api
+                from app.ui.task_store import get_task_store
+            self.splash.set_status("Checking your session…")
+            # seed tasks from disk first, so the overlapped sync is conditional (usually a 304)
+            store = get_task_store()
+            store.load_cached()
+            on_tasks = store.result_handler()
+            api = get_async_api()
+            api.submit(_load_session(api), lambda res, err: self._on_session(res, err, token, on_tasks))
+            try:
+                with startup_profile.phase("import:dashboard_window"):
+                    from app.ui.dashboard_window import DashboardWindow
+                with startup_profile.phase("dashboard_build"):
+                    self._prebuilt_dashboard = DashboardWindow(self.show_login)
+            except Exception:
+                # not fatal: show_dashboard() builds it again (and reports the error there)
+                traceback.print_exc()
         except Exception:
             # defensive: any error fall back to login
             traceback.print_exc()
-
-        if not started:
             self.show_login()
 
-        sys.exit(self.app.exec())
+    def _on_session(self, res, err, token, on_tasks):
+        if err is not None:
+            self._on_profile_error(str(err))
+            return
+        if (res["profile"] or {}).get("status") == "success":
+            # before the dashboard starts, so its first refresh finds fresh tasks
+            on_tasks(res["tasks"])
+        self._on_profile(res["profile"], token)
+
+    def _on_profile(self, prof, token):
+        startup_profile.mark("profile_result")
+        try:
+            # fetch_user_profile returns a dict {"status":"success","profile":...} or error form
+            if prof.get("status") == "success":
+                # Normalize the profile shape to get email/id/role where possible
+                profile_data = prof.get("profile") or {}
+                user_obj = profile_data.get("user") if isinstance(profile_data, dict) else None
+                if user_obj:
+                    user_id = user_obj.get("id") or user_obj.get("user_id")
+                    email = user_obj.get("email") or AppState.get_user_email()
+                    role = user_obj.get("role") or profile_data.get("role")
+                else:
+                    user_id = profile_data.get("id") or None
+                    email = profile_data.get("email") or AppState.get_user_email()
+                    role = profile_data.get("role") if isinstance(profile_data, dict) else None
+
+                # the token may have been refreshed during the check
+                AppState.set_user(email, role, AppState.get_access_token() or token, user_id)
+                self.show_dashboard()
+                return
+        except Exception:
+            traceback.print_exc()
+        # token invalid or fetch failed -> clear persisted auth and show login
+        AppState.clear_auth()
+        AppState.clear()
+        self._reset_task_store()
+        self.show_login()
+
+    def _on_profile_error(self, _message):
+        # if profile fetch throws, treat as invalid token and show login
+        AppState.clear_auth()
+        AppState.clear()
+        self._reset_task_store()
+        self.show_login()
 
 
 if __name__ == "__main__":
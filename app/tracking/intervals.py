@@ -0,0 +1,143 @@
+# app/tracking/intervals.py
+"""
+Compact per-day interval storage for time tracking.
+
+A DayLog keeps one local day's intervals in three parallel typed arrays
+(start, end, slot) instead of a list of objects: 20 bytes per interval, cheap
+to append, and serialized as raw bytes. Slots index the day's own label table
+(task key + title); IDLE marks idle gaps.
+
+Usage:
+    log = DayLog("2026-10-17")
+    log.add(start_ts, end_ts, log.slot_for("task-42", "Write report"))
+    log.add(idle_start, idle_end, IDLE)
+    log.totals()                      # {slot: seconds}
+    log.segments(min_seconds=60)      # merged (slot, seconds) runs for charts
+"""
+import json
+from array import array
+from datetime import date, datetime, time as dtime, timedelta
+from typing import Dict, Iterator, List, Tuple
+
+IDLE = -1
+UNTRACKED = -2            # only produced by segments(): time between recorded intervals
+MERGE_GAP_SECONDS = 5.0   # back-to-back intervals of the same slot closer than this are merged
+
+
+def day_key(ts: float) -> str:
+    """Local calendar day of a timestamp, as YYYY-MM-DD."""
+    return datetime.fromtimestamp(ts).date().isoformat()
+
+
+def day_bounds(day: str) -> Tuple[float, float]:
+    """[start, end) timestamps of a local calendar day."""
+    d = date.fromisoformat(day)
+    start = datetime.combine(d, dtime())
+    return start.timestamp(), (start + timedelta(days=1)).timestamp()
+
+
+def split_by_day(start: float, end: float) -> Iterator[Tuple[str, float, float]]:
+    """Yield (day, start, end) pieces of an interval, cut at local midnight."""
+    while start < end:
+        day = day_key(start)
+        _day_start, day_end = day_bounds(day)
+        piece_end = min(end, day_end)
+        yield day, start, piece_end
+        start = piece_end
+
+
+class DayLog:
+    """One local day's intervals in parallel arrays (epoch seconds, slot index)."""
+
+    __slots__ = ("day", "starts", "ends", "slots", "labels", "_slot_of")
+
+    def __init__(self, day: str):
+        self.day = day
+        self.starts = array("d")
+        self.ends = array("d")
+        self.slots = array("i")
+        self.labels: List[Tuple[str, str]] = []   # slot -> (task key, title)
+        self._slot_of: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def slot_for(self, key: str, title: str) -> int:
+        """Slot of a task in this day's label table (the latest title wins)."""
+        slot = self._slot_of.get(key)
+        if slot is None:
+            slot = self._slot_of[key] = len(self.labels)
+            self.labels.append((key, title))
+        elif title and self.labels[slot][1] != title:
+            self.labels[slot] = (key, title)
+        return slot
+
+    def label(self, slot: int) -> Tuple[str, str]:
+        return self.labels[slot] if slot >= 0 else ("", "")
+
+    def add(self, start: float, end: float, slot: int) -> None:
+        """Append an interval (must not start before the previous one ends)."""
+        if end <= start:
+            return
+        n = len(self.starts)
+        if n and self.slots[n - 1] == slot and start - self.ends[n - 1] <= MERGE_GAP_SECONDS:
+            self.ends[n - 1] = max(self.ends[n - 1], end)
+            return
+        self.starts.append(start)
+        self.ends.append(end)
+        self.slots.append(slot)
+
+    def totals(self) -> Dict[int, float]:
+        """Seconds per slot (IDLE included)."""
+        out: Dict[int, float] = {}
+        for s, e, slot in zip(self.starts, self.ends, self.slots):
+            out[slot] = out.get(slot, 0.0) + (e - s)
+        return out
+
+    def segments(self, min_seconds: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Chronological (slot, seconds) runs: consecutive intervals of the same slot
+        merged, gaps between intervals reported as UNTRACKED, and runs shorter than
+        `min_seconds` folded into the previous run so a busy day stays readable.
+        """
+        runs: List[List] = []
+        prev_end = None
+        for s, e, slot in zip(self.starts, self.ends, self.slots):
+            if prev_end is not None and s - prev_end > MERGE_GAP_SECONDS:
+                _append_run(runs, UNTRACKED, s - prev_end, min_seconds)
+            _append_run(runs, slot, e - s, min_seconds)
+            prev_end = e
+        return [(slot, secs) for slot, secs in runs]
+
+    # -------------------------
+    # Serialization
+    # -------------------------
+    def to_row(self) -> Tuple[str, bytes, bytes, bytes, str]:
+        return (self.day, self.starts.tobytes(), self.ends.tobytes(), self.slots.tobytes(),
+                json.dumps(self.labels))
+
+    @classmethod
+    def from_row(cls, day: str, starts: bytes, ends: bytes, slots: bytes, labels: str) -> "DayLog":
+        log = cls(day)
+        log.starts.frombytes(starts)
+        log.ends.frombytes(ends)
+        log.slots.frombytes(slots)
+        log.labels = [tuple(item) for item in json.loads(labels or "[]")]
+        log._slot_of = {key: i for i, (key, _title) in enumerate(log.labels)}
+        return log
+
+    def copy(self) -> "DayLog":
+        return DayLog.from_row(*self.to_row())
+
+
+def _append_run(runs: List[List], slot: int, seconds: float, min_seconds: float) -> None:
+    if runs and (runs[-1][0] == slot or seconds < min_seconds):
+        runs[-1][1] += seconds
+        return
+    if runs and runs[-1][1] < min_seconds:
+        # the previous run was too short to show on its own: it becomes part of this one
+        seconds += runs.pop()[1]
+        if runs and runs[-1][0] == slot:
+            runs[-1][1] += seconds
+            return
+    runs.append([slot, seconds])
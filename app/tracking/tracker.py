@@ -0,0 +1,347 @@
+# app/tracking/tracker.py
+"""
+Local time-tracking engine: what the user actually worked on, and when.
+
+The tracker records intervals of the active task and idle gaps into per-day
+DayLogs (compact arrays, see intervals.py), persisted in a small SQLite file
+next to the other app data. Every flush also writes a per-day, per-task
+rollup row, so totals over weeks or months are a single indexed SUM instead
+of a scan over every interval.
+
+Stored days belong to a user: set_user() (called when the dashboard starts
+and on logout) stops and flushes the previous user's recording, and every
+read or write afterwards only sees the new user's rows.
+
+Idle detection is driven by activity observations (the capture pipeline
+reports whether the screen changed): after `idle_after` seconds without
+activity, the time since the last activity is re-booked as idle.
+
+Usage:
+    tracker = get_tracker()
+    tracker.set_user(email)                     # whose days are recorded/read
+    tracker.start("task-42", "Write report")    # switch the active task
+    tracker.observe_activity(screen_changed)    # any thread
+    tracker.timeline()                          # [(label, hours, color)] for TimesheetChartQt
+    tracker.totals_between("2026-09-01", "2026-10-17")   # {task key: seconds}
+    tracker.flush()                             # persist (cheap; call periodically)
+"""
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.tracking.intervals import IDLE, UNTRACKED, DayLog, day_key, split_by_day
+from app.utils.paths import app_data_dir
+from app.utils.state import AppState
+
+DEFAULT_IDLE_SECONDS = float(os.getenv("TRACKING_IDLE_SECONDS", "300"))
+SEGMENT_MIN_SECONDS = 60.0   # shorter runs are folded into their neighbour on the chart
+MAX_SEGMENTS = 200           # the chart never gets more segments than this
+
+IDLE_KEY = ""                # rollup key for idle time
+PALETTE = ["#81c784", "#64b5f6", "#f48fb1", "#f9d976", "#9c27b0", "#4db6ac", "#ff8a65", "#ba68c8"]
+IDLE_COLOR = "#757575"
+UNTRACKED_COLOR = "#3a3a3a"
+
+TimelineItem = Tuple[str, float, str]  # (label, hours, hex-color), as TimesheetChartQt expects
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS day_intervals (
+        user    TEXT NOT NULL,
+        day     TEXT NOT NULL,
+        starts  BLOB NOT NULL,
+        ends    BLOB NOT NULL,
+        slots   BLOB NOT NULL,
+        labels  TEXT NOT NULL,
+        PRIMARY KEY (user, day)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS day_rollup (
+        user     TEXT    NOT NULL,
+        day      TEXT    NOT NULL,
+        task_key TEXT    NOT NULL,
+        title    TEXT    NOT NULL,
+        seconds  REAL    NOT NULL,
+        PRIMARY KEY (user, day, task_key)
+    )
+    """,
+]
+
+
+def task_color(key: str) -> str:
+    """Stable colour per task key, so a task keeps its colour across refreshes and days."""
+    return PALETTE[zlib.crc32(key.encode("utf-8")) % len(PALETTE)]
+
+
+class TimeTracker:
+    """Thread-safe recorder of active-task intervals and idle gaps with daily rollups."""
+
+    def __init__(self, path: Optional[Path] = None, idle_after: float = DEFAULT_IDLE_SECONDS,
+                 clock: Callable[[], float] = time.time, user: Optional[str] = None):
+        self.path = Path(path) if path else app_data_dir() / "time_tracking.sqlite3"
+        self.idle_after = idle_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+        for stmt in _SCHEMA:
+            self._db.execute(stmt)
+
+        self._user = user or ""                         # "" = nobody logged in
+        self._days: Dict[str, DayLog] = {}
+        self._dirty: set = set()
+        self._task: Optional[Tuple[str, str]] = None   # (key, title) of the active task
+        self._idle = False
+        self._open_since: Optional[float] = None      # start of the interval being recorded
+        self._last_activity = clock()
+
+    def _migrate(self) -> None:
+        """Move tables from before per-user storage under the stored login."""
+        cols = {row[1] for row in self._db.execute("PRAGMA table_info(day_intervals)")}
+        if not cols or "user" in cols:
+            return
+        owner = AppState.get_user_email() or ""
+        try:
+            self._db.execute("BEGIN")
+            for table in ("day_intervals", "day_rollup"):
+                self._db.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+            for stmt in _SCHEMA:
+                self._db.execute(stmt)
+            self._db.execute(
+                "INSERT INTO day_intervals (user, day, starts, ends, slots, labels) "
+                "SELECT ?, day, starts, ends, slots, labels FROM day_intervals_old", (owner,)
+            )
+            self._db.execute(
+                "INSERT INTO day_rollup (user, day, task_key, title, seconds) "
+                "SELECT ?, day, task_key, title, seconds FROM day_rollup_old", (owner,)
+            )
+            self._db.execute("DROP TABLE day_intervals_old")
+            self._db.execute("DROP TABLE day_rollup_old")
+            self._db.execute("COMMIT")
+        except sqlite3.Error:
+            self._db.execute("ROLLBACK")
+            raise
+
+    # -------------------------
+    # Recording
+    # -------------------------
+    def set_user(self, user: Optional[str], now: Optional[float] = None) -> None:
+        """
+        Switch whose days are recorded and read. The open interval is closed and
+        flushed first (for the previous user); tracking stays stopped until start().
+        """
+        self.stop(now)
+        self.flush(now)
+        with self._lock:
+            if (user or "") != self._user:
+                self._user = user or ""
+                self._days = {}
+                self._dirty = set()
+
+    def user(self) -> str:
+        with self._lock:
+            return self._user
+
+    def start(self, key: str, title: str = "", now: Optional[float] = None) -> None:
+        """Make `key` the active task (closing whatever was being recorded)."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            self._close_locked(now)
+            self._task = (key, title or key)
+            self._idle = False
+            self._open_since = now
+            self._last_activity = now
+
+    def stop(self, now: Optional[float] = None) -> None:
+        """Stop tracking (e.g. on logout); nothing is recorded until the next start()."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            self._close_locked(now)
+            self._task = None
+            self._idle = False
+            self._open_since = None
+
+    def observe_activity(self, active: bool, now: Optional[float] = None) -> None:
+        """
+        Feed an activity observation. `active=False` only matters once nothing
+        active was seen for `idle_after` seconds: the time since then becomes idle.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            if self._task is None:
+                return
+            if active:
+                if self._idle:
+                    self._close_locked(now)
+                    self._idle = False
+                    self._open_since = now
+                self._last_activity = now
+            elif not self._idle and now - self._last_activity >= self.idle_after:
+                since = max(self._last_activity, self._open_since or self._last_activity)
+                self._close_locked(since)
+                self._idle = True
+                self._open_since = since
+
+    def current(self) -> Optional[Tuple[str, str]]:
+        """(key, title) of the active task, or None."""
+        with self._lock:
+            return self._task
+
+    def is_idle(self) -> bool:
+        with self._lock:
+            return self._idle
+
+    def _close_locked(self, end: float) -> None:
+        """Book the open interval [open_since, end) and keep recording from `end`."""
+        if self._open_since is None or self._task is None:
+            return
+        start, self._open_since = self._open_since, end
+        for day, s, e in split_by_day(start, end):
+            log = self._day_locked(day)
+            slot = IDLE if self._idle else log.slot_for(*self._task)
+            log.add(s, e, slot)
+            self._dirty.add(day)
+
+    def _day_locked(self, day: str) -> DayLog:
+        log = self._days.get(day)
+        if log is None:
+            row = self._db.execute(
+                "SELECT day, starts, ends, slots, labels FROM day_intervals WHERE user=? AND day=?",
+                (self._user, day),
+            ).fetchone()
+            log = DayLog.from_row(*row) if row else DayLog(day)
+            self._days[day] = log
+        return log
+
+    def _snapshot_locked(self, day: str, now: float) -> DayLog:
+        """The day's log including the still-open interval, clipped to `now`."""
+        log = self._day_locked(day).copy()
+        if self._open_since is not None and self._task is not None:
+            for d, s, e in split_by_day(self._open_since, now):
+                if d == day:
+                    log.add(s, e, IDLE if self._idle else log.slot_for(*self._task))
+        return log
+
+    # -------------------------
+    # Aggregation
+    # -------------------------
+    def timeline(self, day: Optional[str] = None, now: Optional[float] = None) -> List[TimelineItem]:
+        """Merged chronological segments of a day (default today), ready for set_timeline()."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            log = self._snapshot_locked(day or day_key(now), now)
+        min_seconds = SEGMENT_MIN_SECONDS
+        segments = log.segments(min_seconds)
+        while len(segments) > MAX_SEGMENTS:
+            min_seconds *= 2
+            segments = log.segments(min_seconds)
+        items: List[TimelineItem] = []
+        for slot, seconds in segments:
+            if slot == IDLE:
+                items.append(("Idle", round(seconds / 3600.0, 3), IDLE_COLOR))
+            elif slot == UNTRACKED:
+                items.append(("Untracked", round(seconds / 3600.0, 3), UNTRACKED_COLOR))
+            else:
+                key, title = log.label(slot)
+                items.append((title or key, round(seconds / 3600.0, 3), task_color(key)))
+        return items
+
+    def day_totals(self, day: Optional[str] = None, now: Optional[float] = None) -> Dict[str, float]:
+        """Seconds per task key for one day ("" = idle)."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            log = self._snapshot_locked(day or day_key(now), now)
+        return _rollup(log)
+
+    def totals_between(self, first_day: str, last_day: str, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Seconds per task key over [first_day, last_day] (inclusive, YYYY-MM-DD).
+        Reads the precomputed daily rollups; unflushed days come from memory.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            live = {d: _rollup(self._snapshot_locked(d, now))
+                    for d in set(self._dirty) | {day_key(now)} if first_day <= d <= last_day}
+            rows = self._db.execute(
+                "SELECT day, task_key, seconds FROM day_rollup WHERE user=? AND day BETWEEN ? AND ?",
+                (self._user, first_day, last_day),
+            ).fetchall()
+        out: Dict[str, float] = {}
+        for day, key, seconds in rows:
+            if day not in live:
+                out[key] = out.get(key, 0.0) + seconds
+        for totals in live.values():
+            for key, seconds in totals.items():
+                out[key] = out.get(key, 0.0) + seconds
+        return out
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def flush(self, now: Optional[float] = None) -> int:
+        """Persist changed days (intervals + rollups); returns the number of days written."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            today = day_key(now)
+            days = set(self._dirty)
+            if self._open_since is not None and self._task is not None:
+                days.add(today)  # the open interval is saved provisionally
+            snapshots = [self._snapshot_locked(d, now) for d in sorted(days)]
+            try:
+                self._db.execute("BEGIN")
+                for log in snapshots:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO day_intervals (user, day, starts, ends, slots, labels) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (self._user, *log.to_row()),
+                    )
+                    self._db.execute("DELETE FROM day_rollup WHERE user=? AND day=?", (self._user, log.day))
+                    titles = dict(log.labels)
+                    self._db.executemany(
+                        "INSERT INTO day_rollup (user, day, task_key, title, seconds) VALUES (?, ?, ?, ?, ?)",
+                        [(self._user, log.day, key, titles.get(key, "Idle"), secs)
+                         for key, secs in _rollup(log).items()],
+                    )
+                self._db.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._db.execute("ROLLBACK")
+                print(f"[⚠] Time tracking flush failed: {e}")
+                return 0
+            self._dirty.clear()
+            # only today's log stays in memory; older days are re-read on demand
+            self._days = {d: log for d, log in self._days.items() if d == today}
+            return len(snapshots)
+
+    def close(self) -> None:
+        self.stop()
+        self.flush()
+        with self._lock:
+            self._db.close()
+
+
+def _rollup(log: DayLog) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    for slot, seconds in log.totals().items():
+        key = IDLE_KEY if slot == IDLE else log.label(slot)[0]
+        out[key] = out.get(key, 0.0) + seconds
+    return out
+
+
+_tracker: Optional[TimeTracker] = None
+_tracker_lock = threading.Lock()
+
+
+def get_tracker() -> TimeTracker:
+    """Process-wide tracker (lazily opened, initially for the stored login)."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = TimeTracker(user=AppState.get_user_email())
+        return _tracker
@@ -1,4 +1,6 @@
 from typing import List, Tuple
+import time
+
 from PySide6.QtCharts import (
     QChart, QChartView, QBarSet, QHorizontalStackedBarSeries,
     QValueAxis
@@ -10,6 +12,12 @@ from PySide6.QtCore import Qt, QMargins
 
 TimelineItem = Tuple[str, float, str]  # (label, hours, hex-color)
 
+# animate only small, infrequent updates; big or rapid ones just repaint
+ANIMATION_MAX_SEGMENTS = 50
+ANIMATION_MIN_INTERVAL = 2.0  # seconds since the previous update
+# hundreds of legend entries are unreadable and expensive to lay out
+LEGEND_MAX_SEGMENTS = 24
+
 
 class TimesheetChartQt(QWidget):
     """Horizontal stacked bar (timeline) showing task durations.
@@ -17,6 +25,10 @@ class TimesheetChartQt(QWidget):
     Use set_timeline([...]) to provide live data:
       chart.set_timeline([("Emails", 0.5, "#9c27b0"), ...])
     Then call chart.refresh() or chart.refresh() will be called automatically.
+
+    The chart, series and axes are built once; refresh() diffs the timeline
+    against the bar sets on screen and only relabels, recolors, revalues,
+    appends or removes the sets that changed.
     """
 
     def __init__(self, timeline: List[TimelineItem] | None = None, parent=None):
@@ -41,6 +53,12 @@ class TimesheetChartQt(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self._chart_view)
 
+        # what is currently on screen: one QBarSet per (label, hours, color)
+        self._sets: List[QBarSet] = []
+        self._shown: List[TimelineItem] = []
+        self._last_update = 0.0
+        self._build_chart()
+
         # initial render
         self.refresh()
 
@@ -53,45 +71,30 @@ class TimesheetChartQt(QWidget):
         self.refresh()
 
     def refresh(self) -> None:
-        """Rebuild chart from self.timeline (idempotent)."""
-        self._chart.removeAllSeries()
-        # Clear axes (simpler approach: create new chart object)
-        self._chart = QChart()
-        self._chart_view.setChart(self._chart)
-
-        total_hours = sum(max(0.0, float(d)) for _, d, _ in self.timeline)
-
-        series = QHorizontalStackedBarSeries()
+        """Bring the chart in line with self.timeline (idempotent, incremental)."""
+        items = [_normalize(item) for item in self.timeline]
+        now = time.monotonic()
+        animate = (len(items) <= ANIMATION_MAX_SEGMENTS
+                   and now - self._last_update >= ANIMATION_MIN_INTERVAL)
+        self._last_update = now
+        self._chart.setAnimationOptions(QChart.SeriesAnimations if animate else QChart.NoAnimation)
+
+        self._chart_view.setUpdatesEnabled(False)
+        try:
+            self._apply_items(items)
+            self._update_axis(items)
+            self._chart.legend().setVisible(len(items) <= LEGEND_MAX_SEGMENTS)
+        finally:
+            self._chart_view.setUpdatesEnabled(True)
 
-        # If there are no items, show empty chart with axis range 0..1
-        if not self.timeline:
-            total_hours = 1.0
-            axisX_range = 1.0
-        else:
-            axisX_range = total_hours if total_hours > 0 else 1.0
-
-        for task, duration, color in self.timeline:
-            bar = QBarSet(task)
-            # QBarSet expects numeric values (one per category). We append a single value.
-            try:
-                bar.append(float(duration))
-            except Exception:
-                bar.append(0.0)
-            try:
-                bar.setColor(QColor(color))
-            except Exception:
-                # fallback to a neutral color
-                bar.setColor(QColor("#888888"))
-            # label color (if supported by the platform) — safe to call
-            try:
-                bar.setLabelColor(Qt.white)
-            except Exception:
-                pass
-            series.append(bar)
-
-        self._chart.addSeries(series)
+    # -----------------------
+    # Internal helpers
+    # -----------------------
+    def _build_chart(self) -> None:
+        """Create the series, axes and styling once."""
+        self._series = QHorizontalStackedBarSeries()
+        self._chart.addSeries(self._series)
         self._chart.setTitle("Today's Work Timeline")
-        self._chart.setAnimationOptions(QChart.SeriesAnimations)
         self._chart.setBackgroundVisible(False)
         self._chart.setMargins(QMargins(0, 0, 0, 0))
 
@@ -105,22 +108,78 @@ class TimesheetChartQt(QWidget):
         legend.setFont(QFont("Segoe UI", 9))
 
         # ---- Axes ----
-        axisX = QValueAxis()
-        axisX.setRange(0, axisX_range)
-        # Label format: show integer hours when possible, else floats with 1 decimal
-        if axisX_range.is_integer():
-            axisX.setLabelFormat("%d")
-        else:
-            axisX.setLabelFormat("%.1f")
-        axisX.setTitleText("Time (hours)")
-        self._chart.addAxis(axisX, Qt.AlignBottom)
-        series.attachAxis(axisX)
+        self._axis_x = QValueAxis()
+        self._axis_x.setRange(0, 1.0)
+        self._axis_x.setLabelFormat("%d")
+        self._axis_x.setTitleText("Time (hours)")
+        self._chart.addAxis(self._axis_x, Qt.AlignBottom)
+        self._series.attachAxis(self._axis_x)
 
         # Y-axis hidden (single category)
         axisY = QValueAxis()
         axisY.setVisible(False)
         self._chart.addAxis(axisY, Qt.AlignLeft)
-        series.attachAxis(axisY)
-
-        # set chart object on view
-        self._chart_view.setChart(self._chart)
+        self._series.attachAxis(axisY)
+
+    def _apply_items(self, items: List[TimelineItem]) -> None:
+        """Positional diff: stacked segments keep their order, so reuse set i for item i."""
+        common = min(len(items), len(self._sets))
+        for i in range(common):
+            old, new = self._shown[i], items[i]
+            if old == new:
+                continue
+            bar = self._sets[i]
+            if old[0] != new[0]:
+                bar.setLabel(new[0])
+            if old[1] != new[1]:
+                bar.replace(0, new[1])
+            if old[2] != new[2]:
+                bar.setColor(_color(new[2]))
+
+        if len(self._sets) > len(items):
+            # QBarSeries.remove() deletes the sets
+            for bar in self._sets[len(items):]:
+                self._series.remove(bar)
+            del self._sets[len(items):]
+        elif len(items) > len(self._sets):
+            added = [_make_set(item) for item in items[len(self._sets):]]
+            self._series.append(added)
+            self._sets.extend(added)
+
+        self._shown = items
+
+    def _update_axis(self, items: List[TimelineItem]) -> None:
+        total_hours = sum(max(0.0, d) for _, d, _ in items)
+        # If there are no items, show empty chart with axis range 0..1
+        axisX_range = total_hours if total_hours > 0 else 1.0
+        if self._axis_x.max() != axisX_range or self._axis_x.min() != 0:
+            self._axis_x.setRange(0, axisX_range)
+        # Label format: show integer hours when possible, else floats with 1 decimal
+        fmt = "%d" if float(axisX_range).is_integer() else "%.1f"
+        if self._axis_x.labelFormat() != fmt:
+            self._axis_x.setLabelFormat(fmt)
+
+
+def _normalize(item) -> TimelineItem:
+    task, duration, color = item
+    try:
+        duration = float(duration)
+    except Exception:
+        duration = 0.0
+    return (str(task), duration, str(color))
+
+
+def _color(color: str) -> QColor:
+    qcolor = QColor(color)
+    # fallback to a neutral color
+    return qcolor if qcolor.isValid() else QColor("#888888")
+
+
+def _make_set(item: TimelineItem) -> QBarSet:
+    task, duration, color = item
+    bar = QBarSet(task)
+    # QBarSet expects numeric values (one per category). We append a single value.
+    bar.append(duration)
+    bar.setColor(_color(color))
+    bar.setLabelColor(Qt.white)
+    return bar
@@ -1,8 +1,5 @@
 # app/ui/dashboard_window.py
-import threading
-import io
 import os
-from datetime import datetime, timezone
 
 import requests  # kept for some fallback logging
 from PySide6.QtGui import QPixmap
@@ -13,30 +10,65 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QTimer
 
 from app.utils.state import AppState
-from app.ui.chart_widget import TimesheetChartQt
 from app.ui.task_table import TaskTable
-from app.api.screenshot_client import upload_screenshot
-from app.api.task_client import get_my_tasks
+from app.capture.spool import get_spool, SpoolDrainer
+from app.ui.workers import get_executor
+from app.ui.task_store import get_task_store
+from app.api.screenshot_client import UNCHANGED_MARKER_MIME
+from app.api.task_client import task_key
+from app.tracking.tracker import get_tracker
+from app.utils import startup_profile
 
 # If you still want to use the backend direct path for any fallback:
 API_URL = "http://127.0.0.1:8000"
 
+# timesheet chart redraw + time-tracking flush interval
+TIMELINE_REFRESH_MS = 60 * 1000
+
 
 class DashboardWindow(QWidget):
+    """
+    Main window. Construction only builds widgets (cheap enough to do while the
+    startup profile check is in flight); start() begins the background work:
+    spool drainer, capture pipeline, timers and task polling. The chart
+    (QtCharts) and the capture stack (numpy, PIL, mss) are created after the
+    first frame, so the window appears without waiting for them.
+    """
+
     def __init__(self, on_logout):
         super().__init__()
         self.on_logout = on_logout
         self.setWindowTitle("PyTrack Dashboard")
+        self._started = False
+
+        # last-known tasks from disk, so the table/chart paint before the network answers
+        get_task_store().load_cached()
 
         # Keep references to dynamic widgets so we can refresh later
         self._chart_widget = None
+        self._chart_layout = None
+        self._chart_placeholder = None
         self._task_table = None
         self._user_label = None
 
+        # -------- SCREENSHOT SPOOL + DRAINER --------
+        # captures go to the on-disk spool; the drainer uploads in the background
+        self._spool = get_spool()
+        self._drainer = SpoolDrainer(self._spool)
+        self._pipeline = None  # built in _start_deferred()
+        self._owner = None     # user the captured frames belong to (set in start())
+
+        # -------- TIME TRACKING --------
+        # activating a task in the table starts tracking it; screen changes seen by the
+        # capture pipeline count as activity, so a static screen turns into idle time
+        self._tracker = get_tracker()
+
         # -------- SCREENSHOT TIMER SETUP (background worker) --------
         self.screenshot_timer = QTimer(self)
         self.screenshot_timer.timeout.connect(self._on_screenshot_timeout)
-        self.screenshot_timer.start(60 * 1000)  # every 1 minute
+
+        self._timeline_timer = QTimer(self)
+        self._timeline_timer.timeout.connect(self._on_timeline_timeout)
 
         # -------- SCREEN CENTERING + SIZE --------
         screen = QApplication.primaryScreen().geometry()
@@ -51,7 +83,7 @@ class DashboardWindow(QWidget):
         qss_path = os.path.join(os.path.dirname(__file__), "..", "styles", "dashboard.qss")
         try:
             if os.path.exists(qss_path):
-                with open(qss_path, "r", encoding="utf-8") as f:
+                with startup_profile.phase("qss_load:dashboard"), open(qss_path, "r", encoding="utf-8") as f:
                     self.setStyleSheet(f.read())
         except Exception:
             pass
@@ -72,8 +104,9 @@ class DashboardWindow(QWidget):
         logo_label = QLabel()
         if os.path.exists(logo_path):
             try:
-                pixmap = QPixmap(logo_path)
-                logo_label.setPixmap(pixmap.scaled(120, 35, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                with startup_profile.phase("pixmap_scale:dashboard_logo"):
+                    pixmap = QPixmap(logo_path)
+                    logo_label.setPixmap(pixmap.scaled(120, 35, Qt.KeepAspectRatio, Qt.SmoothTransformation))
             except Exception:
                 logo_label.setText("PyTrack")
                 logo_label.setObjectName("AppTitle")
@@ -85,12 +118,16 @@ class DashboardWindow(QWidget):
         self._user_label = QLabel(AppState.get_user_email() or "userXYZ")
         self._user_label.setObjectName("UserLabel")
 
+        self._tracking_label = QLabel("")
+        self._tracking_label.setObjectName("TrackingLabel")
+
         logout_btn = QPushButton("Logout")
         logout_btn.clicked.connect(self.logout_user)
         logout_btn.setObjectName("LogoutButton")
 
         topbar_layout.addWidget(logo_label)
         topbar_layout.addStretch(1)
+        topbar_layout.addWidget(self._tracking_label)
         topbar_layout.addWidget(self._user_label)
         topbar_layout.addWidget(logout_btn)
 
@@ -117,9 +154,71 @@ class DashboardWindow(QWidget):
         root_layout.addWidget(topbar)
         root_layout.addWidget(scroll_area)
 
-        # initial data load
+    # -----------------------
+    # Background work
+    # -----------------------
+    def start(self):
+        """Begin capture, uploads, polling and the initial data load (call once shown)."""
+        if self._started:
+            return
+        self._started = True
+        self._owner = AppState.get_user_email()
+        self._tracker.set_user(self._owner)  # tracked days are stored per user
+        self._drainer.start()
+        self.screenshot_timer.start(60 * 1000)  # every 1 minute
+        self._timeline_timer.start(TIMELINE_REFRESH_MS)
+
+        # tasks re-sync in the background (the table follows the shared store)
+        get_task_store().start_polling()
+
+        # initial data load (TaskTable doesn't fetch on construction)
+        if self._task_table is not None:
+            self._task_table.load_tasks()
         self.refresh()
 
+        # heavy imports (QtCharts, numpy/PIL/mss) after the first frame
+        QTimer.singleShot(0, self._start_deferred)
+
+    def _start_deferred(self):
+        if not self._started:
+            return  # closed before the event loop got here
+        with startup_profile.phase("chart_build"):
+            self._build_chart()
+        with startup_profile.phase("capture_start"):
+            self._start_capture()
+
+    def _start_capture(self):
+        from app.capture.pipeline import CapturePipeline
+        from app.capture.dedup import FrameDeduper
+        from app.capture.monitors import MonitorCapture
+
+        # capture -> encode -> store, one worker per stage with bounded queues
+        # unchanged screens are sent as a tiny marker instead of a full JPEG
+        # SCREENSHOT_DELTA=1 ships changed tiles + periodic keyframes instead of full JPEGs
+        # SCREENSHOT_MONITORS=primary|stitched|individual selects which screens are captured
+        pipeline_kwargs = {}
+        if os.getenv("SCREENSHOT_DELTA") == "1":
+            from app.capture.delta import DeltaEncoder
+            pipeline_kwargs["encoder_factory"] = DeltaEncoder
+        self._pipeline = CapturePipeline(
+            sink=self._store_frame, capture_fn=MonitorCapture(), deduper_factory=FrameDeduper, **pipeline_kwargs
+        )
+        # a delta the spool evicts or gives up on restarts that monitor's chain
+        self._spool.add_drop_listener(self._pipeline.frame_dropped)
+        self._pipeline.start()
+
+    def _build_chart(self):
+        """Swap the timesheet placeholder for the real chart."""
+        from app.ui.chart_widget import TimesheetChartQt
+
+        chart_widget = TimesheetChartQt()
+        chart_widget.setFixedHeight(250)
+        self._chart_layout.replaceWidget(self._chart_placeholder, chart_widget)
+        self._chart_placeholder.deleteLater()
+        self._chart_placeholder = None
+        self._chart_widget = chart_widget
+        self._update_chart()
+
     # -----------------------
     # Section helper
     # -----------------------
@@ -136,13 +235,17 @@ class DashboardWindow(QWidget):
         layout.addWidget(label)
 
         if chart:
-            chart_widget = TimesheetChartQt()
-            chart_widget.setFixedHeight(250)
-            layout.addWidget(chart_widget)
-            self._chart_widget = chart_widget
+            # skeleton until _build_chart() (QtCharts is imported after the first frame)
+            placeholder = QLabel("Loading timeline…")
+            placeholder.setAlignment(Qt.AlignCenter)
+            placeholder.setFixedHeight(250)
+            layout.addWidget(placeholder)
+            self._chart_layout = layout
+            self._chart_placeholder = placeholder
         elif text:
             if obj_name == "TasksFrame":
                 task_table = TaskTable()
+                task_table.task_activated.connect(self._on_task_activated)
                 layout.addWidget(task_table)
                 self._task_table = task_table
             else:
@@ -160,31 +263,73 @@ class DashboardWindow(QWidget):
         # update user label
         self._user_label.setText(AppState.get_user_email() or "userXYZ")
 
-        # refresh tasks (table already loads on init)
+        # refresh tasks: the table subscribes to the shared task store,
+        # so this is one /task/my-tasks fetch (or none while the cache is fresh)
         try:
-            if self._task_table:
-                self._task_table.refresh()
-                # Optionally update chart using task durations:
-                tasks_result = get_my_tasks()
-                if tasks_result.get("success"):
-                    tasks = tasks_result.get("data", [])
-                    # Convert tasks to timeline items: (title, hours, color)
-                    timeline = []
-                    for t in tasks:
-                        mins = t.get("estimated_minutes") or 0
-                        hours = (mins / 60.0) if mins else 0.0
-                        title = t.get("task") or t.get("title") or "Task"
-                        timeline.append((title, round(hours, 2), "#81c784"))
-                    if self._chart_widget:
-                        self._chart_widget.set_timeline(timeline)
+            get_task_store().refresh()
+        except Exception:
+            # keep UI stable even if refresh fails
+            pass
+        self._update_chart()
+
+    def _update_chart(self):
+        """Show today's tracked time (merged task/idle segments) on the chart."""
+        try:
+            if self._chart_widget:
+                self._chart_widget.set_timeline(self._tracker.timeline())
         except Exception:
             # keep UI stable even if refresh fails
             pass
 
+    # -----------------------
+    # Time tracking
+    # -----------------------
+    def _on_task_activated(self, task):
+        key = task_key(task)
+        if not key:
+            return
+        title = str(task.get("task") or task.get("title") or task.get("name") or key)
+        self._tracker.start(key, title)
+        self._tracking_label.setText(f"⏱ {title}")
+        self._update_chart()
+
+    def _on_timeline_timeout(self):
+        self._update_chart()
+        get_executor().run("tracking-flush", self._tracker.flush, owner=self)
+
+    def _store_frame(self, payload, captured_at_iso, mime, monitor):
+        """Pipeline sink (store thread): spool the frame and report screen activity."""
+        self._spool.put(payload, captured_at_iso, mime, monitor, owner=self._owner)
+        self._tracker.observe_activity(mime != UNCHANGED_MARKER_MIME)
+
     # -----------------------
     # Logout
     # -----------------------
+    def _stop_background(self):
+        # late network results must not reach a closed window
+        get_executor().cancel(self)
+        if not self._started:
+            return
+        self._started = False
+        self.screenshot_timer.stop()
+        self._timeline_timer.stop()
+        if self._pipeline is not None:
+            self._spool.remove_drop_listener(self._pipeline.frame_dropped)
+            self._pipeline.stop()
+        self._drainer.stop()
+        self._tracker.stop()
+        self._tracker.flush()
+
+    def closeEvent(self, event):
+        self._stop_background()
+        super().closeEvent(event)
+
     def logout_user(self):
+        self._stop_background()
+        # stop + flush this user's tracking (also when start() never ran), then detach
+        self._tracker.set_user(None)
+        self._tracking_label.setText("")
+        get_task_store().invalidate(clear_disk=True)
         AppState.clear_auth()
         AppState.clear()
         try:
@@ -197,46 +342,15 @@ class DashboardWindow(QWidget):
                 pass
 
     # -----------------------
-    # Screenshot capture (threaded)
+    # Screenshot capture (pipelined)
     # -----------------------
     def _on_screenshot_timeout(self):
         # only capture if logged in
-        if not AppState.get_access_token():
+        if not AppState.get_access_token() or self._pipeline is None:
             return
-        # spawn background thread to capture & upload
-        t = threading.Thread(target=self.capture_screenshot, daemon=True)
-        t.start()
-
-    def capture_screenshot(self):
-        """
-        Capture primary monitor, convert to bytes, then call upload_screenshot (which posts to backend).
-        Runs in background thread to avoid blocking the UI.
-        """
-        try:
-            # lazy imports (not required unless capture is used)
-            from mss import mss
-            from PIL import Image
-
-            # capture primary monitor
-            with mss() as sct:
-                monitor = sct.monitors[1]
-                sct_img = sct.grab(monitor)
-                img = Image.frombytes("RGB", sct_img.size, sct_img.rgb)
-
-            # convert to JPEG bytes
-            buf = io.BytesIO()
-            img.save(buf, format="JPEG", quality=70, optimize=True)
-            buf.seek(0)
-            image_bytes = buf.read()
-
-            # prepare timestamp
-            ts_iso = datetime.now(timezone.utc).isoformat()
-
-            # call frontend client which uses AppState token and backend upload endpoint
-            res = upload_screenshot(image_bytes, captured_at_iso=ts_iso)
-            if res.get("status") == "success":
-                print(f"[✅] Uploaded screenshot: {res.get('image_url')}")
-            else:
-                print(f"[⚠] Upload failed: {res.get('message')}")
-        except Exception as e:
-            print(f"[❌] Screenshot pipeline failed: {e}")
+        # non-blocking; coalesced if the previous capture is still pending
+        self._pipeline.trigger()
+
+    def screenshot_stats(self):
+        """Queue depth / latency counters for the capture pipeline and spool."""
+        return {"pipeline": self._pipeline.stats() if self._pipeline else {}, "spool_pending": self._spool.count()}
@@ -10,6 +10,8 @@ import os
 # use our frontend clients and state
 from app.api.auth_client import login_user, fetch_user_profile
 from app.utils.state import AppState
+from app.ui.workers import get_executor
+from app.utils import startup_profile
 
 
 class LoginWindow(QWidget):
@@ -29,7 +31,7 @@ class LoginWindow(QWidget):
         # Load QSS safely (fall back if file missing)
         qss_path = os.path.join(os.path.dirname(__file__), "..", "styles", "login.qss")
         try:
-            with open(qss_path, "r", encoding="utf-8") as f:
+            with startup_profile.phase("qss_load:login"), open(qss_path, "r", encoding="utf-8") as f:
                 self.setStyleSheet(f.read())
         except Exception:
             # ignore styling errors, app still works
@@ -54,8 +56,9 @@ class LoginWindow(QWidget):
         logo_path = os.path.join(os.path.dirname(__file__), "assets", "company_logo.png")
         if os.path.exists(logo_path):
             logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(pixmap.scaled(174, 45, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            with startup_profile.phase("pixmap_scale:login_logo"):
+                pixmap = QPixmap(logo_path)
+                logo_label.setPixmap(pixmap.scaled(174, 45, Qt.KeepAspectRatio, Qt.SmoothTransformation))
             logo_label.setAlignment(Qt.AlignCenter)
             logo_label.setObjectName("AppLogo")
             left_layout.addWidget(logo_label)
@@ -90,11 +93,12 @@ class LoginWindow(QWidget):
         bg_path = os.path.join(os.path.dirname(__file__), "assets", "bg.png")
         if os.path.exists(bg_path):
             bg_label = QLabel()
-            pixmap = QPixmap(bg_path)
-            # Fit vertically, allow cropping by KeepAspectRatioByExpanding
-            bg_label.setPixmap(
-                pixmap.scaled(300, int(screen.height() * 0.53), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            )
+            with startup_profile.phase("pixmap_scale:login_bg"):
+                pixmap = QPixmap(bg_path)
+                # Fit vertically, allow cropping by KeepAspectRatioByExpanding
+                bg_label.setPixmap(
+                    pixmap.scaled(300, int(screen.height() * 0.53), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+                )
             bg_label.setAlignment(Qt.AlignCenter)
             right_layout.addWidget(bg_label)
 
@@ -112,16 +116,35 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Missing Info", "Please enter your email and password.")
             return
 
-        # disable UI while we attempt login
+        # disable UI while we attempt login (network runs on the worker pool)
         self.login_btn.setEnabled(False)
         self.login_btn.setText("Logging in...")
-
+        QGuiApplication.setOverrideCursor(Qt.WaitCursor)
+
+        get_executor().run(
+            "login", _login_and_fetch_profile, email, password,
+            on_result=self._on_login_result, on_error=self._on_login_error, owner=self,
+        )
+
+    def closeEvent(self, event):
+        if get_executor().is_pending("login"):
+            get_executor().cancel(self)
+            self._reset_login_ui()
+        super().closeEvent(event)
+
+    def _reset_login_ui(self):
+        QGuiApplication.restoreOverrideCursor()
+        self.login_btn.setEnabled(True)
+        self.login_btn.setText("Login")
+
+    def _on_login_error(self, message: str):
+        self._reset_login_ui()
+        QMessageBox.critical(self, "Error", str(message))
+
+    def _on_login_result(self, outcome):
+        res, prof = outcome
+        self._reset_login_ui()
         try:
-            QGuiApplication.setOverrideCursor(Qt.WaitCursor)
-            # login_user persists tokens into AppState and returns structured result
-            res = login_user(email, password)
-            QGuiApplication.restoreOverrideCursor()
-
             if res.get("status") != "success":
                 # show server-provided error when available
                 msg = res.get("message") or "Invalid email or password."
@@ -129,8 +152,7 @@ class LoginWindow(QWidget):
                 return
 
             # At this point AppState has tokens saved already by login_user.
-            # Fetch profile to obtain authoritative user id (and possibly role)
-            prof = fetch_user_profile()
+            # The worker also fetched the profile to obtain authoritative user id (and possibly role)
             if prof.get("status") != "success":
                 # profile fetch failed; still proceed but warn user
                 # clear auth to be safe
@@ -164,7 +186,11 @@ class LoginWindow(QWidget):
                 QMessageBox.information(self, "Logged In", "Login successful, but could not open dashboard.")
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
-        finally:
-            QGuiApplication.restoreOverrideCursor()
-            self.login_btn.setEnabled(True)
-            self.login_btn.setText("Login")
+
+
+def _login_and_fetch_profile(email: str, password: str):
+    """Worker-thread body: log in, then fetch the profile if login succeeded."""
+    res = login_user(email, password)
+    if res.get("status") != "success":
+        return res, {}
+    return res, fetch_user_profile()
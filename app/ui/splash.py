@@ -0,0 +1,72 @@
+# app/ui/splash.py
+"""
+Startup splash: the first thing on screen while the app finishes loading.
+
+Deliberately cheap: only QtWidgets/QtGui (already loaded by QApplication), no
+API clients, no charts, no capture libraries. AppController shows it before
+importing anything heavy and closes it once the login or dashboard window is
+up.
+
+Usage:
+    splash = SplashWindow()
+    splash.show()
+    splash.set_status("Checking your session…")
+    splash.painted.connect(...)     # fires once, after the first frame
+"""
+import os
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+
+from app.utils import startup_profile
+
+SPLASH_SIZE = (360, 200)
+
+
+class SplashWindow(QWidget):
+    """Frameless, centered logo + status line."""
+
+    painted = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.SplashScreen | Qt.FramelessWindowHint)
+        self.setObjectName("Splash")
+        self.setStyleSheet(
+            "#Splash { background-color: #1e1e1e; border: 2px solid #9c27b0; }"
+            "QLabel { color: #f0f0f0; background: none; font-family: 'Segoe UI', sans-serif; }"
+        )
+        self._painted = False
+
+        width, height = SPLASH_SIZE
+        screen = QApplication.primaryScreen().geometry()
+        self.setGeometry(int((screen.width() - width) / 2), int((screen.height() - height) / 2), width, height)
+
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignCenter)
+        layout.setSpacing(14)
+
+        logo = QLabel()
+        logo.setAlignment(Qt.AlignCenter)
+        logo_path = os.path.join(os.path.dirname(__file__), "assets", "company_logo_purple.png")
+        with startup_profile.phase("pixmap_scale:splash_logo"):
+            pixmap = QPixmap(logo_path) if os.path.exists(logo_path) else QPixmap()
+            if not pixmap.isNull():
+                # fast scaling: the splash is on screen for well under a second
+                logo.setPixmap(pixmap.scaled(160, 45, Qt.KeepAspectRatio, Qt.FastTransformation))
+            else:
+                logo.setText("PyTrack")
+        layout.addWidget(logo)
+
+        self._status = QLabel("Starting…")
+        self._status.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._status)
+
+    def set_status(self, text: str) -> None:
+        self._status.setText(text)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self.painted.emit()
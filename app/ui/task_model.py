@@ -0,0 +1,453 @@
+# app/ui/task_model.py
+"""
+Model/view backing for the task table.
+
+TaskTableModel keeps display strings in per-column lists (a compact columnar
+store) and materializes them lazily: only the first `batch_size` rows are
+converted on reset, the view pulls more through canFetchMore()/fetchMore() as
+the user scrolls. Nothing is allocated per cell.
+
+update_tasks() applies a new task list as a keyed diff (by task id) against
+the rows already materialized: only removed, inserted, moved or changed rows
+emit model signals, so selection and scroll position survive a poll.
+
+For server-paged lists (TaskPager) the model can also report that the backend
+has more rows: once the local list is exhausted, fetchMore() emits
+more_requested and the owner answers with append_tasks().
+
+TaskFilterProxy sits between the model and the view while a search is active
+and shows only the rows in a TaskSearchIndex result (a set of doc ids).
+"""
+from typing import Any, Dict, List, Optional, Set
+
+from PySide6.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt, Signal
+
+from app.api.task_client import task_key
+from app.utils.task_index import TaskSearchIndex
+
+# plain ints: comparing against Qt enum members on every data() call is slow
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole.value)
+_TOOLTIP_ROLE = int(Qt.ItemDataRole.ToolTipRole.value)
+_ROW_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+COLUMNS = [
+    "#", "Task", "Assignee", "Time Required", "Description",
+    "Task Highlight", "Time Recorded", "Completed At",
+]
+
+
+def _format_minutes(m: int | None) -> str:
+    if m is None:
+        return ""
+    try:
+        m = int(m)
+    except Exception:
+        return str(m)
+    if m >= 60:
+        h = m // 60
+        mm = m % 60
+        return f"{h}h {mm}m" if mm else f"{h}h"
+    return f"{m} min"
+
+
+def task_row(task: Dict[str, Any]) -> List[str]:
+    """Display strings for one task (columns 1..7), supporting different backend shapes."""
+    return [
+        str(task.get("task") or task.get("title") or task.get("name") or ""),
+        str(task.get("assigned_to") or task.get("assignee") or "-"),
+        _format_minutes(task.get("estimated_minutes") or task.get("time_required") or None),
+        str(task.get("description") or ""),
+        str(task.get("task_highlight") or task.get("highlight") or ""),
+        str(task.get("time_recorded") or ""),
+        str(task.get("completed_at") or ""),
+    ]
+
+
+class TaskTableModel(QAbstractTableModel):
+    """Read-only, lazily populated table model over a list of task dicts."""
+
+    # the view scrolled past the last loaded row and the backend has more pages
+    more_requested = Signal()
+    # the underlying task list was replaced or edited (not emitted for fetchMore)
+    list_changed = Signal()
+
+    def __init__(self, batch_size: int = 500, parent=None):
+        super().__init__(parent)
+        self.batch_size = batch_size
+        self._tasks: List[Dict[str, Any]] = []
+        self._ids: List[str] = []
+        self._cols: List[List[str]] = [[] for _ in range(len(COLUMNS) - 1)]
+        self._message: Optional[str] = None
+        self._remote_more = False
+        self._remote_pending = False
+        self._row_of: Optional[Dict[str, int]] = None  # key -> position in _tasks (lazy)
+        self._row_cache: Dict[int, List[str]] = {}      # display strings of unmaterialized rows
+
+    # -------------------------
+    # Data loading
+    # -------------------------
+    def set_tasks(self, tasks: List[Dict[str, Any]], has_more: bool = False) -> None:
+        """Replace all rows; only the first batch is materialized. `has_more`: backend has further pages."""
+        self.beginResetModel()
+        self._message = None
+        self._remote_more, self._remote_pending = has_more, False
+        self._tasks = list(tasks or [])
+        self._ids = []
+        self._cols = [[] for _ in range(len(COLUMNS) - 1)]
+        self._materialize(min(self.batch_size, len(self._tasks)))
+        self.endResetModel()
+        self._list_changed()
+
+    def set_message(self, text: str) -> None:
+        """Show a single placeholder row (loading / error) instead of tasks."""
+        self.beginResetModel()
+        self._message = text
+        self._remote_more = self._remote_pending = False
+        self._tasks, self._ids = [], []
+        self._cols = [[] for _ in range(len(COLUMNS) - 1)]
+        self.endResetModel()
+        self._list_changed()
+
+    def _materialize(self, count: int) -> None:
+        start = len(self._ids)
+        chunk = self._tasks[start:start + count]
+        self._ids.extend(task_key(t) for t in chunk)
+        rows = [task_row(t) for t in chunk]
+        for c, col in enumerate(self._cols):
+            col.extend(r[c] for r in rows)
+
+    def append_tasks(self, tasks: List[Dict[str, Any]], has_more: bool = False) -> None:
+        """Append a page fetched in answer to more_requested."""
+        self._remote_more, self._remote_pending = has_more, False
+        if self._message is not None:
+            self.set_tasks(tasks, has_more)
+            return
+        self._tasks.extend(tasks or [])
+        if self.canFetchMore():
+            self.fetchMore()
+        self._list_changed()
+
+    def set_more_available(self, has_more: bool) -> None:
+        """Update the backend-has-more flag (e.g. give up after a failed page fetch)."""
+        self._remote_more, self._remote_pending = has_more, False
+
+    def update_tasks(self, tasks: List[Dict[str, Any]], has_more: Optional[bool] = None) -> bool:
+        """
+        Apply `tasks` as an incremental diff keyed by task id. Falls back to a full
+        reset (and returns True) when there is nothing to diff against or ids are
+        missing/duplicated; returns False when the update was applied in place.
+        `has_more` (server paging) is left unchanged when None.
+        """
+        new = list(tasks or [])
+        new_keys = [task_key(t) for t in new]
+        new_pos = {k: i for i, k in enumerate(new_keys)}
+        if has_more is None:
+            has_more = self._remote_more
+        if (self._message is not None or not self._ids or "" in new_pos
+                or len(new_pos) != len(new_keys) or "" in self._ids):
+            self.set_tasks(new, has_more)
+            return True
+        self._remote_more, self._remote_pending = has_more, False
+
+        old_by_key = dict(zip(self._ids, self._tasks))
+
+        # 1. remove materialized rows whose task disappeared (bottom-up ranges)
+        gone = [r for r, k in enumerate(self._ids) if k not in new_pos]
+        for start, end in reversed(_ranges(gone)):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._ids[start:end + 1]
+            for col in self._cols:
+                del col[start:end + 1]
+            self.endRemoveRows()
+
+        # 2. reorder survivors to the new relative order (one layout change)
+        order = sorted(range(len(self._ids)), key=lambda r: new_pos[self._ids[r]])
+        if order != list(range(len(order))):
+            self._apply_permutation(order)
+
+        # 3. insert new tasks that fall inside the materialized prefix
+        target = max((new_pos[k] for k in self._ids), default=-1) + 1
+        target = max(target, min(self.batch_size, len(new)))
+        row = 0
+        while row < target:
+            if row < len(self._ids) and self._ids[row] == new_keys[row]:
+                row += 1
+                continue
+            end = row
+            while end < target and (end >= len(self._ids) or self._ids[end] != new_keys[end]) \
+                    and new_keys[end] not in old_by_key:
+                end += 1
+            if end == row:
+                # survivor order already matches new order, so this cannot happen
+                break
+            chunk = new[row:end]
+            self.beginInsertRows(QModelIndex(), row, end - 1)
+            self._ids[row:row] = new_keys[row:end]
+            rows = [task_row(t) for t in chunk]
+            for c, col in enumerate(self._cols):
+                col[row:row] = [r[c] for r in rows]
+            self.endInsertRows()
+            row = end
+
+        # 4. rows whose task content changed
+        changed = [r for r, k in enumerate(self._ids) if k in old_by_key and old_by_key[k] != new[r]]
+        for r in changed:
+            values = task_row(new[r])
+            for c, col in enumerate(self._cols):
+                col[r] = values[c]
+        last_col = len(COLUMNS) - 1
+        for start, end in _ranges(changed):
+            self.dataChanged.emit(self.index(start, 0), self.index(end, last_col))
+
+        self._tasks = new
+        self._list_changed()
+        return False
+
+    def _apply_permutation(self, order: List[int]) -> None:
+        """Reorder materialized rows so new row i is old row order[i]; keeps persistent indexes."""
+        self.layoutAboutToBeChanged.emit()
+        self._ids = [self._ids[r] for r in order]
+        self._cols = [[col[r] for r in order] for col in self._cols]
+        new_row_of = {old: new for new, old in enumerate(order)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_row_of[i.row()], i.column()) for i in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+    def total_rows(self) -> int:
+        return len(self._tasks)
+
+    def task_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Task dict at a position of the full list (materialized or not)."""
+        return self._tasks[row] if 0 <= row < len(self._tasks) else None
+
+    def key_at(self, row: int) -> Optional[str]:
+        """Task key of a materialized row (None for the placeholder row)."""
+        if self._message is not None or not 0 <= row < len(self._ids):
+            return None
+        return self._ids[row]
+
+    def rows_of_keys(self, keys) -> List[int]:
+        """Sorted positions (in the full task list) of the given task keys; unknown keys are skipped."""
+        if self._message is not None:
+            return []
+        if self._row_of is None:
+            self._row_of = {task_key(t): i for i, t in enumerate(self._tasks)}
+        row_of = self._row_of
+        return sorted(row_of[k] for k in keys if k in row_of)
+
+    def row_data(self, row: int, col: int, role: int = _DISPLAY_ROLE) -> Any:
+        """data() for any row of the full list, materialized or not (used by TaskFilterProxy)."""
+        role = int(role)
+        if row < len(self._ids) or self._message is not None:
+            return self.data(self.index(row, col), role)
+        if not 0 <= row < len(self._tasks):
+            return None
+        if role == _DISPLAY_ROLE:
+            if col == 0:
+                return str(row + 1)
+            values = self._row_cache.get(row)
+            if values is None:
+                if len(self._row_cache) > 4 * self.batch_size:
+                    self._row_cache.clear()
+                values = self._row_cache[row] = task_row(self._tasks[row])
+            return values[col - 1]
+        if role == _TOOLTIP_ROLE and col == 0:
+            return task_key(self._tasks[row]) or None
+        return None
+
+    def _list_changed(self) -> None:
+        self._row_of = None
+        self._row_cache = {}
+        self.list_changed.emit()
+
+    # -------------------------
+    # QAbstractTableModel API
+    # -------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return 1 if self._message is not None else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() or self._message is not None:
+            return False
+        return len(self._ids) < len(self._tasks) or (self._remote_more and not self._remote_pending)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        start = len(self._ids)
+        count = min(self.batch_size, len(self._tasks) - start)
+        if count <= 0:
+            if self._remote_more and not self._remote_pending:
+                self._remote_pending = True
+                self.more_requested.emit()
+            return
+        self.beginInsertRows(QModelIndex(), start, start + count - 1)
+        self._materialize(count)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE) -> Any:
+        role = int(role)
+        if role == _DISPLAY_ROLE:
+            col = index.column()
+            if self._message is not None:
+                return self._message if col == 0 else None
+            # Column 0: visible index (1-based)
+            return str(index.row() + 1) if col == 0 else self._cols[col - 1][index.row()]
+        if role == _TOOLTIP_ROLE and self._message is None and index.column() == 0:
+            # real id as tooltip on the row's first cell
+            return self._ids[index.row()] or None
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self._message is not None:
+            return Qt.ItemIsEnabled
+        return _ROW_FLAGS
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(COLUMNS):
+            return COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def sample_column(self, col: int, limit: int = 200) -> List[str]:
+        """Evenly spaced sample of a column's display strings (for column sizing)."""
+        if self._message is not None:
+            return [self._message] if col == 0 else []
+        n = len(self._ids)
+        if not n:
+            return []
+        step = max(1, n // limit)
+        if col == 0:
+            return [str(n)]
+        return self._cols[col - 1][::step][:limit]
+
+
+
+class TaskFilterProxy(QAbstractProxyModel):
+    """
+    Rows of a TaskTableModel whose task is in a search result.
+
+    The row mapping is computed in bulk from the result (doc id -> task key ->
+    position in the model's full list) rather than by a per-row filter callback,
+    so matches past the materialized prefix show up without materializing the
+    rows in between. Any change of the source list recomputes the mapping.
+    """
+
+    def __init__(self, index: TaskSearchIndex, parent=None):
+        super().__init__(parent)
+        self._index = index
+        self._match: Optional[Set[int]] = None
+        self._rows: List[int] = []            # proxy row -> source row (full list position)
+        self._proxy_rows: Dict[int, int] = {}  # source row -> proxy row (built on demand)
+
+    def setSourceModel(self, model: "TaskTableModel") -> None:
+        super().setSourceModel(model)
+        model.list_changed.connect(self._on_source_changed)
+
+    def set_match(self, doc_ids: Optional[Set[int]]) -> None:
+        """Doc ids from TaskSearchIndex.search_ids(); None shows every row."""
+        self._match = doc_ids
+        self._remap()
+
+    def is_active(self) -> bool:
+        return self._match is not None
+
+    def _on_source_changed(self) -> None:
+        if self._match is not None:
+            self._remap()
+
+    def _remap(self) -> None:
+        self.beginResetModel()
+        source = self.sourceModel()
+        if self._match is None or source is None:
+            self._rows = []
+        else:
+            self._rows = source.rows_of_keys(self._index.keys_of(self._match))
+        self._proxy_rows = {}
+        self.endResetModel()
+
+    # -------------------------
+    # QAbstractProxyModel API
+    # -------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._match is None:
+            return self.sourceModel().rowCount() if self.sourceModel() else 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < self.rowCount() and 0 <= column < len(COLUMNS)):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, *args):
+        return QModelIndex()
+
+    def _source_row(self, row: int) -> int:
+        return row if self._match is None else self._rows[row]
+
+    def task_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Task dict shown at a proxy row."""
+        if not 0 <= row < self.rowCount():
+            return None
+        return self.sourceModel().task_at(self._source_row(row))
+
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid():
+            return QModelIndex()
+        # rows past the materialized prefix have no source index
+        return self.sourceModel().index(self._source_row(proxy_index.row()), proxy_index.column())
+
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._match is None:
+            return self.index(source_index.row(), source_index.column())
+        if not self._proxy_rows and self._rows:
+            self._proxy_rows = {r: i for i, r in enumerate(self._rows)}
+        row = self._proxy_rows.get(source_index.row())
+        return QModelIndex() if row is None else self.index(row, source_index.column())
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE) -> Any:
+        if not index.isValid():
+            return None
+        return self.sourceModel().row_data(self._source_row(index.row()), index.column(), role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return _ROW_FLAGS if self._match is not None else self.sourceModel().flags(self.mapToSource(index))
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        # a search result is complete; paging only applies to the unfiltered list
+        return self._match is None and self.sourceModel().canFetchMore(parent)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if self._match is None:
+            self.sourceModel().fetchMore(parent)
+
+
+def _ranges(rows: List[int]) -> List[tuple]:
+    """Collapse sorted row numbers into inclusive (start, end) ranges."""
+    out: List[tuple] = []
+    for r in rows:
+        if out and out[-1][1] == r - 1:
+            out[-1] = (out[-1][0], r)
+        else:
+            out.append((r, r))
+    return out
@@ -0,0 +1,211 @@
+# app/ui/task_store.py
+"""
+Observable, TTL-cached store for the current user's tasks.
+
+Every view (task table, timesheet chart, future sections) subscribes to one
+TaskStore instead of calling get_my_tasks() itself, so a dashboard refresh
+costs a single /task/my-tasks round-trip no matter how many views exist.
+
+Usage:
+    store = get_task_store()
+    store.tasks_changed.connect(self._on_tasks)     # list of task dicts
+    store.load_failed.connect(self._on_error)       # error message
+    store.refresh()                                 # no-op while cache is fresh
+    store.refresh(force=True)                       # always hit the backend
+    store.start_polling()                           # cheap background sync
+    on_tasks = store.result_handler()               # for a sync_my_tasks() run elsewhere
+
+Fetches go through task_client.sync_my_tasks(), so a poll against an
+unchanged task list is a bodyless 304 and subscribers are only notified when
+the merged task index actually changed.
+
+load_cached() renders the last-known list from the on-disk TaskCache before
+the network answers; every changed sync is written back in the background.
+
+`search_index` (a TaskSearchIndex) follows the task list: it is updated
+incrementally off the GUI thread after every change, then index_changed fires.
+
+invalidate() starts a new generation: results of fetches started before it
+(e.g. still in flight at logout) are dropped instead of bringing the previous
+user's tasks back. Loaded tasks remember whose they are: load_cached() and
+refresh() invalidate first when AppState's user has changed since.
+"""
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.api.task_client import sync_my_tasks, reset_task_sync, task_sync, task_pager
+from app.ui.workers import get_executor
+from app.utils.state import AppState
+from app.utils.task_cache import get_task_cache
+from app.utils.task_index import TaskSearchIndex
+
+DEFAULT_TTL_SECONDS = float(os.getenv("TASKS_CACHE_TTL", "30"))
+DEFAULT_POLL_SECONDS = float(os.getenv("TASKS_POLL_SECONDS", "30"))
+
+
+class TaskStore(QObject):
+    """Single source of truth for task data; notifies subscribers on change."""
+
+    loading = Signal()
+    # object, not list: a list signal deep-converts every task dict on each emit
+    tasks_changed = Signal(object)
+    load_failed = Signal(str)
+    index_changed = Signal()
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, parent=None):
+        super().__init__(parent)
+        self.ttl_seconds = ttl_seconds
+        self._tasks: Optional[List[Dict[str, Any]]] = None
+        self._owner: Optional[str] = None   # user email the loaded tasks belong to
+        self._fetched_at = 0.0
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(lambda: self.refresh(force=True))
+        self._save_dirty = False
+        self.search_index = TaskSearchIndex()
+        self._index_dirty = False
+        self._generation = 0
+
+    # -------------------------
+    # Public API
+    # -------------------------
+    def tasks(self) -> Optional[List[Dict[str, Any]]]:
+        """Cached tasks, or None if nothing has been loaded yet."""
+        return self._tasks
+
+    def load_cached(self) -> bool:
+        """
+        Seed the store from the on-disk snapshot (synchronous, fast). Cached data
+        counts as stale, so the next refresh() still reconciles with the backend.
+        """
+        self._drop_other_user()
+        if self._tasks is not None:
+            return True
+        email = AppState.get_user_email()
+        snap = get_task_cache().load(email)
+        if not snap:
+            return False
+        tasks = snap.get("tasks") or []
+        task_sync().restore(tasks, snap.get("sync") or {})
+        self._tasks = tasks
+        self._owner = email
+        self._fetched_at = 0.0
+        self.tasks_changed.emit(self._tasks)
+        self._reindex()
+        return True
+
+    def is_fresh(self) -> bool:
+        return self._tasks is not None and (time.monotonic() - self._fetched_at) < self.ttl_seconds
+
+    def refresh(self, force: bool = False) -> None:
+        """Fetch tasks unless the cache is still fresh (or a fetch is already running)."""
+        self._drop_other_user()
+        if not force and self.is_fresh():
+            return
+        generation = self._generation
+        # keyed per generation: a fetch from before invalidate() is never joined
+        if get_executor().run(f"tasks:{generation}", sync_my_tasks,
+                              on_result=self.result_handler(),
+                              on_error=lambda msg: generation == self._generation and self.load_failed.emit(msg),
+                              owner=self):
+            self.loading.emit()
+
+    def result_handler(self) -> Callable[[Dict[str, Any]], None]:
+        """
+        GUI-thread callback applying a sync_my_tasks() result started now (e.g. on
+        the async API loop); ignored if invalidate() runs before it arrives.
+        """
+        generation = self._generation
+        return lambda result: self._on_result(result, generation)
+
+    def start_polling(self, interval_seconds: float = DEFAULT_POLL_SECONDS) -> None:
+        """Re-sync in the background every `interval_seconds` (304s when unchanged)."""
+        self._poll_timer.start(int(interval_seconds * 1000))
+
+    def stop_polling(self) -> None:
+        self._poll_timer.stop()
+
+    def invalidate(self, clear_disk: bool = False) -> None:
+        """Forget cached tasks and sync state (e.g. on logout)."""
+        self._generation += 1
+        self.stop_polling()
+        if clear_disk:
+            get_task_cache().clear(AppState.get_user_email())
+        self._tasks = None
+        self._owner = None
+        self._fetched_at = 0.0
+        reset_task_sync()
+        task_pager().invalidate()
+        self.search_index.clear()
+        self.index_changed.emit()
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+    def _drop_other_user(self) -> None:
+        """Invalidate tasks (and sync validators) loaded while someone else was logged in."""
+        if self._tasks is not None and self._owner != AppState.get_user_email():
+            self.invalidate()
+
+    def _on_result(self, result: Dict[str, Any], generation: int) -> None:
+        # normalized result: {"success": bool, "data": [...], "count": n}
+        if generation != self._generation:
+            return  # fetched before invalidate(): another user's (or discarded) data
+        if result and result.get("stale"):
+            # the sync state was re-seeded while this request was in flight
+            self.refresh(force=True)
+            return
+        if not result or not result.get("success"):
+            self.load_failed.emit(str((result or {}).get("error") or "Could not fetch tasks"))
+            return
+        first_load = self._tasks is None
+        self._tasks = result.get("data", []) or []
+        self._owner = AppState.get_user_email()
+        self._fetched_at = time.monotonic()
+        if first_load or result.get("changed", True):
+            self.tasks_changed.emit(self._tasks)
+            self._persist()
+            self._reindex()
+
+    def _persist(self) -> None:
+        """Write the snapshot off the GUI thread; re-run if data changed meanwhile."""
+        self._save_dirty = True
+        if get_executor().is_pending("tasks-cache-save"):
+            return
+        self._save_dirty = False
+        get_executor().run(
+            "tasks-cache-save", get_task_cache().save,
+            AppState.get_user_email(), self._tasks, task_sync().export_state(),
+            on_result=lambda _ok: self._save_dirty and self._persist(), owner=self,
+        )
+
+    def _reindex(self) -> None:
+        """Bring the search index up to date off the GUI thread (one update at a time)."""
+        self._index_dirty = True
+        if get_executor().is_pending("tasks-index"):
+            return
+        self._index_dirty = False
+        get_executor().run(
+            "tasks-index", self.search_index.update, list(self._tasks or []),
+            on_result=lambda _n: self._on_reindexed(), owner=self,
+        )
+
+    def _on_reindexed(self) -> None:
+        if self._index_dirty or (self._tasks is None and len(self.search_index)):
+            # tasks changed (or were invalidated) while indexing
+            self._reindex()
+            return
+        self.index_changed.emit()
+
+
+_store: Optional[TaskStore] = None
+
+
+def get_task_store() -> TaskStore:
+    """Shared store; must first be called from the GUI thread."""
+    global _store
+    if _store is None:
+        _store = TaskStore()
+    return _store
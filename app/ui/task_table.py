@@ -1,28 +1,32 @@
 # app/ui/task_table.py
+from typing import Optional
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QLabel, QSizePolicy
+    QWidget, QVBoxLayout, QTableView, QLabel, QLineEdit, QSizePolicy, QAbstractItemView, QHeaderView
 )
-from PySide6.QtCore import Qt
-from app.api.task_client import get_my_tasks
+from PySide6.QtCore import Qt, QTimer, Signal
+from app.api.task_client import TaskQuery, task_pager
+from app.ui.task_store import get_task_store
+from app.ui.task_model import TaskTableModel, TaskFilterProxy, COLUMNS
+from app.ui.workers import get_executor
+
+# column sizing looks at this many sampled rows instead of every cell
+SIZE_SAMPLE_ROWS = 200
+MAX_COLUMN_WIDTH = 360
 
+# header column -> server-side sort key (columns not listed are not sortable)
+SORT_COLUMNS = {1: "task", 2: "assigned_to", 3: "estimated_minutes", 5: "task_highlight", 7: "completed_at"}
 
-def _format_minutes(m: int | None) -> str:
-    if m is None:
-        return ""
-    try:
-        m = int(m)
-    except Exception:
-        return str(m)
-    if m >= 60:
-        h = m // 60
-        mm = m % 60
-        return f"{h}h {mm}m" if mm else f"{h}h"
-    return f"{m} min"
+# search runs once typing pauses for this long
+SEARCH_DEBOUNCE_MS = 150
 
 
 class TaskTable(QWidget):
     """Displays a table of tasks fetched from the backend."""
 
+    # a row was activated (double-click / Enter): the task dict, e.g. to start tracking it
+    task_activated = Signal(object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         layout = QVBoxLayout(self)
@@ -34,19 +38,43 @@ class TaskTable(QWidget):
         title.setStyleSheet("font-weight:600;font-size:15px;")
         layout.addWidget(title)
 
-        # Table setup
-        self.table = QTableWidget()
-        self.table.setColumnCount(8)
+        # search box: queries the store's in-memory index, debounced while typing
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search tasks (title, description, highlight, assignee)…")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.setStyleSheet(
+            "QLineEdit { background-color: #2b2b2b; color: white; border: 1px solid #444; padding: 4px; }"
+        )
+        layout.addWidget(self.search_input)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        self.search_input.textChanged.connect(lambda _text: self._search_timer.start())
+
+        # Table setup: model/view, rows are materialized lazily as the user scrolls;
+        # while a search is active the view shows the filtering proxy instead
+        store = get_task_store()
+        self.model = TaskTableModel(parent=self)
+        self.proxy = TaskFilterProxy(store.search_index, parent=self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setMinimumHeight(250)
         self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.table.setHorizontalHeaderLabels([
-            "#", "Task", "Assignee", "Time Required", "Description",
-            "Task Highlight", "Time Recorded", "Completed At"
-        ])
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        # fixed row height: the view never has to measure rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 10)
         self.table.horizontalHeader().setStretchLastSection(True)
+        # header clicks sort on the server; "#" goes back to the default order
+        self.table.horizontalHeader().setSectionsClickable(True)
+        self.table.horizontalHeader().sectionClicked.connect(self._on_header_clicked)
         self.table.setAlternatingRowColors(True)
+        self.table.activated.connect(self._on_row_activated)
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 alternate-background-color: #252525;
                 color: white;
@@ -64,62 +92,183 @@ class TaskTable(QWidget):
 
         layout.addWidget(self.table)
 
-        # initial load
-        self.load_tasks()
+        # None: full list from the task store; otherwise pages of this server-side query
+        self._query: Optional[TaskQuery] = None
+        self._pages_loaded = 0
+        self.model.more_requested.connect(self._load_next_page)
+
+        # data comes from the shared task store (one fetch for every view)
+        store.tasks_changed.connect(self._apply_tasks)
+        store.load_failed.connect(self._on_load_failed)
+        store.index_changed.connect(self._on_index_changed)
+
+        # render cached tasks right away; the first fetch is the owner's call to
+        # load_tasks(), so building the table (e.g. prebuilt before login) is offline
+        if store.tasks() is not None:
+            self._apply_tasks(store.tasks())
 
     # -------------------------
     # Public API
     # -------------------------
     def refresh(self) -> None:
         """Reload tasks from backend."""
-        self.load_tasks()
+        get_task_store().refresh(force=True)
+
+    def set_query(self, query: Optional[TaskQuery]) -> None:
+        """
+        Show a sorted/filtered server-side view, fetched page by page as the user
+        scrolls (None: back to the full store-backed list).
+        """
+        self._query = query
+        self._pages_loaded = 0
+        header = self.table.horizontalHeader()
+        column = next((c for c, key in SORT_COLUMNS.items() if query and key == query.sort), None)
+        header.setSortIndicatorShown(column is not None)
+        if column is not None:
+            header.setSortIndicator(column, Qt.DescendingOrder if query.descending else Qt.AscendingOrder)
+        if query is None:
+            self._apply_tasks(get_task_store().tasks() or [])
+            return
+        self._show_message("⏳ Loading tasks…")
+        self._request_page(query, 0)
+
+    def set_filter(self, status: Optional[str] = None, created_from: Optional[str] = None,
+                   created_to: Optional[str] = None) -> None:
+        """Filter by status / creation date on the server, keeping the current sort."""
+        base = self._query or TaskQuery()
+        query = base._replace(status=status, created_from=created_from, created_to=created_to)
+        self.set_query(query if _narrows(query) else None)
 
     # -------------------------
     # Internal helpers
     # -------------------------
     def load_tasks(self) -> None:
-        result = get_my_tasks()
-        # normalized result: {"success": bool, "data": [...], "count": n}
-        if not result or not result.get("success"):
-            # single-row friendly error message
-            self.table.clearContents()
-            self.table.setRowCount(1)
-            item = QTableWidgetItem("⚠️ Could not fetch tasks")
-            item.setFlags(Qt.ItemIsEnabled)
-            self.table.setItem(0, 0, item)
-            # clear remaining cells
-            for c in range(1, self.table.columnCount()):
-                self.table.setItem(0, c, QTableWidgetItem(""))
+        """Ask the store for tasks; the table fills in when they arrive."""
+        if self.model.rowCount() == 0:
+            self._show_message("⏳ Loading tasks…")
+        get_task_store().refresh()
+
+    def _on_load_failed(self, _message: str) -> None:
+        # keep showing cached rows if we have them
+        if get_task_store().tasks() is None:
+            self._show_message("⚠️ Could not fetch tasks")
+
+    def _on_row_activated(self, index) -> None:
+        task = self.table.model().task_at(index.row())
+        if task:
+            self.task_activated.emit(task)
+
+    def _apply_search(self) -> None:
+        match = get_task_store().search_index.search_ids(self.search_input.text())
+        self.proxy.set_match(match)
+        view_model = self.model if match is None else self.proxy
+        if self.table.model() is not view_model:
+            self.table.setModel(view_model)
+            self._size_columns()
+
+    def _on_index_changed(self) -> None:
+        # doc ids may have been reassigned: re-run an active search
+        if self.search_input.text().strip():
+            self._apply_search()
+
+    def _show_message(self, text: str) -> None:
+        """Single-row placeholder (loading / error)."""
+        self.model.set_message(text)
+        self._size_columns()
+
+    def _apply_tasks(self, tasks) -> None:
+        if self._query is not None:
+            # task list changed: re-read the pages we show (the diff keeps scroll position)
+            self._reload_pages()
             return
+        # keyed diff: polls only touch changed rows, selection/scroll stay put
+        if self.model.update_tasks(tasks or []):
+            self._size_columns()
 
-        tasks = result.get("data", []) or []
-        self.table.setRowCount(len(tasks))
-        for row, task in enumerate(tasks):
-            # support different backend shapes
-            task_id = task.get("id") or task.get("task_id") or ""
-            title = task.get("task") or task.get("title") or task.get("name") or ""
-            assigned_to = task.get("assigned_to") or task.get("assignee") or "-"
-            estimated_minutes = task.get("estimated_minutes") or task.get("time_required") or None
-            description = task.get("description") or ""
-            highlight = task.get("task_highlight") or task.get("highlight") or ""
-            time_recorded = task.get("time_recorded") or ""
-            completed_at = task.get("completed_at") or ""
-
-            # Column 0: visible index (1-based). Put real id as tooltip on the row's first cell.
-            idx_item = QTableWidgetItem(str(row + 1))
-            idx_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-            if task_id:
-                idx_item.setToolTip(str(task_id))
-            self.table.setItem(row, 0, idx_item)
-
-            self.table.setItem(row, 1, QTableWidgetItem(str(title)))
-            self.table.setItem(row, 2, QTableWidgetItem(str(assigned_to)))
-            self.table.setItem(row, 3, QTableWidgetItem(_format_minutes(estimated_minutes)))
-            self.table.setItem(row, 4, QTableWidgetItem(str(description)))
-            self.table.setItem(row, 5, QTableWidgetItem(str(highlight)))
-            self.table.setItem(row, 6, QTableWidgetItem(str(time_recorded)))
-            self.table.setItem(row, 7, QTableWidgetItem(str(completed_at)))
-
-        # Resize columns to contents but keep last section stretched
-        self.table.resizeColumnsToContents()
+    # -------------------------
+    # Server-side paging
+    # -------------------------
+    def _on_header_clicked(self, column: int) -> None:
+        key = SORT_COLUMNS.get(column)
+        base = self._query or TaskQuery()
+        if key is None:
+            # unsortable column ("#" etc.): default order, keep filters
+            query = base._replace(sort=None, descending=False)
+        else:
+            query = base._replace(sort=key, descending=base.sort == key and not base.descending)
+        self.set_query(query if _narrows(query) else None)
+
+    def _load_next_page(self) -> None:
+        if self._query is None:
+            self.model.set_more_available(False)
+            return
+        self._request_page(self._query, self._pages_loaded)
+
+    def _request_page(self, query: TaskQuery, index: int) -> None:
+        page = task_pager().cached(query, index)
+        if page is not None:
+            self._on_page(query, index, page)
+            return
+        get_executor().run(
+            f"task-page:{query}:{index}", task_pager().page, query, index,
+            on_result=lambda res: self._on_page(query, index, res),
+            on_error=lambda msg: self._on_page(query, index, {"success": False, "error": msg}),
+            owner=self,
+        )
+
+    def _on_page(self, query: TaskQuery, index: int, page) -> None:
+        if query != self._query or index != self._pages_loaded:
+            return  # stale: sort/filter changed or the page was already applied
+        if not page or not page.get("success"):
+            if index == 0:
+                self._show_message("⚠️ Could not fetch tasks")
+            else:
+                self.model.set_more_available(False)
+            return
+        if index == 0:
+            self.model.set_tasks(page["data"], page["has_more"])
+            self._size_columns()
+        else:
+            self.model.append_tasks(page["data"], page["has_more"])
+        self._pages_loaded = index + 1
+        if page["has_more"]:
+            self._prefetch(query, index + 1)
+
+    def _prefetch(self, query: TaskQuery, index: int) -> None:
+        """Warm the page cache with the next page so scrolling to it is instant."""
+        if task_pager().cached(query, index) is None:
+            get_executor().run(f"task-page:{query}:{index}", task_pager().page, query, index, owner=self)
+
+    def _reload_pages(self) -> None:
+        query, count = self._query, max(1, self._pages_loaded)
+        task_pager().invalidate()
+        get_executor().run(
+            f"task-pages-reload:{query}", task_pager().pages, query, count,
+            on_result=lambda res: self._on_reloaded(query, res), owner=self,
+        )
+
+    def _on_reloaded(self, query: TaskQuery, res) -> None:
+        if query != self._query or not res or not res.get("success"):
+            return
+        self._pages_loaded = res["pages"]
+        if self.model.update_tasks(res["data"], res["has_more"]):
+            self._size_columns()
+
+    def _size_columns(self) -> None:
+        """Size columns from the header plus a sample of rows (not every cell)."""
+        fm = self.table.fontMetrics()
+        header_fm = self.table.horizontalHeader().fontMetrics()
+        for col in range(len(COLUMNS) - 1):  # last section stretches
+            width = header_fm.horizontalAdvance(COLUMNS[col]) + 24
+            for text in self.model.sample_column(col, SIZE_SAMPLE_ROWS):
+                width = max(width, fm.horizontalAdvance(text) + 16)
+                if width >= MAX_COLUMN_WIDTH:
+                    width = MAX_COLUMN_WIDTH
+                    break
+            self.table.setColumnWidth(col, width)
         self.table.horizontalHeader().setStretchLastSection(True)
+
+
+def _narrows(query: TaskQuery) -> bool:
+    """True if the query sorts or filters (otherwise the store's full list is shown)."""
+    return bool(query.sort or query.status or query.created_from or query.created_to)
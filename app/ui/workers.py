@@ -0,0 +1,136 @@
+# app/ui/workers.py
+"""
+QThreadPool-backed executor for blocking network calls from the UI.
+
+Widgets never call the API on the GUI thread; they hand a blocking function to
+the executor and get the result back on the GUI thread:
+
+    executor = get_executor()
+    executor.run("tasks", get_my_tasks, on_result=self._apply_tasks, owner=self)
+
+- Coalescing: a request with the same key as one already in flight does not
+  start a second call; its callback is attached to the pending one.
+- Cancellation: callbacks are tied to an `owner` QObject. cancel(owner) (call it
+  from closeEvent) or the owner's destruction drops them, so late results never
+  reach a closed window.
+"""
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+# on_result(result) ; on_error(message)
+ResultCallback = Callable[[Any], None]
+ErrorCallback = Callable[[str], None]
+
+
+class _JobSignals(QObject):
+    done = Signal(str, object, object)  # key, result, error message
+
+
+class _Job(QRunnable):
+    def __init__(self, key: str, fn: Callable[..., Any], args: tuple, kwargs: dict):
+        super().__init__()
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _JobSignals()
+        self.setAutoDelete(True)
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.done.emit(self.key, None, str(e))
+            return
+        self.signals.done.emit(self.key, result, None)
+
+
+class RequestExecutor(QObject):
+    """Runs blocking calls on a QThreadPool and delivers results on the GUI thread."""
+
+    started = Signal(str)              # key
+    finished = Signal(str, object)     # key, result
+    failed = Signal(str, str)          # key, error message
+
+    def __init__(self, pool: Optional[QThreadPool] = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        # key -> [(owner_id, on_result, on_error)]
+        self._waiters: Dict[str, List[Tuple[Optional[int], Optional[ResultCallback], Optional[ErrorCallback]]]] = {}
+        self._jobs: Dict[str, _Job] = {}
+        self._watched: Dict[int, QObject] = {}
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._waiters
+
+    def run(self, key: str, fn: Callable[..., Any], *args,
+            on_result: Optional[ResultCallback] = None, on_error: Optional[ErrorCallback] = None,
+            owner: Optional[QObject] = None, **kwargs) -> bool:
+        """
+        Run fn(*args, **kwargs) off the GUI thread. Returns True if a new call was
+        started, False if it was coalesced into an identical in-flight request.
+        """
+        owner_id = self._watch(owner)
+        waiter = (owner_id, on_result, on_error)
+        if key in self._waiters:
+            self._waiters[key].append(waiter)
+            return False
+
+        self._waiters[key] = [waiter]
+        job = _Job(key, fn, args, kwargs)
+        job.signals.done.connect(self._on_done)
+        self._jobs[key] = job  # keep the signals object alive until delivery
+        self.started.emit(key)
+        self._pool.start(job)
+        return True
+
+    def cancel(self, owner: QObject) -> None:
+        """Drop every pending callback registered by `owner` (e.g. on window close)."""
+        self._drop_owner(id(owner))
+
+    def _watch(self, owner: Optional[QObject]) -> Optional[int]:
+        if owner is None:
+            return None
+        owner_id = id(owner)
+        if owner_id not in self._watched:
+            self._watched[owner_id] = owner
+            owner.destroyed.connect(lambda *_a, oid=owner_id: self._drop_owner(oid))
+        return owner_id
+
+    def _drop_owner(self, owner_id: int) -> None:
+        self._watched.pop(owner_id, None)
+        for key in list(self._waiters):
+            self._waiters[key] = [w for w in self._waiters[key] if w[0] != owner_id]
+
+    @Slot(str, object, object)
+    def _on_done(self, key: str, result: Any, error: Optional[str]) -> None:
+        waiters = self._waiters.pop(key, [])
+        self._jobs.pop(key, None)
+        if error is None:
+            self.finished.emit(key, result)
+        else:
+            self.failed.emit(key, error)
+        for _owner_id, on_result, on_error in waiters:
+            try:
+                if error is None:
+                    if on_result:
+                        on_result(result)
+                elif on_error:
+                    on_error(error)
+            except Exception:
+                traceback.print_exc()
+
+
+_executor: Optional[RequestExecutor] = None
+
+
+def get_executor() -> RequestExecutor:
+    """Shared executor; must first be called from the GUI thread."""
+    global _executor
+    if _executor is None:
+        _executor = RequestExecutor()
+    return _executor
@@ -0,0 +1,26 @@
+# app/utils/paths.py
+"""
+Filesystem locations for local app data (spool, caches).
+
+Everything lives under a per-user data dir next to the QSettings data:
+  <GenericDataLocation>/PyTrack/PyTrackDesktop/
+Set PYTRACK_DATA_DIR to override (useful for dev / multiple profiles).
+"""
+import os
+from pathlib import Path
+
+from PySide6.QtCore import QStandardPaths
+
+from app.utils.state import AppState
+
+
+def app_data_dir() -> Path:
+    """Return (and create) the per-user app data directory."""
+    override = os.getenv("PYTRACK_DATA_DIR")
+    if override:
+        path = Path(override)
+    else:
+        base = QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation) or str(Path.home())
+        path = Path(base) / AppState._ORG / AppState._APP
+    path.mkdir(parents=True, exist_ok=True)
+    return path
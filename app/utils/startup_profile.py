@@ -0,0 +1,303 @@
+# app/utils/startup_profile.py
+"""
+Startup profiling mode: where does the time go before the first window?
+
+Enable with an env var or a CLI flag on app/main.py:
+    PYTRACK_PROFILE=startup.json python -m app.main
+    python -m app.main --profile-startup [startup.json] [--profile-exit]
+
+PYTRACK_PROFILE_EXIT=1 / --profile-exit quits once the report is written,
+which makes the mode usable on a headless build box:
+    QT_QPA_PLATFORM=offscreen python -m app.main --profile-startup out.json --profile-exit
+
+The JSON report contains:
+  - imports: per-module import cost in the style of `python -X importtime`
+    (self/cumulative microseconds, nesting depth, importing thread), recorded
+    from the moment profiling is switched on at the top of app/main.py;
+  - phases: named durations (QApplication, splash, profile fetch, window
+    construction, QSS load, asset pixmap scaling, deferred dashboard start...);
+  - marks: milestones in ms since profiling started (first_paint = first frame
+    of any window, window_ready = first frame of the login/dashboard window);
+  - process_ms: how long the interpreter ran before profiling started (Linux).
+
+The report is written PYTRACK_PROFILE_SETTLE_MS (default 1000) after
+window_ready, so work deferred past the first frame is included.
+
+Instrumentation points cost nothing when profiling is off:
+    from app.utils import startup_profile
+    with startup_profile.phase("qss_load:dashboard"):
+        ...
+    startup_profile.mark("event_loop")
+"""
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List, Optional
+
+DEFAULT_REPORT = "startup_profile.json"
+SETTLE_MS = int(os.getenv("PYTRACK_PROFILE_SETTLE_MS", "1000"))
+READY_WINDOWS = ("LoginWindow", "DashboardWindow")
+REPORT_VERSION = 1
+
+_NULL = nullcontext()
+_profile: Optional["_Profile"] = None
+
+
+class _TimedLoader:
+    """Wraps a module loader to time exec_module(); everything else is delegated."""
+
+    def __init__(self, loader, timer: "_ImportTimer"):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # the module (and anything reading its spec later) sees the real loader
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        self._timer.enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(module.__name__)
+
+
+class _ImportTimer:
+    """
+    sys.meta_path hook: finds specs through the remaining finders and wraps
+    their loaders, keeping a per-thread stack to split self/cumulative time.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self._records = records
+        self._local = threading.local()
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            if find is None:
+                continue
+            spec = find(name, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def enter(self) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append([time.perf_counter(), 0.0])  # start, time spent in nested imports
+
+    def leave(self, name: str) -> None:
+        stack = self._local.stack
+        start, children = stack.pop()
+        total = time.perf_counter() - start
+        if stack:
+            stack[-1][1] += total
+        self._records.append({
+            "module": name,
+            "self_us": int((total - children) * 1e6),
+            "cumulative_us": int(total * 1e6),
+            "depth": len(stack),
+            "thread": threading.current_thread().name,
+        })
+
+
+class _Profile:
+    def __init__(self, path: str, exit_after: bool):
+        self.path = path
+        self.exit_after = exit_after
+        self.t0 = time.perf_counter()
+        self.started_at = time.time()
+        self.process_ms = _process_age_ms()
+        self.marks: Dict[str, Any] = {}
+        self.phases: List[Dict[str, Any]] = []
+        self.imports: List[Dict[str, Any]] = []
+        self.importer = _ImportTimer(self.imports)
+        self.written = False
+        self._lock = threading.Lock()
+
+    def ms(self) -> float:
+        return round((time.perf_counter() - self.t0) * 1000.0, 2)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = list(self.phases)
+            marks = dict(self.marks)
+        imports = list(self.imports)
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self.started_at,
+            "build": os.getenv("PYTRACK_BUILD_ID"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "qt_platform": os.getenv("QT_QPA_PLATFORM") or _qt_platform(),
+            "process_ms": self.process_ms,
+            "marks": marks,
+            "phases": phases,
+            "import_total_ms": round(sum(r["cumulative_us"] for r in imports if r["depth"] == 0) / 1000.0, 2),
+            "imports": imports,
+        }
+
+
+def _process_age_ms() -> Optional[float]:
+    """Milliseconds since this process started (Linux /proc; None elsewhere)."""
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            start_ticks = int(f.read().rsplit(b")", 1)[1].split()[19])
+        with open("/proc/uptime", "rb") as f:
+            uptime = float(f.read().split()[0])
+        return round((uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000.0, 1)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _qt_platform() -> Optional[str]:
+    gui = sys.modules.get("PySide6.QtGui")
+    if gui is None:
+        return None
+    app = gui.QGuiApplication.instance()
+    return app.platformName() if app is not None else None
+
+
+# -------------------------
+# Public API
+# -------------------------
+def configure(argv: List[str]) -> bool:
+    """
+    Switch profiling on if PYTRACK_PROFILE or --profile-startup asks for it.
+    Strips the profiling flags from `argv` (so Qt never sees them). Call as
+    early as possible: imports before this call are not recorded.
+    """
+    path = os.getenv("PYTRACK_PROFILE") or None
+    exit_after = os.getenv("PYTRACK_PROFILE_EXIT") == "1"
+    rest = argv[:1]
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--profile-exit":
+            exit_after = True
+        elif arg.startswith("--profile-startup="):
+            path = arg.split("=", 1)[1] or DEFAULT_REPORT
+        elif arg == "--profile-startup":
+            # optional value: the next argument, unless it is another flag
+            if i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+                i += 1
+                path = argv[i]
+            else:
+                path = path or DEFAULT_REPORT
+        else:
+            rest.append(arg)
+        i += 1
+    argv[:] = rest
+    if path:
+        enable(path, exit_after)
+    return path is not None
+
+
+def enable(path: str = DEFAULT_REPORT, exit_after: bool = False) -> None:
+    global _profile
+    if _profile is not None:
+        return
+    _profile = _Profile(path, exit_after)
+    sys.meta_path.insert(0, _profile.importer)
+    print(f"[✅] Startup profiling on, report -> {path}")
+
+
+def enabled() -> bool:
+    return _profile is not None
+
+
+def mark(name: str) -> None:
+    """Record a milestone (first occurrence wins)."""
+    prof = _profile
+    if prof is None:
+        return
+    with prof._lock:
+        prof.marks.setdefault(name, prof.ms())
+
+
+def phase(name: str):
+    """Context manager timing a named startup phase (shared no-op when profiling is off)."""
+    if _profile is None:
+        return _NULL
+    return _timed_phase(_profile, name)
+
+
+@contextmanager
+def _timed_phase(prof: _Profile, name: str):
+    start = prof.ms()
+    try:
+        yield
+    finally:
+        end = prof.ms()
+        with prof._lock:
+            prof.phases.append({
+                "name": name,
+                "start_ms": start,
+                "duration_ms": round(end - start, 2),
+                "thread": threading.current_thread().name,
+            })
+
+
+def watch_paints(app) -> None:
+    """
+    Mark first_paint / window_ready from the app's paint events, then write the
+    report SETTLE_MS later (and quit if asked to).
+    """
+    prof = _profile
+    if prof is None:
+        return
+    from PySide6.QtCore import QEvent, QObject, QTimer
+
+    class _PaintWatch(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and obj.isWidgetType() and obj.isWindow():
+                mark("first_paint")
+                name = type(obj).__name__
+                if name in READY_WINDOWS and "window_ready" not in prof.marks:
+                    mark("window_ready")
+                    prof.marks["ready_window"] = name
+                    app.removeEventFilter(self)
+                    QTimer.singleShot(SETTLE_MS, finish)
+            return False
+
+    prof.paint_watch = _PaintWatch(app)
+    app.installEventFilter(prof.paint_watch)
+    app.aboutToQuit.connect(finish)
+
+
+def finish() -> Optional[str]:
+    """Write the report (once); returns its path. Quits the app in --profile-exit mode."""
+    prof = _profile
+    if prof is None or prof.written:
+        return None
+    prof.written = True
+    mark("report")
+    try:
+        with open(prof.path, "w", encoding="utf-8") as f:
+            json.dump(prof.report(), f, indent=1)
+        print(f"[✅] Startup profile written to {prof.path}")
+    except OSError as e:
+        print(f"[❌] Could not write startup profile: {e}")
+    if prof.exit_after:
+        gui = sys.modules.get("PySide6.QtWidgets")
+        app = gui.QApplication.instance() if gui is not None else None
+        if app is not None:
+            app.quit()
+    return prof.path
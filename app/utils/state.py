@@ -1,11 +1,32 @@
+import threading
 from PySide6.QtCore import QSettings
-from typing import Optional
+from typing import Callable, Dict, List, Optional
+
+# listener(snapshot) — snapshot is a copy of the persisted auth fields after the change
+AuthListener = Callable[[Dict[str, Optional[str]]], None]
+
+_AUTH_KEYS = {
+    "access_token": "auth/access_token",
+    "refresh_token": "auth/refresh_token",
+    "user_email": "auth/user_email",
+}
 
 
 class AppState:
     """
     Centralized app state & persisted auth helpers.
     Use AppState.get_access_token(), AppState.set_tokens(...), AppState.clear_auth(), etc.
+
+    Persisted auth lives in an in-memory snapshot guarded by a lock: it is read
+    from QSettings once, reads are plain dict lookups (safe from any thread),
+    and writes go through to QSettings under the same lock. The Authorization
+    header is prebuilt whenever the access token changes, so request code gets
+    it with auth_headers() instead of touching QSettings per call.
+
+    Usage:
+        AppState.auth_headers()                    # {"Authorization": "Bearer ..."} or {}
+        AppState.add_auth_listener(on_auth)        # on_auth(snapshot) after every change
+        AppState.reload()                          # re-read QSettings (changed by another process)
     """
 
     # in-memory (runtime) fields
@@ -18,29 +39,71 @@ class AppState:
     _ORG = "PyTrack"
     _APP = "PyTrackDesktop"
 
-    # QSettings instance (class-level)
+    # QSettings instance (class-level); only touched while holding _lock
     _settings = QSettings(_ORG, _APP)
 
+    _lock = threading.RLock()
+    _auth: Optional[Dict[str, Optional[str]]] = None   # loaded lazily from _settings
+    _headers: Dict[str, str] = {}
+    _listeners: List[AuthListener] = []
+
+    # -------------------------
+    # Snapshot internals
+    # -------------------------
+    @classmethod
+    def _load_locked(cls) -> Dict[str, Optional[str]]:
+        if cls._auth is None:
+            auth = {}
+            for field, key in _AUTH_KEYS.items():
+                val = cls._settings.value(key, None)
+                auth[field] = str(val) if val else None
+            cls._set_snapshot_locked(auth)
+        return cls._auth
+
+    @classmethod
+    def _set_snapshot_locked(cls, auth: Dict[str, Optional[str]]) -> None:
+        token = auth.get("access_token")
+        # readers may hold the previous dicts; they are replaced, never mutated
+        # (headers first, so a reader that sees the new snapshot also sees its header)
+        cls._headers = {"Authorization": f"Bearer {token}"} if token else {}
+        cls._auth = auth
+
+    @classmethod
+    def _update_auth(cls, **fields: Optional[str]) -> None:
+        """Write changed fields to QSettings and the snapshot, then notify listeners."""
+        with cls._lock:
+            current = cls._load_locked()
+            auth = dict(current)
+            auth.update({k: (v or None) for k, v in fields.items()})
+            if auth == current:
+                return
+            for field, value in auth.items():
+                if value == current.get(field):
+                    continue
+                if value:
+                    cls._settings.setValue(_AUTH_KEYS[field], value)
+                else:
+                    cls._settings.remove(_AUTH_KEYS[field])
+            cls._settings.sync()
+            cls._set_snapshot_locked(auth)
+            listeners = list(cls._listeners)
+        cls._notify(listeners, dict(auth))
+
+    @staticmethod
+    def _notify(listeners: List[AuthListener], snapshot: Dict[str, Optional[str]]) -> None:
+        for listener in listeners:
+            try:
+                listener(dict(snapshot))
+            except Exception as e:
+                print(f"[⚠] Auth listener failed: {e}")
+
     # -------------------------
     # Persistence helpers
     # -------------------------
     @staticmethod
     def set_tokens(access_token: Optional[str], refresh_token: Optional[str] = None, user_email: Optional[str] = None) -> None:
         """Persist tokens and email to QSettings (or remove if None)."""
-        if access_token:
-            AppState._settings.setValue("auth/access_token", access_token)
-        else:
-            AppState._settings.remove("auth/access_token")
-
-        if refresh_token:
-            AppState._settings.setValue("auth/refresh_token", refresh_token)
-        else:
-            AppState._settings.remove("auth/refresh_token")
-
-        if user_email:
-            AppState._settings.setValue("auth/user_email", user_email)
-        else:
-            AppState._settings.remove("auth/user_email")
+        AppState._update_auth(access_token=access_token, refresh_token=refresh_token, user_email=user_email)
 
         # keep runtime copy consistent
         AppState.token = access_token
@@ -48,28 +111,75 @@ class AppState:
 
     @staticmethod
     def get_access_token() -> Optional[str]:
-        val = AppState._settings.value("auth/access_token", None)
-        return str(val) if val else None
+        auth = AppState._auth or AppState._locked_snapshot()
+        return auth["access_token"]
 
     @staticmethod
     def get_refresh_token() -> Optional[str]:
-        val = AppState._settings.value("auth/refresh_token", None)
-        return str(val) if val else None
+        auth = AppState._auth or AppState._locked_snapshot()
+        return auth["refresh_token"]
 
     @staticmethod
     def get_user_email() -> Optional[str]:
-        val = AppState._settings.value("auth/user_email", None)
-        return str(val) if val else None
+        auth = AppState._auth or AppState._locked_snapshot()
+        return auth["user_email"]
+
+    @staticmethod
+    def auth_headers() -> Dict[str, str]:
+        """Prebuilt Authorization header for the stored token (shared: do not mutate)."""
+        if AppState._auth is None:
+            AppState._locked_snapshot()
+        return AppState._headers
+
+    @staticmethod
+    def auth_snapshot() -> Dict[str, Optional[str]]:
+        """Copy of the persisted auth fields (access_token, refresh_token, user_email)."""
+        return dict(AppState._locked_snapshot())
+
+    @staticmethod
+    def _locked_snapshot() -> Dict[str, Optional[str]]:
+        with AppState._lock:
+            return AppState._load_locked()
+
+    @staticmethod
+    def reload() -> None:
+        """Drop the snapshot and re-read QSettings (notifies listeners if anything changed)."""
+        with AppState._lock:
+            before = AppState._auth
+            AppState._auth = None
+            AppState._settings.sync()
+            after = AppState._load_locked()
+            listeners = list(AppState._listeners)
+        if before is not None and before != after:
+            AppState._notify(listeners, dict(after))
 
     @staticmethod
     def clear_auth() -> None:
         """Remove persisted auth and clear runtime token/email."""
-        AppState._settings.remove("auth/access_token")
-        AppState._settings.remove("auth/refresh_token")
-        AppState._settings.remove("auth/user_email")
+        AppState._update_auth(access_token=None, refresh_token=None, user_email=None)
         AppState.token = None
         AppState.user_email = None
 
+    # -------------------------
+    # Change notifications
+    # -------------------------
+    @staticmethod
+    def add_auth_listener(listener: AuthListener) -> None:
+        """
+        Call `listener(snapshot)` after every change to the persisted auth.
+        Listeners run on the thread that made the change: UI code should hop
+        to the GUI thread (e.g. via a queued Qt signal) before touching widgets.
+        """
+        with AppState._lock:
+            if listener not in AppState._listeners:
+                AppState._listeners.append(listener)
+
+    @staticmethod
+    def remove_auth_listener(listener: AuthListener) -> None:
+        with AppState._lock:
+            if listener in AppState._listeners:
+                AppState._listeners.remove(listener)
+
     # -------------------------
     # Runtime-only helpers
     # -------------------------
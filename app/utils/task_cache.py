@@ -0,0 +1,115 @@
+# app/utils/task_cache.py
+"""
+Persistent last-known task list for instant dashboard startup.
+
+A small SQLite file next to the other app data holds one compressed JSON
+snapshot per user (tasks plus the sync validators, so the first background
+sync after launch is usually a 304). The schema is versioned with
+PRAGMA user_version; an unknown version is dropped and rebuilt rather than
+migrated, since the cache can always be refetched.
+
+Usage:
+    cache = TaskCache()
+    snap = cache.load(user_email)         # {"tasks": [...], "sync": {...}} or None
+    cache.save(user_email, tasks, sync_state)
+"""
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.utils.paths import app_data_dir
+
+SCHEMA_VERSION = 1
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024   # compressed snapshot size limit
+DEFAULT_MAX_TASKS = 50_000
+
+
+class TaskCache:
+    """Versioned, size-limited on-disk snapshot of the task list."""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 max_tasks: int = DEFAULT_MAX_TASKS):
+        self.path = Path(path) if path else app_data_dir() / "task_cache.sqlite3"
+        self.max_bytes = max_bytes
+        self.max_tasks = max_tasks
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS task_snapshot")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS task_snapshot (
+                user_key TEXT PRIMARY KEY,
+                saved_at REAL NOT NULL,
+                count    INTEGER NOT NULL,
+                payload  BLOB NOT NULL
+            )
+            """
+        )
+        self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def load(self, user_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return {"tasks": [...], "sync": {...}, "saved_at": ts} or None."""
+        if not user_key:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT saved_at, payload FROM task_snapshot WHERE user_key = ?", (user_key,)
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            snap = json.loads(zlib.decompress(row[1]))
+        except Exception:
+            # corrupt snapshot: forget it, the backend is the source of truth
+            self.clear(user_key)
+            return None
+        snap["saved_at"] = row[0]
+        return snap
+
+    def save(self, user_key: Optional[str], tasks: List[Dict[str, Any]], sync_state: Optional[Dict[str, Any]] = None) -> bool:
+        """Persist a snapshot; returns False if it exceeds the size limits."""
+        if not user_key:
+            return False
+        if len(tasks) > self.max_tasks:
+            print(f"[⚠] Task cache skipped: {len(tasks)} tasks exceeds limit of {self.max_tasks}")
+            return False
+        raw = json.dumps({"tasks": tasks, "sync": sync_state or {}}, separators=(",", ":")).encode("utf-8")
+        payload = zlib.compress(raw, 1)
+        if len(payload) > self.max_bytes:
+            print(f"[⚠] Task cache skipped: snapshot is {len(payload)} bytes (limit {self.max_bytes})")
+            return False
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO task_snapshot (user_key, saved_at, count, payload) VALUES (?, ?, ?, ?)",
+                (user_key, time.time(), len(tasks), sqlite3.Binary(payload)),
+            )
+        return True
+
+    def clear(self, user_key: Optional[str] = None) -> None:
+        with self._lock:
+            if user_key is None:
+                self._db.execute("DELETE FROM task_snapshot")
+            else:
+                self._db.execute("DELETE FROM task_snapshot WHERE user_key = ?", (user_key,))
+
+
+_cache: Optional[TaskCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_task_cache() -> TaskCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TaskCache()
+        return _cache
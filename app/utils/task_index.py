@@ -0,0 +1,262 @@
+# app/utils/task_index.py
+"""
+In-memory inverted index for searching cached tasks.
+
+Indexes task title, description, highlight and assignee. Every query word
+matches as a prefix ("inv" finds "invoice"); a word with no prefix match falls
+back to fuzzy matching (one edit: insert, delete, substitute or transpose),
+so "recieve" still finds "receive". Words are ANDed.
+
+The index is maintained incrementally: update(tasks) re-indexes only tasks
+whose searchable text changed and drops tasks that disappeared, so it can be
+fed every sync. It is thread-safe; updates take the lock in chunks so a
+search from the GUI thread never waits for a whole rebuild.
+
+Postings hold small integer doc ids rather than task keys: dense ints hash
+to themselves, which makes set unions/intersections several times faster.
+
+Usage:
+    index = TaskSearchIndex()
+    index.update(tasks)                 # after every sync
+    keys = index.search("fix invo")     # set of task keys (see task_client.task_key)
+    ids = index.search_ids("fix invo")  # same match as doc ids (cheaper)
+    index.doc_id(key) in ids            # membership test, e.g. in a proxy model
+"""
+import bisect
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.api.task_client import task_key
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# fuzzy matching only for words long enough that one edit is still meaningful
+FUZZY_MIN_LEN = 4
+FUZZY_MAX_LEN = 24
+# 1-2 letter prefixes would expand to thousands of tokens; their unions are kept precomputed
+SHORT_PREFIX = 2
+UPDATE_CHUNK = 2000
+
+
+def task_search_text(task: Dict[str, Any]) -> Tuple[str, ...]:
+    """The searchable fields of a task, supporting different backend shapes."""
+    return (
+        str(task.get("task") or task.get("title") or task.get("name") or ""),
+        str(task.get("description") or ""),
+        str(task.get("task_highlight") or task.get("highlight") or ""),
+        str(task.get("assigned_to") or task.get("assignee") or ""),
+    )
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _fuzzy_token(tok: str) -> bool:
+    # a typo'd query word may be one letter shorter than the token; numbers never match fuzzily
+    return FUZZY_MIN_LEN - 1 <= len(tok) <= FUZZY_MAX_LEN and not tok.isdigit()
+
+
+def _deletes(word: str) -> List[str]:
+    return [word[:i] + word[i + 1:] for i in range(len(word))]
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insert/delete/substitute/adjacent swap."""
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    i = 0
+    while i < la and a[i] == b[i]:
+        i += 1
+    if la == lb:
+        if a[i + 1:] == b[i + 1:]:
+            return True
+        # adjacent transposition
+        return i + 1 < la and a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:]
+    return a[i:] == b[i + 1:]
+
+
+class TaskSearchIndex:
+    """Token -> doc id postings plus a sorted vocabulary for prefix lookups."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocab: List[str] = []                 # sorted, for bisect prefix ranges
+        self._docs: Dict[str, Tuple[Tuple[str, ...], Set[str]]] = {}  # key -> (text, tokens)
+        self._ids: Dict[str, int] = {}              # task key -> doc id
+        self._keys: List[Optional[str]] = []        # doc id -> task key
+        self._free: List[int] = []                  # doc ids of removed tasks, reused
+        self._variants: Dict[str, Set[str]] = {}    # one-delete variant -> tokens (fuzzy)
+        self._short: Dict[str, Set[int]] = {}       # 1..SHORT_PREFIX letter prefix -> doc ids
+        self._vocab_dirty = False
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def doc_id(self, key: str) -> int:
+        """Doc id of an indexed task key (-1 if unknown)."""
+        return self._ids.get(key, -1)
+
+    def keys_of(self, doc_ids: Iterable[int]) -> List[str]:
+        """Task keys for doc ids returned by search_ids() (ids freed since are skipped)."""
+        with self._lock:
+            keys = self._keys
+            return [keys[d] for d in doc_ids if d < len(keys) and keys[d] is not None]
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+    def update(self, tasks: Iterable[Dict[str, Any]]) -> int:
+        """
+        Make the index reflect exactly `tasks`: re-index changed/new tasks and drop
+        missing ones. Returns the number of tasks (re)indexed or removed.
+        """
+        seen: Set[str] = set()
+        pending: List[Tuple[str, Tuple[str, ...]]] = []
+        for t in tasks:
+            key = task_key(t)
+            if not key:
+                continue
+            seen.add(key)
+            text = task_search_text(t)
+            doc = self._docs.get(key)
+            if doc is None or doc[0] != text:
+                pending.append((key, text))
+        with self._lock:
+            gone = [k for k in self._docs if k not in seen]
+        for i in range(0, max(len(pending), len(gone)), UPDATE_CHUNK):
+            with self._lock:
+                for key in gone[i:i + UPDATE_CHUNK]:
+                    self._remove_locked(key)
+                for key, text in pending[i:i + UPDATE_CHUNK]:
+                    self._remove_locked(key)
+                    self._add_locked(key, text)
+        with self._lock:
+            if self._vocab_dirty:
+                # one sort per update instead of an insort per new token
+                self._vocab = sorted(self._postings)
+                self._vocab_dirty = False
+        return len(pending) + len(gone)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._postings, self._vocab, self._docs, self._variants, self._short = {}, [], {}, {}, {}
+            self._ids, self._keys, self._free = {}, [], []
+            self._vocab_dirty = False
+
+    def _add_locked(self, key: str, text: Tuple[str, ...]) -> None:
+        tokens = set(tokenize(" ".join(text)))
+        self._docs[key] = (text, tokens)
+        if self._free:
+            doc = self._free.pop()
+            self._keys[doc] = key
+        else:
+            doc = len(self._keys)
+            self._keys.append(key)
+        self._ids[key] = doc
+        for prefix in _short_prefixes(tokens):
+            self._short.setdefault(prefix, set()).add(doc)
+        for tok in tokens:
+            posting = self._postings.get(tok)
+            if posting is None:
+                self._postings[tok] = {doc}
+                self._vocab_dirty = True
+                if _fuzzy_token(tok):
+                    for v in [tok] + _deletes(tok):
+                        self._variants.setdefault(v, set()).add(tok)
+            else:
+                posting.add(doc)
+
+    def _remove_locked(self, key: str) -> None:
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return
+        tokens = entry[1]
+        doc = self._ids.pop(key)
+        self._keys[doc] = None
+        self._free.append(doc)
+        for prefix in _short_prefixes(tokens):
+            docs = self._short[prefix]
+            docs.discard(doc)
+            if not docs:
+                del self._short[prefix]
+        for tok in tokens:
+            posting = self._postings[tok]
+            posting.discard(doc)
+            if posting:
+                continue
+            del self._postings[tok]
+            self._vocab_dirty = True
+            if _fuzzy_token(tok):
+                for v in [tok] + _deletes(tok):
+                    owners = self._variants.get(v)
+                    if owners is not None:
+                        owners.discard(tok)
+                        if not owners:
+                            del self._variants[v]
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def search(self, query: str, fuzzy: bool = True) -> Optional[Set[str]]:
+        """
+        Keys of tasks matching every word of `query`; None for an empty query
+        (meaning "no filter", as opposed to an empty result).
+        """
+        ids = self.search_ids(query, fuzzy)
+        return None if ids is None else set(self.keys_of(ids))
+
+    def search_ids(self, query: str, fuzzy: bool = True) -> Optional[Set[int]]:
+        """Like search(), but returns doc ids (see doc_id())."""
+        words = tokenize(query)
+        if not words:
+            return None
+        with self._lock:
+            matches = []
+            for word in set(words):
+                found = self._match_locked(word, fuzzy)
+                if not found:
+                    return set()
+                matches.append(found)
+            # intersect smallest first; postings are shared, so the result is always a new set
+            matches.sort(key=len)
+            if len(matches) == 1:
+                return set(matches[0])
+            result = matches[0] & matches[1]
+            for found in matches[2:]:
+                if not result:
+                    break
+                result &= found
+            return result
+
+    def _match_locked(self, word: str, fuzzy: bool) -> Set[int]:
+        """Doc ids for one query word. May return an internal set: do not mutate."""
+        if len(word) <= SHORT_PREFIX:
+            return self._short.get(word, set())
+        lo = bisect.bisect_left(self._vocab, word)
+        hi = bisect.bisect_left(self._vocab, word + "\uffff", lo)
+        # the vocabulary is re-sorted at the end of an update; a search racing a
+        # large update may see tokens already dropped from the postings
+        if hi - lo == 1:
+            return self._postings.get(self._vocab[lo], set())
+        if hi > lo:
+            return set().union(*(self._postings.get(t, ()) for t in self._vocab[lo:hi]))
+        if not fuzzy or not FUZZY_MIN_LEN <= len(word) <= FUZZY_MAX_LEN or word.isdigit():
+            return set()
+        candidates: Set[str] = set()
+        for v in [word] + _deletes(word):
+            candidates.update(self._variants.get(v, ()))
+        postings = [self._postings[t] for t in candidates if _within_one_edit(word, t)]
+        return set().union(*postings) if postings else set()
+
+
+def _short_prefixes(tokens: Iterable[str]) -> Set[str]:
+    prefixes = set()
+    for n in range(1, SHORT_PREFIX + 1):
+        prefixes.update(tok[:n] for tok in tokens)
+    return prefixes
@@ -0,0 +1,88 @@
+# benchmarks/_stub_server.py
+"""
+Tiny local HTTP/1.1 stub backend used by the benchmarks.
+
+Speaks keep-alive (protocol_version HTTP/1.1) so pooled clients can reuse
+connections. Routes are registered per server via `routes`.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+
+# handler(method, path, headers, body) -> (status, headers, body_bytes),
+# or None to drop the connection without answering (simulates a reset)
+RouteHandler = Callable[[str, str, Dict[str, str], bytes], Tuple[int, Dict[str, str], bytes]]
+
+
+def json_response(payload, status: int = 200, headers: Dict[str, str] | None = None):
+    h = {"Content-Type": "application/json"}
+    if headers:
+        h.update(headers)
+    return status, h, json.dumps(payload).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # buffer headers + body into one write; avoids Nagle/delayed-ACK stalls on keep-alive
+    wbufsize = -1
+
+    def log_message(self, *args):  # keep benchmark output clean
+        pass
+
+    def _dispatch(self, method: str):
+        length = int(self.headers.get("Content-Length") or 0)
+        if self.server.discard_bodies:
+            # drain in small chunks so in-process memory benchmarks only see the client
+            remaining = length
+            while remaining > 0:
+                remaining -= len(self.rfile.read(min(remaining, 64 * 1024)))
+            body = b""
+        else:
+            body = self.rfile.read(length) if length else b""
+        path = self.path.split("?", 1)[0]
+        handler = self.server.routes.get((method, path)) or self.server.routes.get(("*", path))
+        if handler is None:
+            status, headers, out = json_response({"detail": "not found"}, 404)
+        else:
+            result = handler(method, self.path, dict(self.headers), body)
+            if result is None:
+                self.close_connection = True
+                return
+            status, headers, out = result
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+
+class StubServer:
+    """Run a ThreadingHTTPServer on a free local port in a daemon thread."""
+
+    def __init__(self, routes: Dict[Tuple[str, str], RouteHandler], discard_bodies: bool = False):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.routes = routes
+        self._httpd.discard_bodies = discard_bodies
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
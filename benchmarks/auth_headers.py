@@ -0,0 +1,81 @@
+# benchmarks/auth_headers.py
+"""
+Per-request auth header cost: QSettings read per call (the old
+get_auth_headers) vs AppState's in-memory snapshot, on one thread and on
+several threads at once (GUI + screenshot + worker threads all build headers).
+
+Uses a throwaway INI file instead of the user's real settings.
+
+Run:
+    python -m benchmarks.auth_headers [N]
+"""
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QSettings
+
+from app.utils.state import AppState
+
+THREADS = 4
+
+
+def legacy_headers():
+    """The old path: AppState.get_access_token() went to QSettings every time."""
+    val = AppState._settings.value("auth/access_token", None)
+    tok = str(val) if val else None
+    return {"Authorization": f"Bearer {tok}"} if tok else {}
+
+
+def _per_call_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - t0) / n * 1e6
+
+
+def _threaded_us(fn, n: int, threads: int) -> float:
+    """Wall time per call with `threads` threads each making n calls."""
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(n):
+            if fn is legacy_headers:
+                # QSettings is not safe to share across threads: the old code
+                # raced here; serialize so the numbers are at least meaningful
+                with lock:
+                    fn()
+            else:
+                fn()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    t0 = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return (time.perf_counter() - t0) / (n * threads) * 1e6
+
+
+def main(n: int = 100_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        AppState._settings = QSettings(str(Path(tmp) / "bench.ini"), QSettings.IniFormat)
+        AppState._auth = None
+        AppState.set_tokens("x" * 300, "r" * 300, "bench@example.com")
+
+        assert legacy_headers() == AppState.auth_headers()
+        rows = [
+            ("QSettings per call", _per_call_us(legacy_headers, n), _threaded_us(legacy_headers, n // THREADS, THREADS)),
+            ("in-memory snapshot", _per_call_us(AppState.auth_headers, n),
+             _threaded_us(AppState.auth_headers, n // THREADS, THREADS)),
+        ]
+        print(f"{'':<20}{'1 thread':>14}{f'{THREADS} threads':>14}")
+        for label, single, multi in rows:
+            print(f"{label:<20}{single:>11.3f} us{multi:>11.3f} us")
+        print(f"speedup (1 thread): {rows[0][1] / rows[1][1]:.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
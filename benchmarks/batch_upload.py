@@ -0,0 +1,60 @@
+# benchmarks/batch_upload.py
+"""
+Throughput of single vs batched screenshot upload against a local stub backend
+with simulated round-trip latency (as when a machine drains hours of spool).
+
+Run:
+    python -m benchmarks.batch_upload [FRAMES] [RTT_MS] [BATCH]
+"""
+import json
+import os
+import re
+import sys
+import time
+
+from benchmarks._stub_server import StubServer, json_response
+from app.api import _http
+from app.api.screenshot_client import upload_screenshot, upload_screenshots_batch
+
+_ITEMS_RE = re.compile(rb'name="items"\r\n\r\n(.*?)\r\n--', re.S)
+
+
+def make_routes(rtt_ms: float):
+    def single(method, path, headers, body):
+        time.sleep(rtt_ms / 1000.0)
+        return json_response({"image_url": "http://stub/one.jpg"}, 201)
+
+    def batch(method, path, headers, body):
+        time.sleep(rtt_ms / 1000.0)
+        manifest = json.loads(_ITEMS_RE.search(body).group(1))
+        results = [{"index": m["index"], "status": "success", "image_url": f"http://stub/{m['index']}.jpg"}
+                   for m in manifest]
+        return json_response({"results": results}, 207)
+
+    return {("POST", "/screenshots/upload"): single, ("POST", "/screenshots/upload-batch"): batch}
+
+
+def main(frames: int = 200, rtt_ms: float = 30.0, batch_size: int = 20) -> None:
+    payloads = [os.urandom(100 * 1024) for _ in range(frames)]
+    with StubServer(make_routes(rtt_ms)) as srv:
+        _http.API_URL = srv.url
+
+        t0 = time.perf_counter()
+        for p in payloads:
+            assert upload_screenshot(p, captured_at_iso="now")["status"] == "success"
+        single_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for i in range(0, frames, batch_size):
+            items = [{"image": p, "captured_at": "now"} for p in payloads[i:i + batch_size]]
+            assert upload_screenshots_batch(items)["status"] == "success"
+        batch_s = time.perf_counter() - t0
+
+    print(f"{frames} frames x 100 KB, RTT {rtt_ms:.0f} ms")
+    print(f"single   {single_s:6.2f} s  {frames / single_s:7.1f} frames/s")
+    print(f"batch={batch_size:<3}{batch_s:6.2f} s  {frames / batch_s:7.1f} frames/s")
+
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:]]
+    main(int(args[0]) if args else 200, args[1] if len(args) > 1 else 30.0, int(args[2]) if len(args) > 2 else 20)
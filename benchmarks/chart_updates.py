@@ -0,0 +1,100 @@
+# benchmarks/chart_updates.py
+"""
+Timesheet chart update cost: hundreds of segments refreshed repeatedly.
+
+Compares the incremental TimesheetChartQt.refresh() with the previous
+approach (new QChart, series, bar sets and axes on every update), each
+tick growing the last segment and now and then starting a new one, the
+way a live timeline changes. Includes the repaint.
+
+Run (headless):
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.chart_updates
+"""
+import statistics
+import sys
+import time
+
+from PySide6.QtCharts import QBarSet, QChart, QHorizontalStackedBarSeries, QValueAxis
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+COLORS = ["#81c784", "#64b5f6", "#f48fb1", "#f9d976", "#9c27b0"]
+
+
+def make_timeline(n: int):
+    return [(f"Task {i % 40}", 0.05 + (i % 7) * 0.01, COLORS[i % len(COLORS)]) for i in range(n)]
+
+
+def tick(timeline, step: int):
+    """Grow the running segment; every 5th tick a new segment starts."""
+    items = list(timeline)
+    label, hours, color = items[-1]
+    items[-1] = (label, round(hours + 0.01, 2), color)
+    if step % 5 == 0:
+        items.append((f"Task {step % 40}", 0.01, COLORS[step % len(COLORS)]))
+    return items
+
+
+def legacy_rebuild(view, items) -> None:
+    """The old refresh(): a brand-new chart, series, sets and axes every time."""
+    chart = QChart()
+    series = QHorizontalStackedBarSeries()
+    for task, duration, color in items:
+        bar = QBarSet(task)
+        bar.append(float(duration))
+        bar.setColor(QColor(color))
+        bar.setLabelColor(Qt.white)
+        series.append(bar)
+    chart.addSeries(series)
+    chart.setAnimationOptions(QChart.SeriesAnimations)
+    axis_x = QValueAxis()
+    axis_x.setRange(0, sum(d for _, d, _ in items) or 1.0)
+    chart.addAxis(axis_x, Qt.AlignBottom)
+    series.attachAxis(axis_x)
+    axis_y = QValueAxis()
+    axis_y.setVisible(False)
+    chart.addAxis(axis_y, Qt.AlignLeft)
+    series.attachAxis(axis_y)
+    view.setChart(chart)
+
+
+def _run(app, update, timeline, ticks: int):
+    times = []
+    for step in range(1, ticks + 1):
+        timeline = tick(timeline, step)
+        t0 = time.perf_counter()
+        update(timeline)
+        app.processEvents()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    times.sort()
+    return statistics.median(times), times[int(len(times) * 0.95) - 1]
+
+
+def main(sizes=(100, 300, 600), ticks: int = 30) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    from app.ui.chart_widget import TimesheetChartQt
+
+    for n in sizes:
+        timeline = make_timeline(n)
+
+        legacy = TimesheetChartQt()
+        legacy.resize(900, 250)
+        legacy.show()
+        legacy_med, legacy_p95 = _run(app, lambda items: legacy_rebuild(legacy._chart_view, items), timeline, ticks)
+        legacy.close()
+
+        chart = TimesheetChartQt()
+        chart.resize(900, 250)
+        chart.show()
+        chart.set_timeline(timeline)
+        app.processEvents()
+        inc_med, inc_p95 = _run(app, chart.set_timeline, timeline, ticks)
+        chart.close()
+
+        print(f"{n:>4} segments: rebuild median {legacy_med:7.1f} ms (p95 {legacy_p95:7.1f})   "
+              f"incremental median {inc_med:6.1f} ms (p95 {inc_p95:6.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# benchmarks/dedup_4k.py
+"""
+CPU cost per frame of the screenshot dedup stage on synthetic 4K captures.
+
+Run:
+    python -m benchmarks.dedup_4k [N]
+"""
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from app.capture.dedup import FrameDeduper, frame_fingerprint
+
+W, H = 3840, 2160
+
+
+def _synthetic_desktop(rng: np.random.Generator) -> np.ndarray:
+    """Flat background, a few 'windows' and some noisy text-like regions."""
+    img = np.full((H, W, 3), 40, dtype=np.uint8)
+    for _ in range(6):
+        x, y = rng.integers(0, W - 800), rng.integers(0, H - 600)
+        img[y:y + 600, x:x + 800] = rng.integers(0, 255, size=3, dtype=np.uint8)
+        img[y + 40:y + 560:4, x + 20:x + 780] = rng.integers(0, 255, size=(130, 760, 3), dtype=np.uint8)
+    return img
+
+
+def main(n: int = 50) -> None:
+    rng = np.random.default_rng(0)
+    base = _synthetic_desktop(rng)
+    changed = base.copy()
+    changed[900:1300, 1500:2300] = 255  # a window moved / repainted
+
+    frames = [base.tobytes(), base.tobytes(), changed.tobytes()]
+    dedup = FrameDeduper()
+
+    fp_ms, check_ms = [], []
+    for i in range(n):
+        rgb = frames[i % len(frames)]
+        t0 = time.perf_counter()
+        frame_fingerprint((W, H), rgb)
+        fp_ms.append((time.perf_counter() - t0) * 1000.0)
+
+        t0 = time.perf_counter()
+        dedup.check(f"t{i}", (W, H), rgb)
+        check_ms.append((time.perf_counter() - t0) * 1000.0)
+
+    print(f"4K fingerprint   mean={statistics.mean(fp_ms):6.2f} ms  p50={statistics.median(fp_ms):6.2f} ms")
+    print(f"4K dedup.check   mean={statistics.mean(check_ms):6.2f} ms  p50={statistics.median(check_ms):6.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,56 @@
+# benchmarks/encoders.py
+"""
+Encode time and payload size per encoder backend over synthetic desktop frames.
+
+Run:
+    python -m benchmarks.encoders [WIDTH HEIGHT]
+"""
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from app.capture.encoders import available_encoders, make_encoder
+
+
+def synthetic_desktop(w: int, h: int, seed: int = 0) -> bytes:
+    """Flat wallpaper gradient, a few windows with text-like noise and a taskbar."""
+    rng = np.random.default_rng(seed)
+    y = np.linspace(0, 1, h, dtype=np.float32)[:, None]
+    img = np.empty((h, w, 3), dtype=np.uint8)
+    img[..., 0] = (30 + 40 * y).astype(np.uint8)
+    img[..., 1] = (40 + 30 * y).astype(np.uint8)
+    img[..., 2] = (70 + 60 * y).astype(np.uint8)
+    for _ in range(5):
+        ww, wh = int(w * rng.uniform(0.2, 0.5)), int(h * rng.uniform(0.2, 0.5))
+        x0, y0 = int(rng.integers(0, w - ww)), int(rng.integers(0, h - wh))
+        img[y0:y0 + wh, x0:x0 + ww] = 245
+        rows = np.arange(y0 + 30, y0 + wh - 10, 18)
+        for r in rows:
+            line = rng.random((10, ww - 40)) < 0.35
+            img[r:r + 10, x0 + 20:x0 + ww - 20][line] = 20
+    img[h - 48:] = 25
+    return img.tobytes()
+
+
+def main(w: int = 2560, h: int = 1440, runs: int = 5) -> None:
+    frames = [("ts", (w, h), synthetic_desktop(w, h, seed)) for seed in range(runs)]
+    print(f"{w}x{h}, {runs} frames")
+    print(f"{'backend':<15}{'mean ms':>10}{'mean KB':>10}")
+    for name in available_encoders():
+        enc = make_encoder(name)
+        ms, sizes = [], []
+        for frame in frames:
+            t0 = time.perf_counter()
+            _, payload, _ = enc(frame)
+            ms.append((time.perf_counter() - t0) * 1000.0)
+            sizes.append(len(payload) / 1024.0)
+        print(f"{name:<15}{statistics.mean(ms):>10.1f}{statistics.mean(sizes):>10.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        main(int(sys.argv[1]), int(sys.argv[2]))
+    else:
+        main()
@@ -0,0 +1,140 @@
+# benchmarks/http_faults.py
+"""
+Resilience of the HTTP helpers against a fault-injecting local backend.
+
+Scenarios (each against a fresh stub server):
+  flaky       20% of requests fail (connection reset / 502 / 503 with Retry-After)
+  uploads     flaky uploads, some stored but the response lost: the idempotency
+              key lets the backend recognise the re-send, so each frame is stored once
+  outage      backend down: the circuit opens and calls fail fast, then recover
+  no-retry    same flaky backend with retries disabled (the old behaviour)
+
+Run:
+    python -m benchmarks.http_faults [N]
+"""
+import random
+import statistics
+import sys
+import threading
+import time
+
+import requests
+
+from benchmarks._stub_server import StubServer, json_response
+from app.api import _http
+from app.api.screenshot_client import upload_screenshot
+
+
+class Faults:
+    """Decides per request whether (and how) to fail; counts what the server saw."""
+
+    def __init__(self, rate: float, seed: int = 1):
+        self.rate = rate
+        self.down = False
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.stored = {}          # idempotency key -> times stored
+
+    def inject(self):
+        with self.lock:
+            self.requests += 1
+            if self.down:
+                return json_response({"detail": "down"}, 503)
+            roll = self.rng.random()
+        if roll < self.rate / 3:
+            return None                                               # connection reset
+        if roll < 2 * self.rate / 3:
+            return json_response({"detail": "bad gateway"}, 502)
+        if roll < self.rate:
+            return json_response({"detail": "busy"}, 503, {"Retry-After": "0"})
+        return False
+
+    def tasks(self, method, path, headers, body):
+        fault = self.inject()
+        return fault if fault is not False else json_response({"tasks": [], "count": 0})
+
+    def upload(self, method, path, headers, body):
+        fault = self.inject()
+        if fault is not False:
+            return fault
+        key = headers.get("Idempotency-Key")
+        with self.lock:
+            first = key not in self.stored
+            self.stored[key] = self.stored.get(key, 0) + 1
+            lost = self.rng.random() < self.rate / 2
+        if lost:
+            return None  # stored, but the response never reaches the client
+        # a real backend returns the stored record for a repeated key
+        return json_response({"image_url": f"/img/{key}", "deduplicated": not first}, 201)
+
+
+def _fresh_state(policy: _http.RetryPolicy) -> None:
+    _http._budgets.clear()
+    _http._breakers.clear()
+    _http.set_retry_policy("", policy)
+    _http.set_retry_policy("/screenshots/", policy)
+
+
+def _calls(n: int):
+    ok, times = 0, []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        try:
+            ok += _http.api_get("/task/my-tasks").status_code == 200
+        except requests.RequestException:
+            pass
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return ok, times
+
+
+def _report(label: str, ok: int, n: int, times, server_requests: int) -> None:
+    times = sorted(times)
+    print(f"{label:<10} success {ok:>4}/{n:<4} server saw {server_requests:>5} requests   "
+          f"p50 {statistics.median(times):6.1f} ms  p95 {times[int(len(times) * 0.95) - 1]:6.1f} ms")
+
+
+def main(n: int = 200) -> None:
+    retrying = _http.RetryPolicy(base_delay=0.01, max_delay=0.1)
+
+    for label, policy in (("no-retry", _http.RetryPolicy(attempts=1)), ("flaky", retrying)):
+        faults = Faults(rate=0.2)
+        with StubServer({("GET", "/task/my-tasks"): faults.tasks}) as srv:
+            _http.API_URL = srv.url
+            _fresh_state(policy)
+            ok, times = _calls(n)
+            _report(label, ok, n, times, faults.requests)
+
+    faults = Faults(rate=0.2, seed=2)
+    with StubServer({("POST", "/screenshots/upload"): faults.upload}) as srv:
+        _http.API_URL = srv.url
+        _fresh_state(retrying)
+        ok, stamps = 0, [f"2026-10-17T09:{i // 60:02d}:{i % 60:02d}+00:00" for i in range(n)]
+        for stamp in stamps:
+            for _attempt in range(3):  # what the spool drainer does with a failed frame
+                if upload_screenshot(b"\xff\xd8" + bytes(2048), stamp, monitor=1)["status"] == "success":
+                    ok += 1
+                    break
+        dupes = sum(1 for c in faults.stored.values() if c > 1)
+        print(f"uploads    delivered {ok}/{n} frames, {len(faults.stored)} distinct keys stored, "
+              f"{dupes} re-sends deduplicated by key, {faults.requests} requests")
+
+    faults = Faults(rate=0.0)
+    with StubServer({("GET", "/task/my-tasks"): faults.tasks}) as srv:
+        _http.API_URL = srv.url
+        _fresh_state(retrying)
+        breaker = _http.get_breaker()
+        breaker.reset_seconds = 0.5
+        faults.down = True
+        ok, times = _calls(50)
+        seen_down = faults.requests
+        print(f"outage     {ok}/50 ok, server saw {seen_down} requests (circuit {breaker.state}), "
+              f"fail-fast p50 {statistics.median(times):.2f} ms")
+        faults.down = False
+        time.sleep(0.6)
+        ok, _times = _calls(10)
+        print(f"recovery   {ok}/10 ok after reset timeout (circuit {breaker.state})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
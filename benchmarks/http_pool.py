@@ -0,0 +1,58 @@
+# benchmarks/http_pool.py
+"""
+Compare cold (new connection per call) vs pooled keep-alive request latency.
+
+Run:
+    python -m benchmarks.http_pool [N]
+"""
+import statistics
+import sys
+import time
+
+import requests
+
+from benchmarks._stub_server import StubServer, json_response
+from app.api import _http
+
+
+def _me(method, path, headers, body):
+    return json_response({"status": "success", "user": {"id": "u1", "email": "bench@example.com"}})
+
+
+def _time_calls(fn, n: int):
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return samples
+
+
+def _report(label: str, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<8} n={len(samples):<5} mean={statistics.mean(samples):7.3f} ms  "
+          f"p50={statistics.median(samples):7.3f} ms  p95={p95:7.3f} ms")
+
+
+def main(n: int = 500) -> None:
+    with StubServer({("GET", "/user/me"): _me}) as srv:
+        _http.API_URL = srv.url
+        url = f"{srv.url}/user/me"
+
+        # cold: a fresh connection (and handshake) for every request
+        cold = _time_calls(lambda: requests.get(url, headers={"Connection": "close"}, timeout=5), n)
+
+        # pooled: shared keep-alive adapter behind api_get
+        _http.configure_pool()
+        _http.api_get("/user/me")  # warm the pool
+        pooled = _time_calls(lambda: _http.api_get("/user/me", timeout=5), n)
+        _http.close_pool()
+
+    _report("cold", cold)
+    _report("pooled", pooled)
+    print(f"speedup  {statistics.mean(cold) / statistics.mean(pooled):.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,154 @@
+# benchmarks/startup.py
+"""
+Startup time: import cost, time to first frame, time until the real window is up.
+
+Each scenario runs in a fresh interpreter (offscreen Qt, throwaway settings and
+data dirs) against the local stub backend, whose /user/me answers after
+PROFILE_DELAY seconds:
+
+  login      no stored token -> splash, then the login window
+  dashboard  stored token    -> splash; profile check runs while the dashboard is built
+  eager      the previous startup: import everything, fetch the profile on the
+             GUI thread, then build and show the dashboard (nothing on screen until then)
+
+Times are from process start (interpreter startup included).
+
+Run:
+    python -m benchmarks.startup [runs]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks._stub_server import StubServer, json_response
+
+PROFILE_DELAY = 0.3
+SCENARIOS = ("login", "dashboard", "eager")
+
+
+# -------------------------
+# Child process
+# -------------------------
+def _child(scenario: str) -> None:
+    t0 = float(os.environ["STARTUP_T0"])
+    marks = {}
+
+    def mark(name: str) -> None:
+        marks.setdefault(name, round((time.time() - t0) * 1000.0, 1))
+
+    mark("interpreter")
+    t = time.perf_counter()
+    if scenario == "eager":
+        import app.main  # noqa: F401  (dotenv, sys.path)
+        from app.ui.login_window import LoginWindow  # noqa: F401
+        from app.ui.dashboard_window import DashboardWindow
+        from app.ui.chart_widget import TimesheetChartQt  # noqa: F401
+        from app.capture.pipeline import CapturePipeline  # noqa: F401
+        from app.capture.dedup import FrameDeduper  # noqa: F401
+        from app.api.auth_client import fetch_user_profile
+    else:
+        import app.main
+    marks["import_ms"] = round((time.perf_counter() - t) * 1000.0, 1)
+
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    class PaintWatch(QObject):
+        """Marks the first painted window, and the first paint of the target window."""
+
+        def __init__(self, target: str):
+            super().__init__()
+            self.target = target
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and obj.isWidgetType() and obj.isWindow():
+                mark("first_frame")
+                if type(obj).__name__ == self.target and "ready" not in marks:
+                    mark("ready")
+                    QTimer.singleShot(0, QApplication.instance().quit)
+            return False
+
+    target = "LoginWindow" if scenario == "login" else "DashboardWindow"
+    watch = PaintWatch(target)
+
+    if scenario == "eager":
+        app = QApplication(sys.argv)
+        app.installEventFilter(watch)
+        prof = fetch_user_profile()
+        assert prof.get("status") == "success", prof
+        window = DashboardWindow(lambda: None)
+        window.show()
+        window.start()
+        app.exec()
+    else:
+        init = app.main.AppController.__init__
+
+        def patched_init(self):
+            init(self)
+            self.app.installEventFilter(watch)
+
+        app.main.AppController.__init__ = patched_init
+        try:
+            app.main.AppController().run()
+        except SystemExit:
+            pass
+    print(json.dumps(marks))
+    sys.stdout.flush()
+    os._exit(0)  # skip teardown of half-started background work
+
+
+def _seed_token(env) -> None:
+    code = "from app.utils.state import AppState; AppState.set_tokens('bench-token', 'bench-refresh', 'bench@example.com')"
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+# -------------------------
+# Parent
+# -------------------------
+def _me(method, path, headers, body):
+    time.sleep(PROFILE_DELAY)
+    return json_response({"status": "success", "user": {"id": "u1", "email": "bench@example.com"}})
+
+
+def _tasks(method, path, headers, body):
+    return json_response({"tasks": [], "count": 0})
+
+
+def _run(scenario: str, base_env) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(base_env, XDG_CONFIG_HOME=os.path.join(tmp, "config"), PYTRACK_DATA_DIR=os.path.join(tmp, "data"))
+        if scenario != "login":
+            _seed_token(env)
+        env["STARTUP_T0"] = repr(time.time())
+        out = subprocess.run([sys.executable, "-m", "benchmarks.startup", "--child", scenario],
+                             env=env, capture_output=True, text=True, timeout=120)
+        lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+        if not lines:
+            raise RuntimeError(f"{scenario} run failed:\n{out.stdout}\n{out.stderr}")
+        return json.loads(lines[-1])
+
+
+def main(runs: int = 5) -> None:
+    with StubServer({("GET", "/user/me"): _me, ("GET", "/task/my-tasks"): _tasks}) as srv:
+        base_env = dict(os.environ, QT_QPA_PLATFORM="offscreen", API_URL=srv.url)
+        base_env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.getcwd(), base_env.get("PYTHONPATH")]))
+        print(f"profile latency {PROFILE_DELAY * 1000:.0f} ms, median of {runs} runs (ms from process start)")
+        print(f"{'scenario':<11}{'import':>9}{'first frame':>13}{'window ready':>14}")
+        for scenario in SCENARIOS:
+            samples = [_run(scenario, base_env) for _ in range(runs)]
+
+            def med(key):
+                return statistics.median(s[key] for s in samples)
+
+            print(f"{scenario:<11}{med('import_ms'):>9.0f}{med('first_frame'):>13.0f}{med('ready'):>14.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        _child(sys.argv[2])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
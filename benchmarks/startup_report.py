@@ -0,0 +1,87 @@
+# benchmarks/startup_report.py
+"""
+Compare two startup profiling reports (see app/utils/startup_profile.py),
+e.g. from the previous build and this one:
+
+    QT_QPA_PLATFORM=offscreen python -m app.main --profile-startup new.json --profile-exit
+    python -m benchmarks.startup_report old.json new.json [--fail-over 20]
+
+Prints milestones, phases and the modules whose import time changed most.
+With --fail-over PCT the exit status is 1 when window_ready regressed by more
+than PCT percent (for CI).
+"""
+import json
+import sys
+from collections import defaultdict
+
+TOP_IMPORTS = 15
+
+
+def _load(path: str):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _phases(report):
+    out = defaultdict(float)
+    for p in report.get("phases", []):
+        out[p["name"]] += p["duration_ms"]
+    return out
+
+
+def _imports(report):
+    # cumulative time per module (a module is executed once per process)
+    return {r["module"]: r["cumulative_us"] / 1000.0 for r in report.get("imports", [])}
+
+
+def _row(name: str, old, new) -> str:
+    if old is None or new is None:
+        return f"  {name:<34}{_fmt(old):>10}{_fmt(new):>10}"
+    delta = new - old
+    pct = f"{delta / old * 100:+.0f}%" if old else ""
+    return f"  {name:<34}{old:>10.1f}{new:>10.1f}{delta:>+10.1f}{pct:>8}"
+
+
+def _fmt(v) -> str:
+    return "-" if v is None else f"{v:.1f}"
+
+
+def main(argv) -> int:
+    fail_over = None
+    if "--fail-over" in argv:
+        i = argv.index("--fail-over")
+        fail_over = float(argv[i + 1])
+        argv = argv[:i] + argv[i + 2:]
+    old, new = _load(argv[0]), _load(argv[1])
+
+    print(f"{'':<36}{'old ms':>10}{'new ms':>10}{'delta':>10}")
+    print("milestones")
+    print(_row("process (before profiling)", old.get("process_ms"), new.get("process_ms")))
+    for key in ("first_paint", "event_loop", "profile_result", "window_ready"):
+        print(_row(key, old["marks"].get(key), new["marks"].get(key)))
+    print(_row("imports (total)", old.get("import_total_ms"), new.get("import_total_ms")))
+
+    print("phases")
+    po, pn = _phases(old), _phases(new)
+    for name in sorted(set(po) | set(pn), key=lambda n: -max(po.get(n, 0), pn.get(n, 0))):
+        print(_row(name, po.get(name), pn.get(name)))
+
+    print(f"imports (largest changes, top {TOP_IMPORTS})")
+    io_, in_ = _imports(old), _imports(new)
+    changes = sorted(set(io_) | set(in_), key=lambda m: -abs(in_.get(m, 0) - io_.get(m, 0)))
+    for module in changes[:TOP_IMPORTS]:
+        print(_row(module, io_.get(module), in_.get(module)))
+
+    if fail_over is not None:
+        before, after = old["marks"].get("window_ready"), new["marks"].get("window_ready")
+        if before and after and (after - before) / before * 100 > fail_over:
+            print(f"[❌] window_ready regressed {after - before:+.1f} ms (> {fail_over:.0f}%)")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(2)
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,61 @@
+# benchmarks/task_cache.py
+"""
+Time-to-first-paint of the task table from the on-disk task cache.
+
+Run (headless):
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.task_cache [N_TASKS]
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("PYTRACK_DATA_DIR", tempfile.mkdtemp(prefix="pytrack-bench-"))
+
+from PySide6.QtWidgets import QApplication
+
+
+def make_tasks(n: int):
+    return [
+        {
+            "id": f"task-{i}",
+            "task": f"Task number {i}",
+            "assigned_to": f"user{i % 50}@example.com",
+            "estimated_minutes": (i * 7) % 480,
+            "description": "Investigate and fix the reported issue in module %d" % (i % 97),
+            "task_highlight": "urgent" if i % 13 == 0 else "",
+            "time_recorded": "",
+            "completed_at": "",
+        }
+        for i in range(n)
+    ]
+
+
+def main(n: int = 10_000) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    from app.utils.task_cache import TaskCache
+
+    cache = TaskCache()
+    tasks = make_tasks(n)
+    t0 = time.perf_counter()
+    cache.save("bench@example.com", tasks, {"etag": '"v1"'})
+    save_ms = (time.perf_counter() - t0) * 1000.0
+
+    t0 = time.perf_counter()
+    snap = cache.load("bench@example.com")
+    load_ms = (time.perf_counter() - t0) * 1000.0
+
+    from app.ui.task_table import TaskTable
+    table = TaskTable()
+    t0 = time.perf_counter()
+    table._apply_tasks(snap["tasks"])
+    table.show()
+    app.processEvents()
+    paint_ms = (time.perf_counter() - t0) * 1000.0
+
+    print(f"{n} tasks: save {save_ms:.1f} ms, load {load_ms:.1f} ms, table render {paint_ms:.1f} ms, "
+          f"first paint {load_ms + paint_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,72 @@
+# benchmarks/task_search.py
+"""
+Task search index: build / incremental update cost and query latency on 50k tasks,
+plus the filtering proxy's remap cost for the same queries.
+
+Run (headless):
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.task_search
+"""
+import statistics
+import sys
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.task_cache import make_tasks
+
+QUERIES = [
+    "t", "task", "urgent", "invest fix", "module 42", "user7", "task 4999",
+    "invoice", "invoce", "recieve", "zzzz",
+]
+BUDGET_MS = 5.0
+
+
+def _ms(fn, repeat: int = 20):
+    times = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    times.sort()
+    return statistics.median(times), times[int(len(times) * 0.95) - 1], result
+
+
+def main(n: int = 50_000) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    from app.ui.task_model import TaskTableModel, TaskFilterProxy
+    from app.utils.task_index import TaskSearchIndex
+
+    tasks = make_tasks(n)
+    tasks[n // 2]["description"] = "Send the invoice and confirm we receive payment"
+
+    index = TaskSearchIndex()
+    t0 = time.perf_counter()
+    index.update(tasks)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    tasks[7] = dict(tasks[7], description="Reworded description for task seven")
+    t0 = time.perf_counter()
+    changed = index.update(tasks)
+    update_ms = (time.perf_counter() - t0) * 1000.0
+    print(f"{n} tasks: build {build_ms:.0f} ms, incremental update ({changed} changed) {update_ms:.1f} ms")
+
+    model = TaskTableModel()
+    proxy = TaskFilterProxy(index)
+    proxy.setSourceModel(model)
+    model.set_tasks(tasks)
+
+    worst = 0.0
+    print(f"{'query':<14}{'matches':>9}{'median ms':>11}{'p95 ms':>9}{'proxy ms':>10}")
+    for q in QUERIES:
+        med, p95, ids = _ms(lambda: index.search_ids(q))
+        proxy_med, _p, _r = _ms(lambda: proxy.set_match(ids), repeat=5)
+        worst = max(worst, p95)
+        print(f"{q!r:<14}{len(ids):>9}{med:>11.3f}{p95:>9.3f}{proxy_med:>10.2f}")
+    verdict = "OK" if worst < BUDGET_MS else "OVER BUDGET"
+    print(f"worst p95 query latency {worst:.2f} ms (budget {BUDGET_MS:.0f} ms): {verdict}")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
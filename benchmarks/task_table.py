@@ -0,0 +1,52 @@
+# benchmarks/task_table.py
+"""
+Task table refresh and scroll cost at 1k / 10k / 100k rows.
+
+Run (headless):
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.task_table
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("PYTRACK_DATA_DIR", tempfile.mkdtemp(prefix="pytrack-bench-"))
+
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.task_cache import make_tasks
+
+
+def main(sizes=(1_000, 10_000, 100_000)) -> None:
+    app = QApplication.instance() or QApplication(sys.argv)
+    from app.ui.task_table import TaskTable
+
+    table = TaskTable()  # doesn't fetch until load_tasks()
+    table.resize(1200, 600)
+    table.show()
+    app.processEvents()
+
+    for n in sizes:
+        tasks = make_tasks(n)
+
+        t0 = time.perf_counter()
+        table._apply_tasks(tasks)
+        app.processEvents()
+        refresh_ms = (time.perf_counter() - t0) * 1000.0
+
+        # scroll to the end page by page, as a user dragging the scrollbar would
+        view = table.table
+        bar = view.verticalScrollBar()
+        t0 = time.perf_counter()
+        steps = 0
+        while bar.value() < bar.maximum() or table.model.canFetchMore():
+            bar.setValue(bar.value() + bar.pageStep() * 20)
+            app.processEvents()
+            steps += 1
+        scroll_ms = (time.perf_counter() - t0) * 1000.0
+
+        print(f"{n:>7} rows: refresh {refresh_ms:8.1f} ms   scroll-to-end {scroll_ms:8.1f} ms ({steps} steps)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/time_tracking.py
+"""
+Time-tracking aggregation over months of history.
+
+Simulates ~6 months of working days (task switches every few minutes, idle
+gaps, lunch breaks) in a throwaway database, then times the queries the UI
+makes: today's merged timeline, one day's totals, and per-task totals over
+the whole range (served from the daily rollups), plus a periodic flush.
+
+Run:
+    python -m benchmarks.time_tracking
+"""
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.tracking.intervals import day_key
+from app.tracking.tracker import TimeTracker
+
+TASKS = [(f"task-{i}", f"Task {i}") for i in range(60)]
+
+
+def _ms(fn, repeat: int = 20):
+    times = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - t0) * 1000.0)
+    times.sort()
+    return statistics.median(times), times[int(len(times) * 0.95) - 1], result
+
+
+def simulate(tracker: TimeTracker, days: int, rng: random.Random) -> float:
+    """Record `days` working days ending today; returns the simulated 'now'."""
+    today = date.today()
+    now = 0.0
+    for offset in range(days - 1, -1, -1):
+        d = today - timedelta(days=offset)
+        if d.weekday() >= 5:
+            continue
+        now = datetime.combine(d, datetime.min.time()).timestamp() + 9 * 3600
+        end = now + 8 * 3600
+        while now < end:
+            key, title = rng.choice(TASKS)
+            tracker.start(key, title, now=now)
+            stint = now + rng.uniform(120, 1800)
+            while now < stint:
+                now += 30
+                # mostly active; now and then a quiet stretch long enough to go idle
+                tracker.observe_activity(rng.random() > 0.08, now=now)
+            if rng.random() < 0.05:
+                tracker.stop(now=now)
+                now += rng.uniform(600, 3600)  # untracked break
+        tracker.stop(now=now)  # end of the working day
+        tracker.flush(now=now)
+    return now
+
+
+def main(days: int = 180) -> None:
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = TimeTracker(path=Path(tmp) / "bench.sqlite3", idle_after=90)
+        t0 = time.perf_counter()
+        now = simulate(tracker, days, rng)
+        sim_s = time.perf_counter() - t0
+        rows = tracker._db.execute("SELECT COUNT(*), SUM(LENGTH(starts)) / 8 FROM day_intervals").fetchone()
+        print(f"simulated {rows[0]} working days, {rows[1]} intervals in {sim_s:.1f} s")
+
+        today = day_key(now)
+        first = (date.fromisoformat(today) - timedelta(days=days)).isoformat()
+
+        med, p95, items = _ms(lambda: tracker.timeline(now=now))
+        print(f"timeline(today)          {len(items):>5} segments   median {med:7.3f} ms  p95 {p95:7.3f} ms")
+        med, p95, totals = _ms(lambda: tracker.day_totals(now=now))
+        print(f"day_totals(today)        {len(totals):>5} tasks      median {med:7.3f} ms  p95 {p95:7.3f} ms")
+        med, p95, totals = _ms(lambda: tracker.totals_between(first, today, now=now))
+        hours = sum(totals.values()) / 3600.0
+        print(f"totals_between({days} d)   {len(totals):>5} tasks      median {med:7.3f} ms  p95 {p95:7.3f} ms"
+              f"  ({hours:.0f} h)")
+
+        tracker.start(*TASKS[0], now=now)
+        tracker.observe_activity(True, now=now + 30)
+        med, p95, _n = _ms(lambda: tracker.flush(now=now + 60))
+        print(f"flush (today dirty)                        median {med:7.3f} ms  p95 {p95:7.3f} ms")
+        tracker.close()
+
+
+if __name__ == "__main__":
+    main()
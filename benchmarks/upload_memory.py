@@ -0,0 +1,56 @@
+# benchmarks/upload_memory.py
+"""
+Peak Python heap per screenshot upload (tracemalloc): requests' built-in
+`files=` multipart encoding vs the streamed MultipartStream path.
+
+Run:
+    python -m benchmarks.upload_memory [PAYLOAD_MB]
+"""
+import os
+import sys
+import tracemalloc
+
+from benchmarks._stub_server import StubServer, json_response
+from app.api import _http
+from app.api.screenshot_client import upload_screenshot
+
+
+def _upload(method, path, headers, body):
+    return json_response({"image_url": "http://stub/image.jpg"}, 201)
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main(payload_mb: float = 2.0) -> None:
+    payload = os.urandom(int(payload_mb * 1024 * 1024))
+    with StubServer({("POST", "/screenshots/upload"): _upload}, discard_bodies=True) as srv:
+        _http.API_URL = srv.url
+        _http.api_get("/warmup")  # open the pooled connection outside the measurement
+
+        def legacy():
+            files = {"image": ("screenshot.jpg", payload, "image/jpeg")}
+            resp = _http.api_post("/screenshots/upload", data={"captured_at": "now"}, files=files)
+            assert resp.status_code == 201
+
+        def streamed():
+            res = upload_screenshot(payload, captured_at_iso="now")
+            assert res["status"] == "success", res
+
+        legacy_peak = _peak(legacy)
+        streamed_peak = _peak(streamed)
+
+    mb = 1024 * 1024
+    print(f"payload         {len(payload) / mb:6.2f} MB (already in memory, not counted)")
+    print(f"files= (legacy) {legacy_peak / mb:6.2f} MB peak extra")
+    print(f"streamed        {streamed_peak / mb:6.2f} MB peak extra")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0)
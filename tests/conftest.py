@@ -0,0 +1,56 @@
+# tests/conftest.py
+"""
+Shared test setup.
+
+Runs before any app module is imported: Qt goes offscreen, and QSettings
+(auth) plus the app data dir (spool, caches, tracking DB) point at a
+throwaway directory, so tests never touch a real login or real data.
+
+Run from the repo root:
+    python -m pytest -q
+"""
+import os
+import re
+import tempfile
+
+import pytest
+
+_TMP = tempfile.mkdtemp(prefix="pytrack-tests-")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["XDG_CONFIG_HOME"] = os.path.join(_TMP, "config")
+os.environ["PYTRACK_DATA_DIR"] = os.path.join(_TMP, "data")
+
+_PART_NAME_RE = re.compile(rb'name="([^"]+)"')
+
+
+def multipart_parts(headers, body):
+    """Decode a multipart/form-data body into {part name: raw bytes}."""
+    boundary = headers["Content-Type"].split("boundary=", 1)[1].encode("ascii")
+    parts = {}
+    for chunk in body.split(b"--" + boundary)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        head, _, value = chunk[2:].partition(b"\r\n\r\n")
+        parts[_PART_NAME_RE.search(head).group(1).decode("utf-8")] = value[:-2]  # trailing CRLF
+    return parts
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """
+    Local stub backend (benchmarks/_stub_server.py) with API_URL pointed at it.
+    Register handlers in `stub.routes[(method, path)]`; unknown paths answer 404.
+    Retry/breaker state starts fresh and retry waits are shortened.
+    """
+    from app.api import _http
+    from benchmarks._stub_server import StubServer
+
+    fast = _http.RetryPolicy(base_delay=0.001, max_delay=0.05)
+    monkeypatch.setattr(_http, "_policies", {"": fast, "/user/login": fast._replace(attempts=1)})
+    monkeypatch.setattr(_http, "_budgets", {})
+    monkeypatch.setattr(_http, "_breakers", {})
+    routes = {}
+    with StubServer(routes) as srv:
+        monkeypatch.setattr(_http, "API_URL", srv.url)
+        srv.routes = routes
+        yield srv
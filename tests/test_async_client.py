@@ -0,0 +1,99 @@
+# tests/test_async_client.py
+"""AsyncApi overlaps backend calls and delivers results on the Qt GUI thread."""
+import asyncio
+import threading
+import time
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from benchmarks._stub_server import json_response
+from app.api.async_client import AsyncApi
+from app.api.task_client import task_sync
+
+
+@pytest.fixture
+def api():
+    api = AsyncApi(max_concurrency=4)
+    yield api
+    api.shutdown()
+    task_sync().reset()
+
+
+def _together(barrier, payload):
+    """Route that only answers once the other route's request is in flight too."""
+    def handler(method, path, headers, body):
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            return json_response({"detail": "requests were not concurrent"}, 500)
+        return json_response(payload)
+    return handler
+
+
+def test_load_session_overlaps_profile_and_task_sync(stub, api):
+    barrier = threading.Barrier(2, timeout=5)
+    stub.routes[("GET", "/user/me")] = _together(barrier, {"email": "a@example.com"})
+    stub.routes[("GET", "/task/my-tasks")] = _together(barrier, {"tasks": [{"id": 1, "task": "t"}]})
+
+    res = api.run_sync(api.load_session(), timeout=10)
+    assert res["profile"] == {"status": "success", "profile": {"email": "a@example.com"}}
+    assert res["tasks"]["success"] and res["tasks"]["changed"]
+    # went through the shared TaskSync, so the store can adopt it
+    assert [t["id"] for t in task_sync().tasks()] == [1]
+
+
+def test_concurrency_is_capped(stub):
+    api = AsyncApi(max_concurrency=2)
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def slow(method, path, headers, body):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return json_response({"email": "a@example.com"})
+
+    stub.routes[("GET", "/user/me")] = slow
+    try:
+        async def many():
+            return await asyncio.gather(*(api.me() for _ in range(6)))
+
+        results = api.run_sync(many(), timeout=10)
+    finally:
+        api.shutdown()
+    assert all(r["status"] == "success" for r in results)
+    assert peak[0] == 2
+
+
+def test_callback_runs_on_the_gui_thread(stub, api):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    stub.routes[("GET", "/user/me")] = lambda m, p, h, b: json_response({"email": "a@example.com"})
+    got = []
+    api.submit(api.me(), lambda res, err: got.append((res, err, threading.current_thread())))
+
+    deadline = time.monotonic() + 5
+    while not got and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    res, err, thread = got[0]
+    assert err is None and res["status"] == "success"
+    assert thread is threading.main_thread()
+
+
+def test_errors_reach_the_callback(api):
+    app = QCoreApplication.instance() or QCoreApplication([])
+    got = []
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    api.submit(boom(), lambda res, err: got.append((res, err)))
+    deadline = time.monotonic() + 5
+    while not got and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert got[0][0] is None and str(got[0][1]) == "boom"
@@ -0,0 +1,172 @@
+# tests/test_batch_upload.py
+"""Batch screenshot upload and the spool drainer against the local stub backend."""
+import io
+import json
+import threading
+
+from benchmarks._stub_server import json_response
+from app.api.screenshot_client import DELTA_MIME, UNCHANGED_MARKER_MIME, upload_screenshots_batch
+from app.capture.spool import ScreenshotSpool, SpoolDrainer
+from tests.conftest import multipart_parts
+
+OWNER = "tester@example.com"
+
+
+class Recorder:
+    """Route handler factory that records every request it answers."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def route(self, respond):
+        def handler(method, path, headers, body):
+            with self.lock:
+                self.calls.append((path, headers, body))
+            return respond(headers, body)
+        return handler
+
+    def paths(self):
+        return [path for path, _, _ in self.calls]
+
+
+def _manifest(headers, body):
+    return json.loads(multipart_parts(headers, body)["items"])
+
+
+def test_partial_failure_resends_only_retryable_items(stub):
+    rec = Recorder()
+    rounds = []
+
+    def batch(headers, body):
+        manifest = _manifest(headers, body)
+        rounds.append([m["index"] for m in manifest])
+        results = []
+        for m in manifest:
+            if m["index"] == 1 and len(rounds) == 1:
+                results.append({"index": 1, "status": "error", "message": "storage busy"})
+            elif m["index"] == 2:
+                results.append({"index": 2, "status": "error", "message": "corrupt image", "retryable": False})
+            else:
+                results.append({"index": m["index"], "status": "success", "image_url": f"/img/{m['index']}"})
+        # index 3 is missing from the first answer
+        if len(rounds) == 1:
+            results = [r for r in results if r["index"] != 3]
+        return json_response({"results": results}, 207)
+
+    stub.routes[("POST", "/screenshots/upload-batch")] = rec.route(batch)
+    items = [{"image": bytes([i]) * 100, "captured_at": f"2024-01-01T00:00:0{i}Z"} for i in range(4)]
+
+    res = upload_screenshots_batch(items, retries=2, backoff=0.001)
+
+    assert res["status"] == "partial"
+    assert [r["status"] for r in res["results"]] == ["success", "success", "error", "success"]
+    assert rounds == [[0, 1, 2, 3], [1, 3]]
+    # idempotency keys are stable across the re-send
+    first, second = (_manifest(h, b) for _, h, b in rec.calls)
+    keys = {m["index"]: m["idempotency_key"] for m in first}
+    assert all(m["idempotency_key"] == keys[m["index"]] for m in second)
+
+
+def test_whole_request_rejection_reports_http_status(stub):
+    stub.routes[("POST", "/screenshots/upload-batch")] = lambda *a: json_response({"detail": "too large"}, 413)
+
+    res = upload_screenshots_batch([{"image": b"a"}, {"image": b"b"}], retries=2, backoff=0.001)
+
+    assert res["status"] == "error"
+    assert [r["http_status"] for r in res["results"]] == [413, 413]
+
+
+def test_missing_batch_endpoint_falls_back_with_full_payloads(stub):
+    received = []
+
+    def single(method, path, headers, body):
+        received.append(multipart_parts(headers, body)["image"])
+        return json_response({"image_url": "/img"}, 201)
+
+    stub.routes[("POST", "/screenshots/upload")] = single  # no upload-batch route: 404
+    payloads = [b"first-frame" * 50, b"second-frame" * 50]
+    streams = [io.BytesIO(b"junk" + p) for p in payloads]
+    for s in streams:
+        s.seek(4)  # streams may start mid-file; the fallback must rewind to here, not to 0
+
+    res = upload_screenshots_batch([{"image": s, "captured_at": "now"} for s in streams])
+
+    assert res["status"] == "success"
+    assert received == payloads
+
+
+def _spool(tmp_path):
+    return ScreenshotSpool(tmp_path / "spool.sqlite3")
+
+
+def test_drainer_batches_images_and_sends_markers_and_deltas_singly(stub, tmp_path):
+    rec = Recorder()
+
+    def batch(headers, body):
+        return json_response({"results": [{"index": m["index"], "status": "success"}
+                                          for m in _manifest(headers, body)]}, 207)
+
+    ok = rec.route(lambda h, b: json_response({"image_url": "/img"}, 201))
+    stub.routes[("POST", "/screenshots/upload-batch")] = rec.route(batch)
+    stub.routes[("POST", "/screenshots/upload")] = ok
+    stub.routes[("POST", "/screenshots/upload-delta")] = ok
+    stub.routes[("POST", "/screenshots/unchanged")] = ok
+
+    spool = _spool(tmp_path)
+    spool.put(b"img-1", "t1", owner=OWNER)
+    spool.put(b"img-2", "t2", owner=OWNER)
+    spool.put(b"t2", "t3", mime=UNCHANGED_MARKER_MIME, owner=OWNER)
+    spool.put(b"PTD1-delta", "t4", mime=DELTA_MIME, owner=OWNER)
+    spool.put(b"img-5", "t5", owner=OWNER)
+    spool.put(b"img-6", "t6", "image/webp", owner=OWNER)
+
+    failed = SpoolDrainer(spool)._drain_batch(spool.peek_batch(10, OWNER))
+
+    assert not failed
+    assert rec.paths() == [
+        "/screenshots/upload-batch",
+        "/screenshots/unchanged",
+        "/screenshots/upload-delta",
+        "/screenshots/upload-batch",
+    ]
+    batch_parts = [multipart_parts(h, b) for p, h, b in rec.calls if p.endswith("upload-batch")]
+    assert [sorted(k for k in parts if k != "items") for parts in batch_parts] == [["image_0", "image_1"], ["image_0", "image_1"]]
+    assert spool.count() == 0
+
+
+def test_drainer_keeps_frames_through_an_outage(stub, tmp_path):
+    stub.routes[("POST", "/screenshots/upload")] = lambda *a: json_response({"detail": "down"}, 503)
+    spool = _spool(tmp_path)
+    spool.put(b"img", "t1", owner=OWNER)
+    drainer = SpoolDrainer(spool)
+
+    for _ in range(15):
+        assert drainer._drain_batch(spool.peek_batch(10, OWNER))
+
+    attempts = spool._db.execute("SELECT attempts FROM frames").fetchall()
+    assert attempts == [(0,)]
+
+
+def test_drainer_counts_and_drops_rejected_frames(stub, tmp_path):
+    stub.routes[("POST", "/screenshots/upload")] = lambda *a: json_response({"detail": "bad frame"}, 422)
+    spool = _spool(tmp_path)
+    spool.put(b"img", "t1", owner=OWNER)
+    dropped = []
+    spool.add_drop_listener(lambda monitor, mime: dropped.append((monitor, mime)))
+    drainer = SpoolDrainer(spool)
+
+    for _ in range(10):
+        drainer._drain_batch(spool.peek_batch(10, OWNER))
+
+    assert spool.count() == 0
+    assert dropped == [(1, "image/jpeg")]
+
+
+def test_drainer_only_sends_the_current_users_frames(tmp_path):
+    spool = _spool(tmp_path)
+    spool.put(b"a", "t1", owner="alice@example.com")
+    spool.put(b"b", "t2", owner="bob@example.com")
+
+    assert [item[1] for item in spool.peek_batch(10, "bob@example.com")] == ["t2"]
+    assert [item[1] for item in spool.peek_batch(10, "alice@example.com")] == ["t1"]
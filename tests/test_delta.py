@@ -0,0 +1,105 @@
+# tests/test_delta.py
+"""Round-trip tests for app.capture.delta: encoder output reassembles to the original frames."""
+import numpy as np
+import pytest
+
+from app.capture.delta import DeltaEncoder, reassemble, unpack
+
+TILE = 16
+
+
+def _frame(w, h, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, size=(h, w, 3), dtype=np.uint8)
+
+
+def _encode(encoder, frames):
+    return [encoder.encode((f.shape[1], f.shape[0]), f.tobytes()) for f in frames]
+
+
+def _kinds(payloads):
+    return [unpack(p)[0]["kind"] for p in payloads]
+
+
+def _assert_round_trip(frames, payloads):
+    decoded = reassemble(payloads)
+    assert len(decoded) == len(frames)
+    for original, got in zip(frames, decoded):
+        assert got.shape == original.shape
+        assert np.array_equal(got, original)
+
+
+@pytest.mark.parametrize("size", [(37, 23), (TILE + 1, TILE - 1), (1, 1), (TILE * 3, TILE * 2)])
+def test_round_trip_with_tile_padding(size):
+    w, h = size
+    base = _frame(w, h)
+    frames = [base]
+    for i in range(1, 5):
+        nxt = frames[-1].copy()
+        # touch the bottom-right pixel: it lives in the padded edge tile
+        nxt[h - 1, w - 1] = (i * 40) % 256
+        frames.append(nxt)
+
+    payloads = _encode(DeltaEncoder(tile=TILE), frames)
+
+    assert _kinds(payloads)[0] == "key"
+    if w * h > 1:
+        assert "delta" in _kinds(payloads)
+    _assert_round_trip(frames, payloads)
+
+
+def test_unchanged_frame_is_an_empty_delta():
+    frame = _frame(50, 40)
+    payloads = _encode(DeltaEncoder(tile=TILE), [frame, frame.copy(), frame.copy()])
+
+    assert _kinds(payloads) == ["key", "delta", "delta"]
+    for p in payloads[1:]:
+        manifest, image = unpack(p)
+        assert manifest["tiles"] == []
+        assert image == b""
+    _assert_round_trip([frame] * 3, payloads)
+
+
+def test_keyframe_interval():
+    frames = []
+    cur = _frame(64, 64)
+    for i in range(7):
+        cur = cur.copy()
+        cur[i, i] = 255 - cur[i, i]
+        frames.append(cur)
+
+    payloads = _encode(DeltaEncoder(tile=TILE, keyframe_interval=3), frames)
+
+    assert _kinds(payloads) == ["key", "delta", "delta", "key", "delta", "delta", "key"]
+    _assert_round_trip(frames, payloads)
+
+
+def test_resolution_change_sends_a_keyframe():
+    small = _frame(40, 30, seed=1)
+    large = _frame(70, 45, seed=2)
+    large_edit = large.copy()
+    large_edit[10:12, 60:62] = 0
+    frames = [small, small.copy(), large, large_edit]
+
+    payloads = _encode(DeltaEncoder(tile=TILE), frames)
+
+    assert _kinds(payloads) == ["key", "delta", "key", "delta"]
+    manifest = unpack(payloads[2])[0]
+    assert (manifest["w"], manifest["h"]) == (70, 45)
+    _assert_round_trip(frames, payloads)
+
+
+def test_forced_keyframe_restarts_the_chain():
+    frames = [_frame(32, 32)]
+    for i in range(3):
+        nxt = frames[-1].copy()
+        nxt[0, i] = 7
+        frames.append(nxt)
+    encoder = DeltaEncoder(tile=TILE)
+
+    payloads = _encode(encoder, frames[:2])
+    encoder.force_keyframe()  # e.g. the previous delta was evicted from the spool
+    payloads += _encode(encoder, frames[2:])
+
+    assert _kinds(payloads) == ["key", "delta", "key", "delta"]
+    # the server can resume from the forced keyframe without the dropped delta
+    _assert_round_trip(frames[2:], payloads[2:])
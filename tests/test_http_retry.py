@@ -0,0 +1,159 @@
+# tests/test_http_retry.py
+"""Retry policy, Retry-After, retry budget and circuit breaker of app.api._http."""
+import time
+
+import pytest
+import requests
+
+from benchmarks._stub_server import json_response
+from app.api import _http
+from app.api._http import CircuitBreaker, CircuitOpenError, RetryPolicy, api_get, api_post
+
+
+class Faults:
+    """Route handler answering from a script of statuses (None = drop the connection), then 200."""
+
+    def __init__(self, *script, headers=None):
+        self.script = list(script)
+        self.headers = headers or {}
+        self.calls = []
+
+    def __call__(self, method, path, headers, body):
+        self.calls.append(headers)
+        status = self.script.pop(0) if self.script else 200
+        if status is None:
+            return None
+        return json_response({"status": status}, status, self.headers)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _policy(**kw):
+    return RetryPolicy(base_delay=0.001, max_delay=0.05)._replace(**kw)
+
+
+def test_get_is_retried_on_502_and_503(stub):
+    faults = stub.routes[("GET", "/ping")] = Faults(502, 503)
+    resp = api_get("/ping")
+    assert resp.status_code == 200
+    assert len(faults.calls) == 3
+
+
+def test_retries_stop_at_the_attempt_limit(stub):
+    faults = stub.routes[("GET", "/ping")] = Faults(503, 503, 503, 503)
+    assert api_get("/ping").status_code == 503
+    assert len(faults.calls) == 3
+
+
+def test_dropped_connection_is_retried_for_get(stub):
+    faults = stub.routes[("GET", "/ping")] = Faults(None)
+    assert api_get("/ping").status_code == 200
+    assert len(faults.calls) == 2
+
+
+def test_plain_post_is_not_replayed_after_502(stub):
+    faults = stub.routes[("POST", "/thing")] = Faults(502)
+    assert api_post("/thing", json={"a": 1}).status_code == 502
+    assert len(faults.calls) == 1
+
+
+def test_idempotent_post_is_replayed_with_its_key(stub):
+    faults = stub.routes[("POST", "/thing")] = Faults(502)
+    assert api_post("/thing", json={"a": 1}, idempotency_key="k-1").status_code == 200
+    assert [h.get("Idempotency-Key") for h in faults.calls] == ["k-1", "k-1"]
+
+
+def test_retry_after_is_waited_out(stub):
+    _http.set_retry_policy("/slow", _policy(max_delay=1.0))
+    faults = stub.routes[("GET", "/slow")] = Faults(429, headers={"Retry-After": "0.3"})
+    started = time.monotonic()
+    assert api_get("/slow").status_code == 200
+    assert time.monotonic() - started >= 0.3
+    assert len(faults.calls) == 2
+
+
+def test_retry_after_beyond_max_delay_is_not_retried(stub):
+    faults = stub.routes[("GET", "/ping")] = Faults(503, headers={"Retry-After": "120"})
+    resp = api_get("/ping")
+    assert resp.status_code == 503 and resp.headers["Retry-After"] == "120"
+    assert len(faults.calls) == 1
+
+
+def test_retry_budget_caps_retries_across_calls(stub):
+    _http.set_retry_policy("/ping", _policy(budget_ratio=0.0, budget_max=1.0))
+    faults = stub.routes[("GET", "/ping")] = Faults(503, 503, 503, 503)
+    assert api_get("/ping").status_code == 503   # 503, one retry (spends the budget), 503
+    assert api_get("/ping").status_code == 503   # no retry left
+    assert len(faults.calls) == 3
+
+
+def test_breaker_opens_then_probes_once_when_half_open():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=2, reset_seconds=10, clock=clock)
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+    assert breaker.retry_in() == pytest.approx(10)
+
+    clock.now += 10
+    assert breaker.state == "half-open"
+    assert breaker.allow()          # the probe
+    assert not breaker.allow()      # only one at a time
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_failed_probe_reopens_the_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_seconds=5, clock=clock)
+    breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and breaker.retry_in() == pytest.approx(5)
+
+
+def test_lost_probe_expires():
+    clock = FakeClock()
+    breaker = CircuitBreaker(threshold=1, reset_seconds=5, clock=clock)
+    breaker.record_failure()
+    clock.now += 5
+    assert breaker.allow()
+    clock.now += 5                  # the probe never reported back
+    assert breaker.allow()
+
+
+def test_api_get_fails_fast_while_the_breaker_is_open(stub):
+    _http.set_retry_policy("/ping", _policy(attempts=1))
+    clock = FakeClock()
+    _http._breakers[stub.url] = CircuitBreaker(threshold=2, reset_seconds=30, clock=clock)
+    faults = stub.routes[("GET", "/ping")] = Faults(500, 503)
+
+    assert api_get("/ping").status_code == 500
+    assert api_get("/ping").status_code == 503
+    with pytest.raises(CircuitOpenError):
+        api_get("/ping")
+    assert len(faults.calls) == 2   # nothing was sent while open
+    # callers that catch connection errors handle the open circuit too
+    assert issubclass(CircuitOpenError, requests.exceptions.ConnectionError)
+
+    clock.now += 30
+    assert api_get("/ping").status_code == 200      # half-open probe succeeds
+    assert _http.get_breaker().state == "closed"
+    assert len(faults.calls) == 3
+
+
+def test_4xx_does_not_count_towards_the_breaker(stub):
+    _http._breakers[stub.url] = CircuitBreaker(threshold=1, reset_seconds=30, clock=FakeClock())
+    stub.routes[("GET", "/missing")] = Faults(404)
+    assert api_get("/missing").status_code == 404
+    assert _http.get_breaker().state == "closed"
@@ -0,0 +1,103 @@
+# tests/test_task_pager.py
+"""Cursor-paginated task queries (TaskPager) against the local stub backend."""
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._stub_server import json_response
+from app.api.task_client import TaskPager, TaskQuery
+
+PATH = ("GET", "/task/my-tasks")
+TASKS = [{"id": i, "task": f"task {i}", "status": "open" if i % 2 else "done"} for i in range(10)]
+
+
+class PagingBackend:
+    """/task/my-tasks with opaque cursors ("c<offset>"); records each request's params."""
+
+    def __init__(self, tasks=TASKS):
+        self.tasks = tasks
+        self.requests = []
+
+    def __call__(self, method, path, headers, body):
+        params = {k: v[0] for k, v in parse_qs(urlsplit(path).query).items()}
+        self.requests.append(params)
+        start = int(params.get("cursor", "c0")[1:])
+        end = start + int(params["limit"])
+        return json_response({"tasks": self.tasks[start:end], "total": len(self.tasks),
+                              "next_cursor": f"c{end}" if end < len(self.tasks) else None})
+
+    def cursors(self):
+        return [r.get("cursor") for r in self.requests]
+
+
+def test_page_walks_forward_along_the_cursor_chain(stub):
+    backend = stub.routes[PATH] = PagingBackend()
+    pager = TaskPager()
+    query = TaskQuery(page_size=3)
+
+    page = pager.page(query, 2)
+    assert page["success"] and [t["id"] for t in page["data"]] == [6, 7, 8]
+    assert page["has_more"] and page["total"] == 10
+    assert backend.cursors() == [None, "c3", "c6"]
+    # the walk cached its intermediate pages
+    assert [t["id"] for t in pager.cached(query, 1)["data"]] == [3, 4, 5]
+
+    last = pager.page(query, 3)
+    assert [t["id"] for t in last["data"]] == [9] and not last["has_more"]
+    assert backend.cursors()[-1] == "c9"
+
+
+def test_page_past_the_end_is_empty(stub):
+    stub.routes[PATH] = PagingBackend()
+    res = TaskPager().page(TaskQuery(page_size=5), 4)
+    assert res["success"] and res["data"] == [] and not res["has_more"]
+
+
+def test_lru_eviction_refetches_with_the_stored_cursor(stub):
+    backend = stub.routes[PATH] = PagingBackend()
+    pager = TaskPager(max_pages=2)
+    query = TaskQuery(page_size=2)
+
+    pager.pages(query, 3)
+    assert pager.cached(query, 0) is None  # evicted
+    assert pager.cached(query, 1) is not None and pager.cached(query, 2) is not None
+
+    pager.page(query, 3)  # evicts page 1 (page 2 was touched more recently)
+    assert pager.cached(query, 1) is None
+
+    before = len(backend.requests)
+    page = pager.page(query, 1)
+    assert [t["id"] for t in page["data"]] == [2, 3]
+    # one request, straight from the remembered cursor, no walk from page 0
+    assert backend.cursors()[before:] == ["c2"]
+
+
+def test_queries_are_cached_separately(stub):
+    backend = stub.routes[PATH] = PagingBackend()
+    pager = TaskPager()
+    pager.page(TaskQuery(page_size=4), 0)
+    pager.page(TaskQuery(page_size=4, sort="task", descending=True), 0)
+    assert len(backend.requests) == 2
+    assert backend.requests[1]["sort"] == "task" and backend.requests[1]["order"] == "desc"
+
+
+def test_fetch_finishing_after_invalidate_is_not_cached(stub):
+    pager = TaskPager()
+    query = TaskQuery(page_size=3)
+    backend = PagingBackend()
+
+    def handler(method, path, headers, body):
+        pager.invalidate()  # logout / reload while the request is in flight
+        return backend(method, path, headers, body)
+
+    stub.routes[PATH] = handler
+    res = pager.page(query, 0)
+    assert res["stale"] and not res["success"]
+    assert pager.cached(query, 0) is None
+
+
+def test_backend_without_pagination_is_paged_locally(stub):
+    stub.routes[PATH] = lambda m, p, h, b: json_response({"tasks": TASKS, "count": len(TASKS)})
+    pager = TaskPager()
+    query = TaskQuery(page_size=2, status="open", sort="task", descending=True)
+    res = pager.pages(query, 2)
+    assert [t["id"] for t in res["data"]] == [9, 7, 5, 3]
+    assert res["has_more"] and res["total"] == 5
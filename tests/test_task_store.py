@@ -0,0 +1,67 @@
+# tests/test_task_store.py
+"""TaskStore never serves (or syncs from) tasks loaded for a different user."""
+import pytest
+
+from benchmarks._stub_server import json_response
+from app.api.task_client import task_sync
+from app.ui.task_store import TaskStore
+from app.utils.state import AppState
+from app.utils.task_cache import get_task_cache
+
+ALICE, BOB = "alice@example.com", "bob@example.com"
+
+
+@pytest.fixture
+def alice_cached():
+    get_task_cache().save(ALICE, [{"id": 1, "task": "Alice secret task"}],
+                          {"etag": "W/alice", "last_modified": None, "cursor": "c-alice"})
+    AppState.set_tokens("alice-token", "alice-refresh", ALICE)
+    yield
+    get_task_cache().clear(ALICE)
+    task_sync().reset()
+    AppState.clear_auth()
+    AppState.clear()
+
+
+def test_load_cached_ignores_another_users_tasks(alice_cached):
+    store = TaskStore()
+    assert store.load_cached()
+    assert [t["task"] for t in store.tasks()] == ["Alice secret task"]
+
+    # e.g. the prebuilt dashboard was discarded and Bob logged in
+    AppState.clear_auth()
+    AppState.set_tokens("bob-token", "bob-refresh", BOB)
+    assert not store.load_cached()  # Bob has no snapshot
+    assert store.tasks() is None
+    assert task_sync().tasks() == []
+    assert task_sync().export_state() == {"etag": None, "last_modified": None, "cursor": None}
+
+
+def test_first_sync_after_user_switch_is_unconditional(alice_cached, stub):
+    seen = []
+
+    def handler(method, path, headers, body):
+        seen.append((path, headers))
+        return json_response({"tasks": [{"id": 2, "task": "Bob task"}], "delta": True, "deleted": []})
+
+    stub.routes[("GET", "/task/my-tasks")] = handler
+    store = TaskStore()
+    store.load_cached()
+    AppState.clear_auth()
+    AppState.set_tokens("bob-token", "bob-refresh", BOB)
+    store.load_cached()
+
+    res = task_sync().sync()
+    path, headers = seen[0]
+    assert "If-None-Match" not in headers and "updated_since" not in path
+    # not merged into Alice's index even though the answer is flagged as a delta
+    assert [t["task"] for t in res["data"]] == ["Bob task"]
+
+
+def test_invalidate_forgets_the_owner(alice_cached):
+    store = TaskStore()
+    store.load_cached()
+    store.invalidate()
+    assert store.tasks() is None
+    assert task_sync().export_state()["etag"] is None
+    assert store.load_cached()  # Alice again: her snapshot is still on disk
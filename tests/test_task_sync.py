@@ -0,0 +1,89 @@
+# tests/test_task_sync.py
+"""Conditional/incremental task sync (TaskSync) against the local stub backend."""
+from benchmarks._stub_server import json_response
+from app.api.task_client import TaskSync
+
+PATH = ("GET", "/task/my-tasks")
+
+
+def _task(i, title=None):
+    return {"id": i, "task": title or f"task {i}"}
+
+
+def test_full_sync_then_304_sends_validators(stub):
+    seen = []
+
+    def handler(method, path, headers, body):
+        seen.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return json_response({"tasks": [_task(1), _task(2)]}, headers={"ETag": '"v1"', "Last-Modified": "Mon"})
+
+    stub.routes[PATH] = handler
+    sync = TaskSync()
+
+    first = sync.sync()
+    assert first["success"] and first["changed"] and not first["not_modified"]
+    assert first["count"] == 2
+    assert "If-None-Match" not in seen[0]
+
+    second = sync.sync()
+    assert seen[1]["If-None-Match"] == '"v1"'
+    assert seen[1]["If-Modified-Since"] == "Mon"
+    assert second["success"] and second["not_modified"] and not second["changed"]
+    assert sorted(t["id"] for t in second["data"]) == [1, 2]
+
+
+def test_delta_response_is_merged_into_the_index(stub):
+    paths = []
+
+    def handler(method, path, headers, body):
+        paths.append(path)
+        if "updated_since=c1" in path:
+            return json_response({"delta": True, "tasks": [_task(2, "renamed"), _task(4)],
+                                  "deleted": [1], "cursor": "c2"})
+        return json_response({"tasks": [_task(1), _task(2), _task(3)], "cursor": "c1"})
+
+    stub.routes[PATH] = handler
+    sync = TaskSync()
+    sync.sync()
+
+    res = sync.sync()
+    assert "updated_since=c1" in paths[1]
+    assert res["changed"]
+    assert {t["id"]: t["task"] for t in res["data"]} == {2: "renamed", 3: "task 3", 4: "task 4"}
+    assert sync.export_state()["cursor"] == "c2"
+
+
+def test_unchanged_full_list_reports_no_change(stub):
+    stub.routes[PATH] = lambda m, p, h, b: json_response({"tasks": [_task(1)]})
+    sync = TaskSync()
+    assert sync.sync()["changed"]
+    assert not sync.sync()["changed"]
+
+
+def test_response_arriving_after_reset_is_discarded(stub):
+    sync = TaskSync()
+
+    def handler(method, path, headers, body):
+        sync.reset()  # logout while the request is in flight
+        return json_response({"tasks": [_task(1)]}, headers={"ETag": '"old-user"'})
+
+    stub.routes[PATH] = handler
+    res = sync.sync()
+    assert res["stale"] and not res["success"]
+    assert sync.tasks() == []
+    assert sync.export_state()["etag"] is None
+
+
+def test_304_arriving_after_restore_is_discarded(stub):
+    sync = TaskSync()
+    sync.restore([_task(1)], {"etag": '"v1"'})
+
+    def handler(method, path, headers, body):
+        sync.restore([_task(9)], {"etag": '"other"'})  # another user's snapshot loaded meanwhile
+        return 304, {}, b""
+
+    stub.routes[PATH] = handler
+    assert sync.sync()["stale"]
+    assert [t["id"] for t in sync.tasks()] == [9]
@@ -0,0 +1,105 @@
+# tests/test_token_refresh.py
+"""401 handling: single-flight token refresh, request replay, and clearing dead sessions."""
+import threading
+import time
+
+import pytest
+
+from benchmarks._stub_server import json_response
+from app.api import token_manager
+from app.api._http import api_get
+from app.api.token_manager import TokenManager
+from app.utils.state import AppState
+
+EMAIL = "tester@example.com"
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    """Fresh TokenManager; stored auth is cleared again afterwards."""
+    monkeypatch.setattr(token_manager, "_manager", TokenManager())
+    yield
+    AppState.clear_auth()
+    AppState.clear()
+
+
+def _protected(valid_token):
+    """Route answering 200 only for `Bearer <valid_token>`, else 401; records the tokens it saw."""
+    seen = []
+    lock = threading.Lock()
+
+    def handler(method, path, headers, body):
+        token = headers.get("Authorization", "").removeprefix("Bearer ")
+        with lock:
+            seen.append(token)
+        if token == valid_token:
+            return json_response({"ok": True})
+        return json_response({"detail": "token expired"}, 401)
+
+    handler.seen = seen
+    return handler
+
+
+def test_concurrent_401s_share_one_refresh_and_replay(stub, auth):
+    AppState.set_tokens("old-token", "refresh-1", EMAIL)
+    refreshes = []
+
+    def refresh(method, path, headers, body):
+        refreshes.append(body)
+        time.sleep(0.2)  # keep the flight open while the other callers hit their 401
+        return json_response({"access_token": "new-token", "refresh_token": "refresh-2"})
+
+    ping = stub.routes[("GET", "/ping")] = _protected("new-token")
+    stub.routes[("POST", "/user/refresh")] = refresh
+
+    start = threading.Barrier(8)
+    statuses = []
+
+    def call():
+        start.wait()
+        statuses.append(api_get("/ping").status_code)
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert statuses == [200] * 8
+    assert len(refreshes) == 1 and b"refresh-1" in refreshes[0]
+    assert AppState.get_access_token() == "new-token"
+    assert AppState.get_refresh_token() == "refresh-2"
+    assert AppState.get_user_email() == EMAIL
+    # every request was replayed with the new token exactly once
+    assert ping.seen.count("new-token") == 8
+
+
+def test_401_without_refresh_token_clears_auth(stub, auth):
+    AppState.set_tokens("expired-token", None, EMAIL)
+    stub.routes[("GET", "/ping")] = _protected("valid-token")
+    assert api_get("/ping").status_code == 401
+    assert AppState.get_access_token() is None
+
+
+def test_missing_refresh_endpoint_clears_auth(stub, auth):
+    AppState.set_tokens("expired-token", "refresh-1", EMAIL)
+    stub.routes[("GET", "/ping")] = _protected("valid-token")  # no /user/refresh route: 404
+    assert api_get("/ping").status_code == 401
+    assert AppState.get_access_token() is None and AppState.get_refresh_token() is None
+
+
+def test_rejected_refresh_token_clears_auth(stub, auth):
+    AppState.set_tokens("expired-token", "refresh-1", EMAIL)
+    stub.routes[("GET", "/ping")] = _protected("valid-token")
+    stub.routes[("POST", "/user/refresh")] = lambda m, p, h, b: json_response({"detail": "revoked"}, 401)
+    assert api_get("/ping").status_code == 401
+    assert AppState.get_access_token() is None
+
+
+def test_refresh_outage_keeps_the_session(stub, auth):
+    AppState.set_tokens("expired-token", "refresh-1", EMAIL)
+    stub.routes[("GET", "/ping")] = _protected("valid-token")
+    stub.routes[("POST", "/user/refresh")] = lambda m, p, h, b: json_response({"detail": "down"}, 503)
+    assert api_get("/ping").status_code == 401
+    assert AppState.get_access_token() == "expired-token"
+    assert AppState.get_refresh_token() == "refresh-1"
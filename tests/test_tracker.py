@@ -0,0 +1,54 @@
+# tests/test_tracker.py
+"""TimeTracker storage is per user; old single-user databases are migrated."""
+import sqlite3
+from datetime import datetime
+
+from app.tracking.tracker import TimeTracker
+
+T0 = datetime(2026, 10, 14, 9, 0).timestamp()
+DAY = "2026-10-14"
+
+
+def test_days_are_kept_per_user(tmp_path):
+    tracker = TimeTracker(path=tmp_path / "t.sqlite3", user="a@example.com", clock=lambda: T0)
+    tracker.start("task-1", "Report", now=T0)
+    tracker.set_user("b@example.com", now=T0 + 600)  # stops and flushes a's time
+    assert tracker.current() is None
+    assert tracker.totals_between(DAY, DAY, now=T0 + 600) == {}
+
+    tracker.start("task-2", "Review", now=T0 + 600)
+    tracker.stop(now=T0 + 900)
+    tracker.flush(now=T0 + 900)
+    assert tracker.totals_between(DAY, DAY, now=T0 + 900) == {"task-2": 300.0}
+
+    tracker.set_user("a@example.com", now=T0 + 900)
+    assert tracker.day_totals(DAY, now=T0 + 900) == {"task-1": 600.0}
+    tracker.close()
+
+
+def test_logout_stops_an_anonymous_recording(tmp_path):
+    tracker = TimeTracker(path=tmp_path / "t.sqlite3", clock=lambda: T0)
+    tracker.start("task-1", now=T0)
+    tracker.set_user(None, now=T0 + 60)
+    assert tracker.current() is None
+    tracker.close()
+
+
+def test_single_user_database_is_migrated(tmp_path):
+    path = tmp_path / "old.sqlite3"
+    db = sqlite3.connect(str(path))
+    db.execute("CREATE TABLE day_intervals (day TEXT PRIMARY KEY, starts BLOB NOT NULL, ends BLOB NOT NULL, "
+               "slots BLOB NOT NULL, labels TEXT NOT NULL)")
+    db.execute("CREATE TABLE day_rollup (day TEXT NOT NULL, task_key TEXT NOT NULL, title TEXT NOT NULL, "
+               "seconds REAL NOT NULL, PRIMARY KEY (day, task_key))")
+    db.execute("INSERT INTO day_rollup VALUES (?, 'task-1', 'Report', 120.0)", (DAY,))
+    db.commit()
+    db.close()
+
+    # no stored login in the test environment: legacy rows belong to ""
+    later = T0 + 3 * 86400  # today is read from memory, so query a past day
+    tracker = TimeTracker(path=path, clock=lambda: later)
+    assert tracker.totals_between(DAY, DAY) == {"task-1": 120.0}
+    tracker.set_user("a@example.com")
+    assert tracker.totals_between(DAY, DAY) == {}
+    tracker.close()